@@ -0,0 +1,91 @@
+# benchmarks/bench_audio_latency.py
+"""
+Measure notification latency: time from the event to the first byte of
+audio written to a player.
+
+Usage:
+    uv run python benchmarks/bench_audio_latency.py [--events 200] [--player "aplay -q -t raw -f S16_LE -r 22050 -c 1"]
+
+"pipe" submits to an AudioWorker that writes the pre-rendered tone to one
+long-lived player. "spawn" starts a player process for each event, as
+pymodoro did before. "synthesize" renders the tone on every event before
+writing it to the long-lived player. The default player is ``cat`` into
+/dev/null, so the benchmark runs without an audio device.
+"""
+import argparse
+import shlex
+import statistics
+import subprocess
+import time
+
+from pymodoro import tones
+from pymodoro.audio import AudioWorker
+from pymodoro.tones import CHUNK_BYTES, TonePipe
+
+SOUNDS = ["default", "work_end", "break_end"]
+
+
+def bench_pipe(command, events):
+    pipe = TonePipe(command)
+    worker = AudioWorker(coalesce_window=0, tones=pipe)
+    worker.start()
+    worker.submit("default")  # Starts the player; not counted
+    latencies = []
+    for i in range(events + 1):
+        written = pipe.first_byte_at
+        started = time.monotonic()
+        worker.submit(SOUNDS[i % len(SOUNDS)])
+        while pipe.first_byte_at == written:
+            time.sleep(0)
+        if i:
+            latencies.append(pipe.first_byte_at - started)
+    worker.stop()
+    return latencies
+
+
+def bench_spawn(command, events):
+    latencies = []
+    for i in range(events):
+        started = time.monotonic()
+        process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL)
+        buffer = tones.get_tone(SOUNDS[i % len(SOUNDS)])
+        process.stdin.write(buffer[:CHUNK_BYTES])
+        process.stdin.flush()
+        latencies.append(time.monotonic() - started)
+        process.stdin.write(buffer[CHUNK_BYTES:])
+        process.stdin.close()
+        process.wait()
+    return latencies
+
+
+def bench_synthesize(command, events):
+    pipe = TonePipe(command)
+    pipe.play("default")
+    latencies = []
+    for i in range(events):
+        started = time.monotonic()
+        tones._buffers.clear()
+        pipe.play(SOUNDS[i % len(SOUNDS)])
+        latencies.append(pipe.first_byte_at - started)
+    pipe.close()
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--events", type=int, default=200)
+    parser.add_argument("--player", default="cat", help="Command reading raw PCM from stdin")
+    args = parser.parse_args()
+    command = shlex.split(args.player)
+    tones.render_all()
+
+    print(f"{'path':<11} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+    for label, bench in (("pipe", bench_pipe), ("spawn", bench_spawn), ("synthesize", bench_synthesize)):
+        latencies = sorted(bench(command, args.events))
+        p50 = statistics.median(latencies) * 1000
+        p95 = latencies[int(len(latencies) * 0.95) - 1] * 1000
+        print(f"{label:<11} {p50:>8.3f} {p95:>8.3f} {latencies[-1] * 1000:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# benchmarks/bench_big_timer.py
+"""
+Compare the per-frame cost of the MM:SS timer panel and the big-digit timer.
+
+Usage:
+    uv run python benchmarks/bench_big_timer.py [--frames 1500] [--scale 1]
+
+Each frame updates the retained timer panel for the next second and
+renders it to an off-screen console. "uncached" builds the big digits
+from the font table every frame, without the glyph rows or the fragment
+cache, to show what the caches save.
+"""
+import argparse
+import io
+import time
+
+from rich.console import Console
+from rich.panel import Panel
+from rich.text import Text
+
+from pymodoro.ui.components import TIMER_STYLE, TimerDisplay
+from pymodoro.ui.fragments import FragmentCache
+from pymodoro.ui.glyphs import FONTS
+from pymodoro.ui.theme import Dimensions
+
+
+def _uncached_digits(time_str, scale):
+    rows = []
+    for row in range(len(FONTS["block"]["0"])):
+        line = (" " * scale).join("".join(cell * scale for cell in FONTS["block"][char][row]) for char in time_str)
+        rows.extend([line] * scale)
+    return Text("\n".join(rows), style=TIMER_STYLE)
+
+
+def bench(frames, scale, font=None, uncached=False):
+    """Return (µs to update, µs to update and paint) per frame."""
+    display = TimerDisplay(Dimensions(glyph_scale=scale), FragmentCache(), font=font)
+    panel = display.build("red")
+    console = Console(file=io.StringIO(), width=100, height=40, force_terminal=True, color_system="truecolor")
+    for i in range(frames if not uncached else 0):
+        # Warm the caches, as in every session after the first
+        display.update(25 * 60 - i % (25 * 60) - 0.5)
+    results = []
+    for paint in (False, True):
+        started = time.perf_counter()
+        for i in range(frames):
+            time_left = 25 * 60 - i % (25 * 60) - 0.5
+            if uncached:
+                mins, secs = divmod(int(time_left), 60)
+                panel = Panel(_uncached_digits(f"{mins:02d}:{secs:02d}", scale), expand=False,
+                              padding=(0, 1), style="red")
+            else:
+                display.update(time_left)
+            if paint:
+                console.print(panel)
+                console.file.seek(0)
+                console.file.truncate()
+        results.append((time.perf_counter() - started) / frames * 1e6)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=1500)
+    parser.add_argument("--scale", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'timer':<14} {'update µs':>10} {'paint µs':>10}")
+    for label, font, uncached in (("panel", None, False), ("big", "block", False), ("big uncached", "block", True)):
+        update, paint = bench(args.frames, args.scale, font, uncached)
+        print(f"{label:<14} {update:>10.2f} {paint:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# benchmarks/bench_compact_sessions.py
+"""
+Compare a list of pydantic ``Session`` models with ``CompactSessions``
+for bulk history: bytes per session and load time.
+
+Usage:
+    uv run python benchmarks/bench_compact_sessions.py [--count 1000000]
+
+"Load" means turning stored rows into an in-memory history: validating
+dicts into pydantic models, versus reading the compact binary buffer.
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+
+from pymodoro.compact_log import CompactSessions
+from pymodoro.session_model import DayLog, Session
+
+PER_DAY = 10
+
+
+def _rows(count):
+    start = datetime(2000, 1, 1, 9)
+    for i in range(count):
+        day, slot = divmod(i, PER_DAY)
+        yield {
+            "start": (start + timedelta(days=day, minutes=30 * slot)).strftime("%Y-%m-%d %H:%M:%S"),
+            "duration_minutes": 25,
+            "notes": "review" if slot == 0 else None,
+        }
+
+
+def _measure(build):
+    """Time one build untraced, then measure the memory of a second one."""
+    gc.collect()
+    started = time.perf_counter()
+    build()
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, elapsed, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+    count = args.count
+    rows = list(_rows(count))
+
+    models, model_time, model_bytes = _measure(lambda: [Session(**row) for row in rows])
+
+    day_logs = [
+        DayLog.model_construct(log_date=date(2000, 1, 1) + timedelta(days=d), sessions=models[d * PER_DAY:(d + 1) * PER_DAY])
+        for d in range((count + PER_DAY - 1) // PER_DAY)
+    ]
+    compact = CompactSessions.from_day_logs(day_logs)
+    payload = compact.to_bytes()
+    del day_logs
+    loaded, compact_time, compact_bytes = _measure(lambda: CompactSessions.from_bytes(payload))
+    assert [s for log in loaded.to_day_logs()[:3] for s in log.sessions] == models[:3 * PER_DAY]
+    del models
+
+    print(f"sessions:           {count}")
+    print(f"pydantic list:      {model_bytes / count:8.1f} bytes/session, load {model_time:8.3f}s")
+    print(f"CompactSessions:    {compact_bytes / count:8.1f} bytes/session, load {compact_time:8.3f}s")
+    print(f"payload on disk:    {len(payload) / count:8.1f} bytes/session")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# benchmarks/bench_day_log_cache.py
+"""
+Measure cold (YAML parse + pydantic validation) and warm (pre-validated
+sidecar cache) latency of ``storage.load_or_initialize_day_log``.
+
+Usage:
+    uv run python benchmarks/bench_day_log_cache.py [--sizes 10 1000 50000]
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+
+def _time_load(storage, repeats, before=None):
+    best = float("inf")
+    for _ in range(repeats):
+        if before:
+            before()
+        start = time.perf_counter()
+        storage.load_or_initialize_day_log()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_size(count):
+    from pymodoro import storage
+    from pymodoro.session_model import DayLog, Session
+
+    base = datetime.combine(date.today(), datetime.min.time())
+    day_log = DayLog(log_date=date.today(), sessions=[
+        Session(start=base + timedelta(seconds=i), duration_minutes=25, notes=f"task {i}" if i % 3 == 0 else None)
+        for i in range(count)
+    ])
+    repeats = max(1, min(20, 20_000 // count))
+
+    with tempfile.TemporaryDirectory() as state_dir:
+        os.environ["XDG_STATE_HOME"] = state_dir
+        storage.save_day_log(day_log)
+        cache_file = storage._get_cache_file_path(storage.get_log_file_path())
+
+        cold = _time_load(storage, repeats, before=lambda: cache_file.unlink(missing_ok=True))
+        warm = _time_load(storage, repeats)
+
+        cached = storage.load_or_initialize_day_log()
+        cache_file.unlink()
+        assert cached == storage.load_or_initialize_day_log(), "cache is not lossless"
+
+    return cold, warm
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1_000, 50_000])
+    args = parser.parse_args()
+
+    print(f"{'sessions':>10} {'cold ms':>12} {'warm ms':>12} {'speedup':>9}")
+    for count in args.sizes:
+        cold, warm = bench_size(count)
+        print(f"{count:>10} {cold * 1000:>12.2f} {warm * 1000:>12.2f} {cold / warm:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+# benchmarks/bench_render.py
+"""
+Measure the per-frame cost of the main screen: rebuilding the whole render
+tree every second (the old path) versus updating the retained tree.
+
+Usage:
+    uv run python benchmarks/bench_render.py [--frames 1500]
+
+"rebuild" builds every component, layout table and text afresh each
+frame, as MainScreen did before the tree was retained; "retained"
+updates the timer and progress bar of the retained tree from the
+fragment cache. "build" is the time to produce the renderable; "paint"
+adds rendering it to an off-screen 100x40 terminal, as Rich Live does.
+Allocation figures are the tracemalloc high-water mark of a single
+frame's build. The fragment cache's hit/miss counts over two
+consecutive work sessions are printed last.
+"""
+import argparse
+import io
+import time
+import tracemalloc
+
+from rich.console import Console, Group
+from rich.panel import Panel
+from rich.text import Text
+
+from pymodoro.timer import SessionType
+from pymodoro.ui.components import TIMER_STYLE, ArtDisplay, Header
+from pymodoro.ui.layout import Alignment, LayoutGrid, Spacing
+from pymodoro.ui.screens import MainScreen
+from pymodoro.ui.theme import ThemeManager
+
+TOTAL = 25 * 60
+
+
+def _frames(count):
+    for i in range(count):
+        yield dict(session_type=SessionType.WORK, time_left=TOTAL - i % TOTAL - 0.5, total_time=TOTAL,
+                   pomodoros_completed=2, is_paused=False, is_muted=False)
+
+
+class RebuildScreen:
+    """The main screen as it was rendered before the tree was retained: all new, every frame."""
+
+    def __init__(self, theme_manager):
+        self.theme_manager = theme_manager
+        self.header = Header()
+        self.art_display = ArtDisplay()
+
+    def render(self, session_type, time_left, total_time, pomodoros_completed, is_paused, is_muted=False):
+        dimensions = self.theme_manager.dimensions
+        theme = self.theme_manager.get_theme(session_type, is_paused)
+        display_color = self.theme_manager.get_display_color(session_type, is_paused)
+
+        header = self.header.render(theme, pomodoros_completed, is_paused, display_color, is_muted)
+        mins, secs = divmod(int(time_left), 60)
+        timer = Panel(Text(f"{mins:02d}:{secs:02d}", justify="center", style=TIMER_STYLE),
+                      width=dimensions.timer_panel_width, style=display_color)
+        progress_color = "cyan" if session_type == SessionType.LONG_BREAK else display_color
+        progress_ratio = (total_time - max(0, time_left)) / total_time if total_time > 0 else 0
+        filled_width = int(progress_ratio * dimensions.progress_bar_width)
+        bar_text = "█" * filled_width + "░" * (dimensions.progress_bar_width - filled_width)
+        progress = Group(Text(bar_text, style=f"bold {progress_color}"),
+                         Text(bar_text, style=f"bold {progress_color}"))
+
+        table = LayoutGrid.create_main_layout(dimensions.table_min_width)
+        LayoutGrid.add_component(table, header)
+        LayoutGrid.add_spacer(table)
+        if dimensions.show_art:
+            LayoutGrid.add_component(table, Alignment.center_horizontal(self.art_display.render(theme.art)))
+        LayoutGrid.add_component(table, Alignment.center_horizontal(timer))
+        LayoutGrid.add_spacer(table)
+        LayoutGrid.add_component(table, Alignment.center_horizontal(progress))
+        LayoutGrid.add_spacer(table)
+        LayoutGrid.add_spacer(table)
+        LayoutGrid.add_component(table, Spacing.create_help_text())
+        return Alignment.center_vertical_and_horizontal(table)
+
+
+def _screen(rebuild, theme_manager=None):
+    theme_manager = theme_manager or ThemeManager()
+    return RebuildScreen(theme_manager) if rebuild else MainScreen(theme_manager)
+
+
+def bench(frames, rebuild, paint, theme_manager=None):
+    screen = _screen(rebuild, theme_manager)
+    console = Console(file=io.StringIO(), width=100, height=40, force_terminal=True, color_system="truecolor")
+    started = time.perf_counter()
+    for state in _frames(frames):
+        renderable = screen.render(**state)
+        if paint:
+            console.print(renderable)
+            console.file.seek(0)
+            console.file.truncate()
+    return (time.perf_counter() - started) / frames * 1e6
+
+
+def allocations(frames, rebuild):
+    screen = _screen(rebuild)
+    peaks = []
+    tracemalloc.start()
+    for state in _frames(frames):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        screen.render(**state)
+        peaks.append(tracemalloc.get_traced_memory()[1] - before)
+    tracemalloc.stop()
+    return sum(peaks) / len(peaks)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=1500)
+    args = parser.parse_args()
+
+    print(f"{'path':<10} {'build µs':>10} {'paint µs':>10} {'bytes/frame':>12}")
+    for label, rebuild in (("rebuild", True), ("retained", False)):
+        build = bench(args.frames, rebuild, paint=False)
+        paint = bench(args.frames, rebuild, paint=True)
+        allocated = allocations(args.frames, rebuild)
+        print(f"{label:<10} {build:>10.1f} {paint:>10.1f} {allocated:>12.0f}")
+
+    theme_manager = ThemeManager()
+    bench(2 * TOTAL, rebuild=False, paint=False, theme_manager=theme_manager)
+    info = theme_manager.fragments.info()
+    print(f"fragment cache: {info.hits} hits, {info.misses} misses, {info.currsize}/{info.maxsize} entries")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# benchmarks/bench_render_bandwidth.py
+"""
+Measure terminal output per minute for each display backend.
+
+Usage:
+    uv run python benchmarks/bench_render_bandwidth.py [--minutes 5] [--width 100] [--height 40]
+
+Simulates a running work session redrawn once per second (what the render
+scheduler emits) into an off-screen terminal and reports the bytes the
+first full frame costs and the bytes written per minute after it, for
+Rich Live (full-screen redraws) and the delta renderer (changed cells).
+"""
+import argparse
+import io
+
+from rich.console import Console
+from rich.live import Live
+
+from pymodoro.timer import SessionType
+from pymodoro.ui.delta import DeltaRenderer
+from pymodoro.ui.screens import ScreenManager
+
+TOTAL = 25 * 60
+
+
+def _frames(screens, seconds):
+    for second in range(seconds):
+        yield screens.get_screen(
+            "main", session_type=SessionType.WORK, time_left=TOTAL - second, total_time=TOTAL,
+            pomodoros_completed=2, is_paused=False, is_muted=False,
+        )
+
+
+def measure(backend, minutes, width, height):
+    """Return (bytes for the first frame, bytes per minute afterwards)."""
+    screens = ScreenManager()
+    output = io.StringIO()
+    console = Console(file=output, width=width, height=height, force_terminal=True, color_system="truecolor")
+    frames = _frames(screens, minutes * 60 + 1)
+    if backend == "delta":
+        display = DeltaRenderer(next(frames), console=console)
+    else:
+        display = Live(next(frames), console=console, screen=True, auto_refresh=False)
+    with display:
+        first = len(output.getvalue().encode())
+        for renderable in frames:
+            display.update(renderable, refresh=True)
+        total = len(output.getvalue().encode())
+    return first, (total - first) / minutes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--minutes", type=int, default=5)
+    parser.add_argument("--width", type=int, default=100)
+    parser.add_argument("--height", type=int, default=40)
+    args = parser.parse_args()
+
+    print(f"{'backend':<8} {'first frame':>12} {'bytes/min':>12} {'bytes/frame':>12}")
+    for backend in ("live", "delta"):
+        first, per_minute = measure(backend, args.minutes, args.width, args.height)
+        print(f"{backend:<8} {first:>12,} {per_minute:>12,.0f} {per_minute / 60:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# benchmarks/bench_replay.py
+"""
+Measure how long rebuilding a day from the timer event stream takes as history grows.
+
+Usage:
+    uv run python benchmarks/bench_replay.py [--years 1,3,10] [--repeat 50]
+
+Years of working days (8 pomodoros, with skips and pauses) are simulated
+into a throwaway state directory with their event files. For the last
+day of each span the script times `replay_day`, which starts from the
+snapshot at the head of that day's file, against replaying every event
+since the first day, which is what a day would cost if its state had to
+be derived from the start of history. Loading the same day's session
+journal (JSON lines through pydantic) is shown for reference.
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+
+from pymodoro.events import TimerReplay, get_events_file_path, iter_records, replay_day
+from pymodoro.simulate import simulate
+from pymodoro.storage import load_or_initialize_day_log
+
+START = date(2000, 1, 3)
+
+
+def per_call_ms(function, repeat):
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        times.append((time.perf_counter() - started) * 1000)
+    return statistics.median(times)
+
+
+def replay_from_start(last_day):
+    """Apply every record from the first simulated day up to and including ``last_day``."""
+    replayer = TimerReplay()
+    day = START
+    while day <= last_day:
+        for record in iter_records(get_events_file_path(day).read_bytes()):
+            replayer.apply(record)
+        day += timedelta(days=1)
+    return replayer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--years", default="1,3,10", help="comma-separated history lengths")
+    parser.add_argument("--repeat", type=int, default=50, help="timed replays of the snapshot path")
+    args = parser.parse_args()
+    spans = sorted(int(years) for years in args.years.split(","))
+
+    with tempfile.TemporaryDirectory() as state_dir:
+        os.environ["XDG_STATE_HOME"] = state_dir
+        days = spans[-1] * 365
+        started = time.perf_counter()
+        simulate(days, START, events=True, skip_rate=0.05, pause_rate=0.1)
+        print(f"simulated {days} days in {time.perf_counter() - started:.1f}s")
+
+        sizes = [get_events_file_path(START + timedelta(days=i)).stat().st_size for i in range(days)]
+        events = sum(len(replay_day(START + timedelta(days=i)).timeline) for i in range(0, days, 30))
+        print(f"event file: {statistics.mean(sizes):.0f} bytes/day, "
+              f"{events / len(range(0, days, 30)):.1f} events/day\n")
+
+        print(f"{'history':>8} {'replay day':>12} {'from start':>12} {'journal load':>13}")
+        for years in spans:
+            day = START + timedelta(days=years * 365 - 1)
+            snapshot = per_call_ms(lambda: replay_day(day), args.repeat)
+            full = per_call_ms(lambda: replay_from_start(day), max(1, args.repeat // 25))
+            journal = per_call_ms(lambda: load_or_initialize_day_log(day), args.repeat)
+            assert replay_day(day).day_log.session_count == load_or_initialize_day_log(day).session_count
+            print(f"{years:>6} y {snapshot:>9.3f} ms {full:>9.1f} ms {journal:>10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
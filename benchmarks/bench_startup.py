@@ -0,0 +1,92 @@
+# benchmarks/bench_startup.py
+"""
+Guard the startup cost of pymodoro's non-interactive commands.
+
+Usage:
+    uv run python benchmarks/bench_startup.py [--runs 5]
+
+Each command runs in a fresh interpreter under ``-X importtime`` against a
+throwaway XDG_STATE_HOME. The script reports the import time spent beyond
+a bare interpreter (best of N runs) and the heaviest top-level imports,
+and exits non-zero if a command blows its budget or imports a module it
+should not need. Budgets are multiples of the bare interpreter's own
+startup imports, measured in the same run, so they scale with the
+machine; each is at least twice the cost measured when it was set.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+# (arguments, import-time budget in bare interpreter startups, modules that must not be imported)
+COMMANDS = [
+    (["status"], 1, ["argparse", "pathlib", "typing", "rich", "pydantic", "yaml", "pymodoro.timer"]),
+    (["--version"], 4, ["rich", "pydantic", "yaml", "pymodoro.storage"]),
+    (["--help"], 4, ["rich", "pydantic", "yaml", "pymodoro.storage"]),
+    (["--reset_log"], 40, ["rich", "pymodoro.interface", "pymodoro.ui", "pymodoro.sound"]),
+    (["stats", "--by", "week"], 45, ["rich.live", "pymodoro.interface", "pymodoro.ui", "pymodoro.sound"]),
+]
+
+
+def import_profile(arguments, env):
+    """Run one command and return {top-level module: cumulative µs} and all module names."""
+    command = ["-m", "pymodoro", *arguments] if arguments is not None else ["-c", "pass"]
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *command],
+        env=env, capture_output=True, text=True,
+    )
+    top_level = {}
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules.add(name.strip())
+        if not name.startswith("  "):  # Nested imports are indented by depth
+            top_level[name.strip()] = int(cumulative)
+    return top_level, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    failures = []
+    with tempfile.TemporaryDirectory() as state_dir:
+        env = dict(os.environ, XDG_STATE_HOME=state_dir)
+        # Modules every interpreter imports at startup are not ours to budget,
+        # but their import time is the unit the budgets are given in
+        bare = [import_profile(None, env) for _ in range(args.runs)]
+        interpreter_modules = bare[0][1]
+        unit_ms = min(sum(top_level.values()) for top_level, _ in bare) / 1000
+        print(f"{'bare interpreter':<20} {unit_ms:7.1f} ms")
+        for arguments, budget, forbidden in COMMANDS:
+            budget_ms = budget * unit_ms
+            profiles = []
+            for _ in range(args.runs):
+                top_level, modules = import_profile(arguments, env)
+                for name in interpreter_modules:
+                    top_level.pop(name, None)
+                profiles.append((top_level, modules))
+            top_level, modules = min(profiles, key=lambda p: sum(p[0].values()))
+            total_ms = sum(top_level.values()) / 1000
+            command = " ".join(arguments)
+            heaviest = sorted(top_level.items(), key=lambda item: -item[1])[:4]
+            print(f"{command:<20} {total_ms:7.1f} ms (budget {budget_ms:.0f} ms)  "
+                  + ", ".join(f"{name} {us / 1000:.1f}" for name, us in heaviest))
+
+            if total_ms > budget_ms:
+                failures.append(f"{command}: {total_ms:.1f} ms exceeds {budget_ms:.0f} ms "
+                                f"({budget} x {unit_ms:.1f} ms bare startup)")
+            leaked = sorted(m for m in modules if any(m == f or m.startswith(f + ".") for f in forbidden))
+            if leaked:
+                failures.append(f"{command}: imports {', '.join(leaked[:5])}")
+
+    if failures:
+        sys.exit("\n".join(failures))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# benchmarks/bench_status.py
+"""
+Measure `pymodoro status` latency as seen by a shell prompt.
+
+Usage:
+    uv run python benchmarks/bench_status.py [--runs 50] [--reads 100000]
+
+A StatusFile is published from a PomodoroTimer in a throwaway runtime
+directory. The script reports the in-process cost of publishing a
+transition and of reading and formatting the record, then the wall time
+of whole `python -m pymodoro status` processes next to a bare interpreter
+(the floor) and `pymodoro --version`, which goes through argparse.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from pymodoro.status import StatusFile, format_status, read_status
+from pymodoro.timer import PomodoroTimer
+
+FORMAT = "{icon} {remaining} {state}"
+
+
+def per_call_us(function, calls):
+    started = time.perf_counter()
+    for _ in range(calls):
+        function()
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+def wall_ms(command, env, runs):
+    """Median and 95th percentile wall time of a command, in ms."""
+    subprocess.run(command, env=env, capture_output=True)  # Warm the page cache
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(command, env=env, capture_output=True)
+        times.append((time.perf_counter() - started) * 1000)
+    times.sort()
+    return statistics.median(times), times[int(len(times) * 0.95) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=50, help="processes per command")
+    parser.add_argument("--reads", type=int, default=100_000, help="in-process reads")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as runtime_dir:
+        env = dict(os.environ, XDG_RUNTIME_DIR=runtime_dir)
+        path = os.path.join(runtime_dir, "pymodoro", "status")
+        timer = PomodoroTimer()
+        status_file = StatusFile(path).open()
+        timer.add_listener(lambda event: status_file.publish(timer))
+        timer.start()
+
+        publish = per_call_us(lambda: status_file.publish(timer), args.reads)
+        read = per_call_us(lambda: format_status(read_status(path), FORMAT), args.reads)
+        print(f"publish (per transition)   {publish:8.2f} µs")
+        print(f"read + format              {read:8.2f} µs   -> {format_status(read_status(path), FORMAT)!r}")
+        print()
+
+        commands = [
+            ("python -c pass", [sys.executable, "-c", "pass"]),
+            ("pymodoro status", [sys.executable, "-m", "pymodoro", "status", "--format", FORMAT]),
+            ("pymodoro --version", [sys.executable, "-m", "pymodoro", "--version"]),
+        ]
+        print(f"{'process':<20} {'median':>9} {'p95':>9}")
+        for label, command in commands:
+            median, p95 = wall_ms(command, env, args.runs)
+            print(f"{label:<20} {median:7.2f} ms {p95:6.2f} ms")
+        status_file.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# benchmarks/bench_storage.py
+"""
+Compare the per-session cost of the old load-parse-rewrite save path with
+the append-only journal used by ``storage.add_session``.
+
+Usage:
+    uv run python benchmarks/bench_storage.py [--sizes 10 1000 100000]
+
+Each size pre-populates today's log with N sessions in a throwaway
+XDG_STATE_HOME, then times adding one more session.
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+
+def _sessions(count):
+    from pymodoro.session_model import Session
+
+    base = datetime.combine(date.today(), datetime.min.time())
+    return [Session(start=base + timedelta(seconds=i), duration_minutes=25) for i in range(count)]
+
+
+def _legacy_add_session(storage, session):
+    """The pre-journal save path: full YAML load, append, full YAML rewrite."""
+    day_log = storage.load_or_initialize_day_log()
+    day_log.sessions.append(session)
+    storage.save_day_log(day_log)
+
+
+def _time_per_call(func, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    return (time.perf_counter() - start) / repeats
+
+
+def bench_size(count):
+    from pymodoro import storage
+    from pymodoro.session_model import DayLog, Session
+
+    existing = _sessions(count)
+    extra = Session(start=datetime.now(), duration_minutes=25)
+    repeats = max(1, min(50, 10_000 // max(count, 1)))
+
+    with tempfile.TemporaryDirectory() as state_dir:
+        os.environ["XDG_STATE_HOME"] = state_dir
+        storage.save_day_log(DayLog(log_date=date.today(), sessions=existing))
+        legacy = _time_per_call(lambda: _legacy_add_session(storage, extra), repeats)
+
+    with tempfile.TemporaryDirectory() as state_dir:
+        os.environ["XDG_STATE_HOME"] = state_dir
+        storage.append_sessions(existing)
+        journal = _time_per_call(lambda: storage.append_sessions([extra]), 50)
+
+    return legacy, journal
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1_000, 100_000])
+    args = parser.parse_args()
+
+    print(f"{'sessions':>10} {'rewrite ms':>12} {'journal ms':>12} {'speedup':>9}")
+    for count in args.sizes:
+        legacy, journal = bench_size(count)
+        print(f"{count:>10} {legacy * 1000:>12.2f} {journal * 1000:>12.2f} {legacy / journal:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# benchmarks/bench_timer_drift.py
+"""
+Drive PomodoroTimer through 10^6 ticks on a virtual clock and compare the
+session boundaries it produces with the ideal schedule.
+
+Usage:
+    uv run python benchmarks/bench_timer_drift.py [--ticks 1000000]
+
+The virtual clock advances a little on every read, like a real clock
+between two calls. The old subtract-elapsed timer lost that gap every
+tick. A boundary is recorded at the clock time the loop sees tick()
+report it, so each can only be late by less than one loop iteration;
+the deadline-based timer must stay within that however long it runs.
+Exits non-zero if any boundary is early or later than that.
+"""
+import argparse
+import sys
+import time
+
+from pymodoro.clock import VirtualClock
+from pymodoro.timer import PomodoroTimer, SessionType
+
+TICK_STEP = 0.25        # Seconds between loop wakeups
+READ_GAP = 1 / 1024     # Seconds that pass between two clock reads
+# One loop iteration: the wakeup step plus the clock reads of both timers
+MAX_LATENESS = TICK_STEP + 4 * READ_GAP
+
+
+class GappyClock(VirtualClock):
+    """Virtual clock that also moves a fixed gap on every monotonic read."""
+
+    def monotonic(self):
+        self.elapsed += READ_GAP
+        return self.elapsed
+
+
+class LegacyTimer:
+    """The pre-deadline tick: subtract elapsed time from a float time_left."""
+
+    def __init__(self, clock, duration):
+        self.clock = clock
+        self.duration = duration
+        self.time_left = duration
+        self._last_tick_time = clock.monotonic()
+
+    def tick(self):
+        elapsed = self.clock.monotonic() - self._last_tick_time
+        self._last_tick_time = self.clock.monotonic()
+        self.time_left -= elapsed
+        if self.time_left <= 0:
+            self.time_left = self.duration
+            return True
+        return False
+
+
+def run(ticks):
+    clock = GappyClock()
+    # Equal session lengths keep the ideal schedule a simple multiple
+    timer = PomodoroTimer(work_mins=25, short_break_mins=25, long_break_mins=25, clock=clock)
+    timer.start()
+    legacy = LegacyTimer(clock, timer.settings[SessionType.WORK])
+    origin = timer.start_time
+
+    boundaries = []
+    legacy_boundaries = []
+    started = time.perf_counter()
+    for _ in range(ticks):
+        clock.advance(TICK_STEP)
+        if timer.tick():
+            boundaries.append(clock.elapsed)
+        if legacy.tick():
+            legacy_boundaries.append(clock.elapsed)
+    elapsed = time.perf_counter() - started
+
+    duration = 25 * 60
+    lateness = [b - (origin + (i + 1) * duration) for i, b in enumerate(boundaries)]
+    legacy_drift = legacy_boundaries[-1] - (origin + len(legacy_boundaries) * duration)
+    return len(boundaries), min(lateness), max(lateness), len(legacy_boundaries), legacy_drift, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    sessions, earliest, latest, legacy_sessions, legacy_drift, elapsed = run(args.ticks)
+    print(f"ticks:            {args.ticks}")
+    print(f"tick cost:        {elapsed / args.ticks * 1e6:.2f} µs (timer + legacy timer)")
+    print(f"deadline timer:   {sessions} sessions, boundaries seen {earliest:.6f}s to {latest:.6f}s late "
+          f"(limit {MAX_LATENESS:.6f}s)")
+    print(f"legacy timer:     {legacy_sessions} sessions, final boundary drift {legacy_drift:+.3f}s")
+    if earliest < 0 or latest >= MAX_LATENESS:
+        sys.exit("deadline timer drifted")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+# benchmarks/bench_timers.py
+"""
+Measure the cost of running 1, 10 and 100 named timers in one process.
+
+Usage:
+    uv run python benchmarks/bench_timers.py [--hours 1] [--counts 1,10,100]
+
+Each run simulates the given number of hours on a VirtualClock with the
+timers' work sessions staggered by a minute, alerts at 5 and 1 minutes,
+and the tabbed view redrawn whenever its visible state changes. "heap" is
+the TimerGroup loop the app runs: one wakeup per displayed second or due
+event, only due timers advanced. "poll" wakes just as often but checks
+every timer on every wakeup, as the single-timer loop would if run once
+per timer. CPU is process time per simulated hour, first with frames
+painted to an off-screen 100x40 terminal (as Rich Live does), then for
+the scheduling and change detection alone, where the two loops differ.
+Memory is the tracemalloc size of the timers, group and UI after the
+first frame; the last line is the peak RSS of one separate process
+showing one timer, for comparison.
+"""
+import argparse
+import io
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from rich.console import Console
+
+from pymodoro.__main__ import advance_timer
+from pymodoro.clock import VirtualClock
+from pymodoro.interface import RenderScheduler, TimerGroupUI
+from pymodoro.scheduler import LoopScheduler, TimerGroup
+from pymodoro.timer import PomodoroTimer
+
+ONE_PROCESS = """
+import io, resource
+from rich.console import Console
+from pymodoro.interface import PomodoroUI
+from pymodoro.timer import PomodoroTimer
+timer = PomodoroTimer()
+timer.start()
+Console(file=io.StringIO(), width=100, height=40, force_terminal=True).print(PomodoroUI(timer).get_renderable())
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+class _Screen:
+    """Stands in for Rich Live: paints each frame to an off-screen terminal."""
+
+    def __init__(self, paint=True):
+        self.paint = paint
+        self.console = Console(file=io.StringIO(), width=100, height=40, force_terminal=True,
+                               color_system="truecolor")
+
+    def update(self, renderable, refresh=False):
+        if not self.paint:
+            return
+        self.console.print(renderable)
+        self.console.file.seek(0)
+        self.console.file.truncate()
+
+
+class _Silent:
+    """Audio and persistence that do nothing, so only scheduling and drawing are timed."""
+
+    def play_warning(self, muted):
+        pass
+
+    play_work_end = play_break_end = play_warning
+
+    def submit_session(self, duration, start_time=None, timer_name=None):
+        pass
+
+
+def build(count, clock, paint=True):
+    timers = [
+        PomodoroTimer(work_mins=25 + i % 10, warning_mins="5,1", clock=clock, name=f"t{i}")
+        for i in range(count)
+    ]
+    group = TimerGroup(timers)
+    ui = TimerGroupUI(group)
+    screen = _Screen(paint)
+    render = RenderScheduler(screen, ui)
+    render.request_redraw()
+    for i, timer in enumerate(timers):
+        timer.start()
+        clock.advance(60 if i < 20 else 0.1)  # Stagger the deadlines
+    render.render()
+    return group, render
+
+
+def run(count, hours, poll=False, paint=False):
+    clock = VirtualClock()
+    group, render = build(count, clock, paint)
+    scheduler = LoopScheduler(group.current, group=group)
+    silent = _Silent()
+    wakeups = frames = 0
+    end = clock.monotonic() + hours * 3600
+    started = time.process_time()
+    while clock.monotonic() < end:
+        timeout = scheduler.next_timeout()
+        if poll:
+            # Without the heap, the earliest event is a scan over every timer
+            events = [t.next_event_in() for t in group]
+            timeout = min([timeout] + [e for e in events if e is not None])
+        clock.advance(timeout)
+        wakeups += 1
+        if poll:
+            for timer in group:
+                advance_timer(timer, silent, silent)
+        else:
+            for index in group.pop_due():
+                advance_timer(group.timers[index], silent, silent)
+                group.schedule(index)
+        frames += render.render()
+    cpu = (time.process_time() - started) / hours
+    return cpu, wakeups / hours, frames / hours
+
+
+def memory(count):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = build(count, VirtualClock())
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del objects
+    return size
+
+
+def process_rss_kb():
+    output = subprocess.run([sys.executable, "-c", ONE_PROCESS], capture_output=True, text=True, check=True)
+    return int(output.stdout.split()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--hours", type=float, default=1.0, help="simulated hours per run")
+    parser.add_argument("--counts", default="1,10,100", help="comma-separated timer counts")
+    args = parser.parse_args()
+
+    memory(1)  # Warm imports and caches so they are not charged to the first count
+    print(f"{'timers':>6} {'wakeups/h':>10} {'frames/h':>9} {'painted/h':>11} "
+          f"{'heap/h':>10} {'poll/h':>10} {'memory':>10}")
+    for count in (int(c) for c in args.counts.split(",")):
+        painted, wakeups, frames = run(count, args.hours, paint=True)
+        heap, _, _ = run(count, args.hours)
+        poll, _, _ = run(count, args.hours, poll=True)
+        print(f"{count:>6} {wakeups:>10.0f} {frames:>9.0f} {painted * 1000:>8.0f} ms "
+              f"{heap * 1000:>7.1f} ms {poll * 1000:>7.1f} ms {memory(count) / 1024:>7.1f} KB")
+    print(f"\none separate process: {process_rss_kb() / 1024:.1f} MB peak RSS")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,54 @@
 # src/pymodoro/__main__.py
-import time
-import argparse
-from rich.live import Live
+#
+# Keep module-level imports to the standard library: pymodoro is called from
+# shell prompts and status bars, so each command imports only what it uses
+# (rich, pydantic and yaml are loaded lazily inside the command functions).
+# `pymodoro status` runs on every shell prompt and is answered before even
+# argparse is imported.
+import sys
+from datetime import date, timedelta
 
-from .timer import PomodoroTimer, SessionType
-from .interface import PomodoroUI, console
-from .keyboard import TerminalKeyboard
-from .sound import play_work_end, play_break_end, play_warning
-from .storage import load_or_initialize_day_log, add_session, reset_today_log, open_log_in_editor
+def _console():
+    """Create a Rich console for one-shot command output."""
+    from rich.console import Console
+    return Console()
+
+def _print_done(message):
+    """Print a one-line confirmation without paying for importing rich."""
+    check = "\033[32m✓\033[0m" if sys.stdout.isatty() else "✓"
+    print(f"{check} {message}")
+
+def _alerts_arg(text):
+    """argparse type for --notify: a comma-separated list of alerts."""
+    import argparse
+    from .alerts import parse_alerts
+    try:
+        return parse_alerts(text)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc))
+
+def _timer_arg(text):
+    """argparse type for --timer: NAME or NAME=WORK[/SHORT[/LONG]] in minutes."""
+    import argparse
+    import re
+    name, _, durations = text.partition("=")
+    if not re.fullmatch(r"[A-Za-z0-9][A-Za-z0-9_.-]*", name):
+        raise argparse.ArgumentTypeError(f"{name!r} is not a valid timer name (letters, digits, _ . -)")
+    try:
+        minutes = [int(part) for part in durations.split("/")] if durations else []
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"durations for {name!r} must be WORK[/SHORT[/LONG]] minutes")
+    if len(minutes) > 3 or any(value < 1 for value in minutes):
+        raise argparse.ArgumentTypeError(f"durations for {name!r} must be WORK[/SHORT[/LONG]] minutes")
+    return (name, *minutes, *[None] * (3 - len(minutes)))
 
 def main():
+    if sys.argv[1:2] == ["status"]:
+        from .status import main as status_main
+        sys.exit(status_main(sys.argv[2:]))
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="🍅 Pymodoro - A beautiful command-line Pomodoro timer",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -34,17 +73,29 @@ EXAMPLES:
   pymodoro --work 50 --short 10      # Longer work sessions with longer short breaks
   pymodoro -n 2                      # Warning sound 2 minutes before session end
   pymodoro --notify 3                # Warning sound 3 minutes before session end
+  pymodoro -n 10,5,1,50%             # Warnings 10, 5 and 1 minutes before the end and halfway
   pymodoro -f 2                      # Long break after every 2 work sessions
   pymodoro --frequency 6             # Long break after every 6 work sessions
   pymodoro -w 30 -f 3                # 30-minute work sessions, long break every 3 sessions
   pymodoro --mute                    # Start with sounds muted
   pymodoro -m -w 45                  # 45-minute work sessions with sounds muted
+  pymodoro --render delta            # Send only changed cells (slow SSH links, tmux)
+  pymodoro --big                     # Large block digits for a wall display
+  pymodoro -t api -t web=50/10       # Two named timers in tabs, each with its own log
+  pymodoro -w 50 daemon --start      # Run the timer headless in the background
+  pymodoro --attach                  # Show the daemon's timer in this terminal
+  pymodoro ctl pause                 # Control the daemon from scripts or key bindings
+  pymodoro status --format "{icon} {remaining}"  # Remaining time for a shell prompt
+  pymodoro stats --by week           # Pomodoros per week over the last 30 days
+  pymodoro stats --since 2025-01-01 --by month
+  pymodoro stats --timer api         # Totals for the named timer "api"
+  pymodoro timeline --date 2025-01-31  # Every pause, reset and skip that day
 
 FEATURES:
   • Beautiful terminal UI with session-aware colors
   • Visual progress bar and timer display
   • Audio notifications at session transitions
-  • Configurable warning sound before session ends
+  • Configurable warning sounds before session ends, several per session
   • Configurable long break frequency (1 to N work sessions)
   • Confirmation dialogs for destructive actions
   • Pomodoro counter to track completed work sessions
@@ -79,10 +130,11 @@ For more information about the Pomodoro Technique:
     )
     parser.add_argument(
         "-n", "--notify", 
-        type=int, 
-        default=1, 
-        metavar="MINUTES",
-        help="Play warning sound N minutes before session ends (default: 1)"
+        type=_alerts_arg, 
+        default="1", 
+        metavar="ALERTS",
+        help="Play warning sound N minutes before session ends; separate several with commas "
+             "and use P%% for a point through the session, e.g. 10,5,1,50%% (default: 1)"
     )
     parser.add_argument(
         "-f", "--frequency", 
@@ -108,134 +160,581 @@ For more information about the Pomodoro Technique:
     parser.add_argument(
         "--reset_log",
         action="store_true",
-        help="Reset today's session log to empty and exit"
+        help="Reset today's session log (a named timer's with -t NAME) to empty and exit"
     )
     parser.add_argument(
         "--open_log",
         action="store_true", 
-        help="Open today's session log in default editor and exit"
+        help="Open today's session log (a named timer's with -t NAME) in default editor and exit"
+    )
+    parser.add_argument(
+        "-b", "--big",
+        action="store_true",
+        help="Show the timer in large block digits, readable across a room"
+    )
+    parser.add_argument(
+        "--render",
+        choices=["live", "delta"],
+        default="live",
+        help="Display backend: full-screen redraws (live) or changed cells only, "
+             "for SSH and tmux (delta) (default: live)"
+    )
+    parser.add_argument(
+        "-t", "--timer",
+        action="append",
+        type=_timer_arg,
+        default=[],
+        metavar="NAME[=WORK[/SHORT[/LONG]]]",
+        help="Run a named timer; repeat for several timers in one window, each with its own "
+             "log (durations default to -w/-s/-l)"
+    )
+    parser.add_argument(
+        "--stacked",
+        action="store_true",
+        help="With several timers, list them all as status lines instead of tabs (toggle with v)"
+    )
+    parser.add_argument(
+        "--attach",
+        action="store_true",
+        help="Attach to a running pymodoro daemon instead of running a timer in this process"
+    )
+    parser.add_argument(
+        "--measure_wakeups",
+        action="store_true",
+        help="Count main loop wakeups and frames drawn, and report per-minute rates and audio queue stats on exit"
+    )
+    
+    # Reporting subcommands
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
+    stats_parser = subparsers.add_parser(
+        "stats",
+        help="Show completed pomodoros across days and exit",
+        description="Show completed pomodoros and focus time across days"
+    )
+    stats_parser.add_argument(
+        "--since",
+        type=date.fromisoformat,
+        default=None,
+        metavar="YYYY-MM-DD",
+        help="First day to include (default: 30 days ago)"
+    )
+    stats_parser.add_argument(
+        "--until",
+        type=date.fromisoformat,
+        default=None,
+        metavar="YYYY-MM-DD",
+        help="Last day to include (default: today)"
+    )
+    stats_parser.add_argument(
+        "--by",
+        choices=["day", "week", "month", "hour"],
+        default="day",
+        help="Group totals by day, week, month or hour of day (default: day)"
+    )
+    stats_parser.add_argument(
+        "--timer",
+        default=None,
+        metavar="NAME",
+        help="Show a named timer's totals instead of the default timer's"
+    )
+    timeline_parser = subparsers.add_parser(
+        "timeline",
+        help="Show a day's starts, pauses, resets and skips and exit",
+        description="Replay a day's timer events: every start, pause, resume, reset, "
+                    "session change and skip, with the pomodoros they add up to"
+    )
+    timeline_parser.add_argument(
+        "--date",
+        type=date.fromisoformat,
+        default=None,
+        metavar="YYYY-MM-DD",
+        help="Day to show (default: today)"
+    )
+    timeline_parser.add_argument(
+        "--timer",
+        default=None,
+        metavar="NAME",
+        help="Show a named timer's events instead of the default timer's"
+    )
+    
+    # Handled before argparse in main(); registered here for --help
+    status_parser = subparsers.add_parser(
+        "status",
+        help="Print the running timer's state for shell prompts and exit",
+        description="Print the running timer's state and exit 1 if no timer is running"
+    )
+    status_parser.add_argument(
+        "-f", "--format",
+        default="{icon} {remaining}",
+        metavar="FORMAT",
+        help="Fields: session, label, icon, remaining, minutes, seconds, state, muted, "
+             "pomodoros (default: '{icon} {remaining}')"
+    )
+    daemon_parser = subparsers.add_parser(
+        "daemon",
+        help="Run the timer headless, controlled over a Unix socket",
+        description="Run the timer, sounds and session log without a UI. Clients "
+                    "(pymodoro ctl, pymodoro --attach, scripts) connect to a Unix socket."
+    )
+    daemon_parser.add_argument(
+        "--start",
+        action="store_true",
+        help="Start the first work session immediately instead of waiting for 'ctl start'"
+    )
+    daemon_parser.add_argument(
+        "--socket",
+        default=None,
+        metavar="PATH",
+        help="Socket to listen on (default: $XDG_RUNTIME_DIR/pymodoro/daemon.sock)"
+    )
+    ctl_parser = subparsers.add_parser(
+        "ctl",
+        help="Send a command to a running daemon and print its JSON reply",
+        description="Send a command to a running pymodoro daemon. 'subscribe' prints one "
+                    "JSON line per timer event until the daemon exits."
+    )
+    ctl_parser.add_argument(
+        "action",
+        choices=["start", "pause", "toggle", "skip", "reset", "mute", "status", "subscribe", "shutdown"],
+        help="Command to send"
+    )
+    ctl_parser.add_argument(
+        "--ticks",
+        action="store_true",
+        help="With subscribe, also receive the state once a second while running"
+    )
+    ctl_parser.add_argument(
+        "--socket",
+        default=None,
+        metavar="PATH",
+        help="Daemon socket (default: $XDG_RUNTIME_DIR/pymodoro/daemon.sock)"
     )
     
     args = parser.parse_args()
 
+    if args.command == "stats":
+        show_stats(args)
+        return
+
+    if args.command == "timeline":
+        show_timeline(args)
+        return
+
+    if args.command == "ctl":
+        sys.exit(run_ctl(args))
+
     # Handle log management actions (exit immediately after execution)
+    if args.reset_log or args.open_log:
+        if len(args.timer) > 1:
+            parser.error("--reset_log and --open_log take at most one --timer")
+        timer_name = args.timer[0][0] if args.timer else None
+        log_name = f"session log for {timer_name}" if timer_name else "session log"
+    
     if args.reset_log:
-        reset_today_log()
-        console.print("[green]✓[/green] Today's session log has been reset to empty")
+        from .storage import reset_today_log
+        reset_today_log(timer_name)
+        _print_done(f"Today's {log_name} has been reset to empty")
         return
     
     if args.open_log:
-        open_log_in_editor()
-        console.print("[green]✓[/green] Opening today's session log in default editor")
+        from .storage import open_log_in_editor
+        open_log_in_editor(timer_name)
+        _print_done(f"Opening today's {log_name} in default editor")
         return
 
     # Validate frequency parameter
     if args.frequency < 1:
         parser.error("Long break frequency must be at least 1")
 
-    # Load existing session data
-    day_log = load_or_initialize_day_log()
+    if args.timer and (args.attach or args.command == "daemon"):
+        parser.error("--timer cannot be combined with the daemon or --attach")
+    names = [name for name, *_ in args.timer]
+    if len(set(names)) != len(names):
+        parser.error("timer names must be unique")
+
+    if args.command == "daemon":
+        run_daemon(args)
+        return
+
+    run_timer(args)
+
+def run_timer(args):
+    """Run the interactive timer until the user quits."""
+    import signal
+
+    from rich.live import Live
+
+    from .timer import PomodoroTimer
+    from .interface import PomodoroUI, RenderScheduler, TimerGroupUI, console
+    from .keyboard import TerminalKeyboard
+    from .audio import AudioWorker
+    from .persistence import PersistenceWorker
+    from .scheduler import LoopScheduler, LoopCounter, TimerGroup
+
+    group = None
+    if args.attach:
+        # The daemon owns the timer, the session log and the sounds
+        from .control import RemoteTimer
+        persistence = audio = None
+        try:
+            timer = RemoteTimer().connect()
+        except OSError as exc:
+            console.print(f"[bold red]✗[/bold red] No pymodoro daemon to attach to: {exc}")
+            sys.exit(1)
+    else:
+        # Load existing session data; sessions are saved in the background from here on
+        persistence = PersistenceWorker()
+        persistence.start()
+        audio = AudioWorker()
+        audio.start()
+        
+        if args.timer:
+            # Named timers share this process, its scheduler, audio worker and persistence worker
+            timers = []
+            for name, work, short, long in args.timer:
+                named = PomodoroTimer(work or args.work, short or args.short, long or args.long,
+                                      args.notify, args.frequency, args.mute, name=name)
+                named.pomodoros_completed = persistence.session_count_for(name)
+                timers.append(named)
+            group = TimerGroup(timers)
+            timer = group.current
+        else:
+            timer = PomodoroTimer(args.work, args.short, args.long, args.notify, args.frequency, args.mute)
+            timer.pomodoros_completed = persistence.session_count
+        for each in group or [timer]:
+            persistence.record_events(each)  # Pauses, resets and skips too, for replay
+        status_file = publish_status(timer, group)
+    if group:
+        ui = TimerGroupUI(group, timer_font="block" if args.big else None, stacked=args.stacked)
+    else:
+        ui = PomodoroUI(timer, timer_font="block" if args.big else None)
+    timers = group.timers if group else [timer]
+    scheduler = LoopScheduler(timer, group=group)
+    counter = LoopCounter() if args.measure_wakeups else None
     
-    timer = PomodoroTimer(args.work, args.short, args.long, args.notify, args.frequency, args.mute)
-    timer.pomodoros_completed = day_log.session_count
-    ui = PomodoroUI(timer)
+    ui.resize(*console.size)
+    if args.render == "delta":
+        from .ui.delta import DeltaRenderer
+        display = DeltaRenderer(ui.get_renderable(), console=console)
+    else:
+        display = Live(ui.get_renderable(), console=console, screen=True, redirect_stderr=False, auto_refresh=False)
     
-    timer.start() # Start the timer initially
+    if not args.attach:
+        for each in timers:
+            each.start() # Start the timers initially
 
     try:
-        with TerminalKeyboard() as kb, Live(ui.get_renderable(), screen=True, redirect_stderr=False, refresh_per_second=4) as live:
+        with TerminalKeyboard() as kb, display as live:
+            renderer = RenderScheduler(live, ui, counter)
+            if args.attach:
+                # Redraw as soon as the daemon pushes a change
+                timer.on_change = kb.wake
+            
+            def on_resize(signum, frame):
+                renderer.request_redraw()
+                kb.wake()
+            
+            if hasattr(signal, "SIGWINCH"):
+                signal.signal(signal.SIGWINCH, on_resize)
+            
             should_exit = False
             confirmation_state = None  # None, 'skip', 'reset', 'quit', or 'help'
             
             while not should_exit:
-                key = kb.getch()
-                if key:
-                    if confirmation_state:
-                        # Handle confirmation/help screen responses
-                        if confirmation_state == 'help':
-                            # Any key dismisses help screen (except for action keys which should still work)
-                            if key.lower() == 'h' or key == '\x1b':  # h or ESC explicitly close help
-                                confirmation_state = None
-                            elif key == ' ':
-                                # Space should work normally (pause/resume) even from help
-                                timer.toggle_pause()
-                                confirmation_state = None
-                            elif key.lower() == 'n':
-                                # N should work normally (skip) even from help
-                                confirmation_state = 'skip'
-                            elif key.lower() == 'r':
-                                # R should work normally (reset) even from help
-                                confirmation_state = 'reset'
-                            elif key.lower() == 'q':
-                                # Q should work normally (quit) even from help
-                                confirmation_state = 'quit'
-                            elif key.lower() == 'm':
-                                # M should work normally (mute) even from help
-                                timer.toggle_mute()
-                                confirmation_state = None
-                            else:
-                                # Any other key dismisses help
-                                confirmation_state = None
-                        else:
-                            # Handle normal confirmation responses (skip/reset/quit)
-                            if key.lower() == 'y':
-                                if confirmation_state == 'skip':
-                                    # Execute skip action - update timer first, then play sound
-                                    current_session_type = timer.current_session
-                                    # If skipping a work session, save it first
-                                    if current_session_type == SessionType.WORK:
-                                        add_session(timer.settings[SessionType.WORK] // 60, start_time=timer.session_start_time)
-                                    timer.next_session(skip=True)
-                                    # Play sound asynchronously after state change
-                                    if current_session_type == SessionType.WORK:
-                                        play_work_end(timer.is_muted)
-                                    else:
-                                        play_break_end(timer.is_muted)
-                                elif confirmation_state == 'reset':
-                                    # Execute reset action
-                                    timer.reset()
-                                elif confirmation_state == 'quit':
-                                    # Execute quit action
-                                    should_exit = True
-                                confirmation_state = None
-                            elif key.lower() == 'n' or key == ' ' or key == '\x1b':  # N, spacebar, or ESC cancels
-                                confirmation_state = None
-                    else:
-                        # Handle normal key presses
-                        if key == ' ':
-                            timer.toggle_pause()
-                        elif key.lower() == 'n':
-                            confirmation_state = 'skip'
-                        elif key.lower() == 'r':
-                            confirmation_state = 'reset'
-                        elif key.lower() == 'q':
-                            confirmation_state = 'quit'
-                        elif key.lower() == 'h':
-                            confirmation_state = 'help'
-                        elif key.lower() == 'm':
-                            timer.toggle_mute()
-                
-                time.sleep(0.1)
+                # Sleep until a key arrives or the next second/warning/session end
+                kb.wait(scheduler.next_timeout())
+                if counter:
+                    counter.record_wakeup()
                 
-                # Check for warning before checking session change
-                if timer.should_play_warning():
-                    play_warning(timer.is_muted)
+                # Handle every key that arrived since the last iteration
+                for key in kb.read_keys():
+                    if group and not confirmation_state and switch_timer(key, group, ui):
+                        status_file.publish(group.current)
+                        continue
+                    confirmation_state, should_exit = handle_key(key, confirmation_state, group.current if group else timer,
+                                                                 persistence, audio)
+                    if should_exit:
+                        break
                 
-                session_changed = timer.tick()
-                if session_changed:
-                    if timer.current_session == SessionType.WORK:
-                        play_break_end(timer.is_muted) # Sound for break ending
-                    else:
-                        # Work session completed - save it and play sound
-                        add_session(timer.settings[SessionType.WORK] // 60, start_time=timer.session_start_time)
-                        play_work_end(timer.is_muted) # Sound for work ending
+                # Only timers whose next alert or session end has come need attention
+                for index in group.pop_due() if group else [0]:
+                    advance_timer(timers[index], persistence, audio)
+                    if group:
+                        group.schedule(index)
                 
-                # Update display with a freshly generated renderable
-                # This is a key fix to prevent stale buffer issues in Rich Live
-                new_renderable = ui.get_renderable(confirmation_state)
-                live.update(new_renderable)
+                # Redraw only if the visible state changed (or the terminal resized)
+                renderer.render(confirmation_state, notice=(persistence or timer).last_error)
     finally:
+        if args.attach:
+            timer.close()
+        else:
+            status_file.close()
+            audio.stop()
+            if not persistence.stop():
+                console.print(f"[bold red]✗[/bold red] {persistence.unsaved_count} session(s) could not be saved: {persistence.last_error}")
+        if counter:
+            console.print(f"[dim]Main loop: {counter.summary()}[/dim]")
+            if audio:
+                console.print(f"[dim]Audio: {audio.summary()}[/dim]")
+            fragments = ui.screen_manager.theme_manager.fragments.info()
+            console.print(f"[dim]Fragment cache: {fragments.hits} hits, {fragments.misses} misses, "
+                          f"{fragments.currsize}/{fragments.maxsize} entries[/dim]")
         console.print("[bold green]🍅 Pymodoro finished. Great work![/bold green]")
 
+def advance_timer(timer, persistence, audio):
+    """Play a due alert and finish the session if it has run out (nothing happens when attached)."""
+    from .timer import SessionType
+
+    # Check for warning before checking session change
+    if timer.should_play_warning():
+        audio.play_warning(timer.is_muted)
+    
+    started = timer.session_start_time  # tick() moves it on to the next session
+    if timer.tick():
+        if timer.current_session == SessionType.WORK:
+            audio.play_break_end(timer.is_muted) # Sound for break ending
+        else:
+            # Work session completed - save it and play sound
+            persistence.submit_session(timer.settings[SessionType.WORK] // 60, start_time=started,
+                                       timer_name=timer.name)
+            audio.play_work_end(timer.is_muted) # Sound for work ending
+
+def switch_timer(key, group, ui):
+    """Handle the keys that pick which named timer is shown; return whether the key was one."""
+    if key in ('\t', 'right'):
+        group.select(group.active + 1)
+    elif key in ('shift_tab', 'left'):
+        group.select(group.active - 1)
+    elif key.isdigit() and 0 < int(key) <= len(group):
+        group.select(int(key) - 1)
+    elif key.lower() == 'v':
+        ui.toggle_view()
+    else:
+        return False
+    return True
+
+def publish_status(timer, group=None):
+    """
+    Keep the status file read by `pymodoro status` in step with the timer's transitions.
+
+    With several named timers the current one is published.
+    """
+    from .status import StatusFile
+
+    status_file = StatusFile()
+    try:
+        status_file.open()
+    except OSError:
+        return status_file  # Status output is best effort; publish() is a no-op when not open
+    current = (lambda: group.current) if group else (lambda: timer)
+    for each in group or [timer]:
+        each.add_listener(lambda event: status_file.publish(current()))
+    status_file.publish(current())
+    return status_file
+
+def run_daemon(args):
+    """Run the timer headless until a client sends shutdown or the process is signalled."""
+    import signal
+
+    from .audio import AudioWorker
+    from .daemon import PomodoroDaemon
+    from .persistence import PersistenceWorker
+    from .timer import PomodoroTimer
+
+    persistence = PersistenceWorker()
+    persistence.start()
+    audio = AudioWorker()
+    audio.start()
+    
+    timer = PomodoroTimer(args.work, args.short, args.long, args.notify, args.frequency, args.mute)
+    timer.pomodoros_completed = persistence.session_count
+    persistence.record_events(timer)
+    daemon = PomodoroDaemon(timer, persistence, audio, socket_path=args.socket)
+    status_file = publish_status(timer)
+    if args.start:
+        timer.start()
+    
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda signum, frame: daemon.shutdown())
+    
+    try:
+        daemon.listen()
+        print(f"Pymodoro daemon listening on {daemon.socket_path}", flush=True)
+        daemon.serve_forever()
+    except RuntimeError as exc:
+        print(f"✗ {exc}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        status_file.close()
+        audio.stop()
+        if not persistence.stop():
+            print(f"✗ {persistence.unsaved_count} session(s) could not be saved: {persistence.last_error}",
+                  file=sys.stderr)
+
+def run_ctl(args):
+    """Send one command to the daemon and print the JSON reply; return the exit status."""
+    import json
+    import os
+    from .control import request, subscribe
+
+    try:
+        if args.action == "subscribe":
+            for message in subscribe(args.socket, ticks=args.ticks):
+                print(json.dumps(message), flush=True)
+            return 0
+        response = request(args.action, args.socket)
+        print(json.dumps(response), flush=True)
+    except BrokenPipeError:
+        # The reader stopped (e.g. `| head`); keep the exit-time flush from failing too
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    except (ConnectionRefusedError, FileNotFoundError) as exc:
+        print(f"✗ No pymodoro daemon: {exc}", file=sys.stderr)
+        return 1
+    except OSError as exc:
+        print(f"✗ Lost the pymodoro daemon: {exc}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        return 0
+    return 0 if response.get("ok") else 1
+
+def handle_key(key, confirmation_state, timer, persistence, audio):
+    """
+    Apply one key press to the timer and dialogs.
+
+    Returns the new confirmation state (None, 'skip', 'reset', 'quit' or
+    'help') and whether the user confirmed quitting.
+    """
+    from .timer import SessionType
+
+    if confirmation_state:
+        # Handle confirmation/help screen responses
+        if confirmation_state == 'help':
+            # Any key dismisses help screen (except for action keys which should still work)
+            if key.lower() == 'h' or key == '\x1b':  # h or ESC explicitly close help
+                confirmation_state = None
+            elif key == ' ':
+                # Space should work normally (pause/resume) even from help
+                timer.toggle_pause()
+                confirmation_state = None
+            elif key.lower() == 'n':
+                # N should work normally (skip) even from help
+                confirmation_state = 'skip'
+            elif key.lower() == 'r':
+                # R should work normally (reset) even from help
+                confirmation_state = 'reset'
+            elif key.lower() == 'q':
+                # Q should work normally (quit) even from help
+                confirmation_state = 'quit'
+            elif key.lower() == 'm':
+                # M should work normally (mute) even from help
+                timer.toggle_mute()
+                confirmation_state = None
+            else:
+                # Any other key dismisses help
+                confirmation_state = None
+        else:
+            # Handle normal confirmation responses (skip/reset/quit)
+            if key.lower() == 'y':
+                if confirmation_state == 'skip' and persistence is None:
+                    # Attached to a daemon, which saves the session and plays the sound
+                    timer.next_session(skip=True)
+                elif confirmation_state == 'skip':
+                    # Execute skip action - update timer first, then play sound
+                    current_session_type = timer.current_session
+                    # If skipping a work session, save it first
+                    if current_session_type == SessionType.WORK:
+                        persistence.submit_session(timer.settings[SessionType.WORK] // 60, start_time=timer.session_start_time,
+                                                   timer_name=timer.name)
+                    timer.next_session(skip=True)
+                    # Queue the sound for the audio worker after the state change
+                    if current_session_type == SessionType.WORK:
+                        audio.play_work_end(timer.is_muted)
+                    else:
+                        audio.play_break_end(timer.is_muted)
+                elif confirmation_state == 'reset':
+                    # Execute reset action
+                    timer.reset()
+                elif confirmation_state == 'quit':
+                    # Execute quit action
+                    return None, True
+                confirmation_state = None
+            elif key.lower() == 'n' or key == ' ' or key == '\x1b':  # N, spacebar, or ESC cancels
+                confirmation_state = None
+    else:
+        # Handle normal key presses
+        if key == ' ':
+            timer.toggle_pause()
+        elif key.lower() == 'n':
+            confirmation_state = 'skip'
+        elif key.lower() == 'r':
+            confirmation_state = 'reset'
+        elif key.lower() == 'q':
+            confirmation_state = 'quit'
+        elif key.lower() == 'h':
+            confirmation_state = 'help'
+        elif key.lower() == 'm':
+            timer.toggle_mute()
+    return confirmation_state, False
+
+def show_stats(args):
+    """Print period totals for the stats subcommand."""
+    from rich.table import Table
+    from .stats import iter_stats, format_minutes
+
+    until = args.until or date.today()
+    since = args.since or until - timedelta(days=30)
+    
+    title = f"🍅 Pomodoro stats for {args.timer}" if args.timer else "🍅 Pomodoro stats"
+    table = Table(title=title, caption=f"{since.isoformat()} to {until.isoformat()}")
+    table.add_column(args.by.capitalize(), style="bold")
+    table.add_column("Pomodoros", justify="right", style="red")
+    table.add_column("Focus time", justify="right", style="cyan")
+    
+    total_sessions = total_minutes = 0
+    for period in iter_stats(since, until, args.by, timer_name=args.timer):
+        table.add_row(period.label, str(period.sessions), format_minutes(period.minutes))
+        total_sessions += period.sessions
+        total_minutes += period.minutes
+    
+    table.add_section()
+    table.add_row("Total", str(total_sessions), format_minutes(total_minutes), style="bold")
+    _console().print(table)
+
+def show_timeline(args):
+    """Print a day's replayed timer events for the timeline subcommand."""
+    from collections import Counter
+    from rich.table import Table
+    from .events import replay_day
+    from .stats import format_minutes
+
+    log_date = args.date or date.today()
+    replay = replay_day(log_date, args.timer)
+    if not replay.timeline:
+        print(f"No timer events recorded on {log_date.isoformat()}")
+        return
+    counts = Counter(entry.event for entry in replay.timeline)
+    
+    table = Table(title=f"🍅 Timeline for {log_date.isoformat()}", caption=(
+        f"{replay.day_log.session_count} pomodoros "
+        f"({format_minutes(sum(s.duration_minutes for s in replay.day_log.sessions))}), "
+        f"{counts['pause']} pauses, {counts['reset']} resets, {counts['skip']} skips"
+    ))
+    table.add_column("Time", style="bold")
+    table.add_column("Event")
+    table.add_column("Session", style="cyan")
+    table.add_column("Left", justify="right")
+    table.add_column("Pomodoros", justify="right", style="red")
+    for entry in replay.timeline:
+        mins, secs = divmod(int(entry.time_left), 60)
+        table.add_row(
+            entry.at.strftime("%H:%M:%S"),
+            entry.event,
+            entry.session.name.replace("_", " ").title() + ("" if entry.running else " (paused)"),
+            f"{mins:02d}:{secs:02d}",
+            str(entry.pomodoros),
+        )
+    _console().print(table)
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,56 @@
+# src/pymodoro/alerts.py
+from typing import NamedTuple, Optional, Sequence, Tuple, Union
+
+
+class Alert(NamedTuple):
+    """A point in a session at which the warning sound plays."""
+    minutes_before_end: float = 0.0
+    percent: Optional[float] = None  # Percent of the session elapsed, instead of minutes
+
+    def offset(self, duration: float) -> Optional[float]:
+        """Seconds of running time into a session of ``duration`` at which to fire, or None if it falls outside."""
+        if self.percent is not None:
+            at = duration * self.percent / 100
+        else:
+            at = duration - self.minutes_before_end * 60
+        return at if 0 < at < duration else None
+
+    def __str__(self) -> str:
+        if self.percent is not None:
+            return f"{self.percent:g}%"
+        return f"{self.minutes_before_end:g}"
+
+
+def parse_alerts(text: str) -> Tuple[Alert, ...]:
+    """
+    Parse a comma-separated alert list such as ``10,5,1,50%``.
+
+    Plain numbers are minutes before the session ends; ``P%`` fires when
+    P percent of the session has elapsed. An empty string means no alerts.
+    """
+    alerts = []
+    for item in filter(None, (part.strip() for part in text.split(","))):
+        try:
+            if item.endswith("%"):
+                alert = Alert(percent=float(item[:-1]))
+                valid = 0 < alert.percent < 100
+            else:
+                alert = Alert(minutes_before_end=float(item))
+                valid = alert.minutes_before_end > 0
+        except ValueError:
+            valid = False
+        if not valid:
+            raise ValueError(f"{item!r} is not a number of minutes or a percentage between 0 and 100")
+        alerts.append(alert)
+    return tuple(alerts)
+
+
+def as_alerts(spec: Union[int, float, str, Sequence[Alert], None]) -> Tuple[Alert, ...]:
+    """Normalise minutes, an alert list string or Alerts to a tuple of Alerts."""
+    if spec is None:
+        return ()
+    if isinstance(spec, str):
+        return parse_alerts(spec)
+    if isinstance(spec, (int, float)):
+        return (Alert(minutes_before_end=spec),) if spec > 0 else ()
+    return tuple(spec)
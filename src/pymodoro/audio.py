@@ -0,0 +1,176 @@
+# src/pymodoro/audio.py
+import queue
+import threading
+import time
+from typing import Callable, List, Optional, Tuple
+
+from pymodoro.sound import _play_notification_sound_sync
+from pymodoro.tones import TonePipe, render_all
+
+_STOP = object()
+
+Notification = Tuple[float, str]  # (monotonic time submitted, sound type)
+WARNING = "default"
+
+
+class AudioWorker:
+    """
+    Single long-lived owner of notification playback.
+
+    Notifications are pymodoro's own tones, rendered once in memory and
+    written to one long-lived ``pacat``/``aplay`` pipe; without such a
+    player they are played from WAV files (or system sounds) by the sound
+    backend resolver. Sounds are queued from the UI loop without blocking and played one at
+    a time from a background thread, so a burst of key presses can never
+    stack concurrent player processes. Of two notifications submitted
+    within ``coalesce_window`` seconds the later supersedes the earlier,
+    so a warning is held for the window before it plays, in case the
+    session's end chime follows it; end chimes play as soon as they
+    arrive. A repeat of the sound just played within the window is
+    dropped. The queue is bounded; notifications that do not fit are
+    dropped. The counters are updated under a lock, from both threads.
+    """
+
+    def __init__(self, maxsize: int = 8, coalesce_window: float = 1.0,
+                 play: Optional[Callable[[str], bool]] = None, tones: Optional[TonePipe] = None):
+        self.coalesce_window = coalesce_window
+        self.played = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.max_queue_depth = 0
+        self._tones = tones or TonePipe()
+        self._play = play or self._play_tone
+        self._queue: queue.Queue = queue.Queue(maxsize)
+        self._last_played: Optional[Notification] = None
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+        self._stats_lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name="pymodoro-audio", daemon=True
+        )
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of notifications waiting to be played."""
+        return self._queue.qsize()
+
+    @property
+    def mean_latency(self) -> float:
+        """Mean seconds from submission to the start of playback."""
+        return self._latency_total / self.played if self.played else 0.0
+
+    @property
+    def max_latency(self) -> float:
+        return self._latency_max
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def submit(self, sound_type: str, muted: bool = False) -> bool:
+        """Queue a notification sound. Never blocks; returns whether it was queued."""
+        if muted:
+            return False
+        try:
+            self._queue.put_nowait((time.monotonic(), sound_type))
+        except queue.Full:
+            with self._stats_lock:
+                self.dropped += 1
+            return False
+        with self._stats_lock:
+            self.max_queue_depth = max(self.max_queue_depth, self._queue.qsize())
+        return True
+
+    def play_work_end(self, muted: bool = False) -> bool:
+        """Queue the sound for the end of a work session."""
+        return self.submit("work_end", muted)
+
+    def play_break_end(self, muted: bool = False) -> bool:
+        """Queue the sound for the end of a break."""
+        return self.submit("break_end", muted)
+
+    def play_warning(self, muted: bool = False) -> bool:
+        """Queue the warning sound before a session ends."""
+        return self.submit(WARNING, muted)
+
+    def stop(self, timeout: Optional[float] = 2.0) -> None:
+        """Discard queued sounds and stop the worker once the current one ends."""
+        discarded = len(self._drain([]))
+        with self._stats_lock:
+            self.dropped += discarded
+        if self._thread.is_alive():
+            try:
+                self._queue.put_nowait(_STOP)
+            except queue.Full:
+                pass
+            self._thread.join(timeout)
+        self._tones.close()
+
+    def summary(self) -> str:
+        with self._stats_lock:
+            return (f"{self.played} played, {self.coalesced} coalesced, {self.dropped} dropped, "
+                    f"max queue {self.max_queue_depth}, latency {self.mean_latency * 1000:.1f} ms mean "
+                    f"/ {self.max_latency * 1000:.1f} ms max")
+
+    def _drain(self, batch: list) -> list:
+        """Collect everything already queued behind the first item."""
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                return batch
+
+    def _hold_warning(self, batch: list) -> list:
+        """Wait out the coalescing window of a trailing warning, collecting what arrives."""
+        while batch[-1] is not _STOP and batch[-1][1] == WARNING:
+            wait = batch[-1][0] + self.coalesce_window - time.monotonic()
+            if wait <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=wait))
+            except queue.Empty:
+                break
+            self._drain(batch)
+        return batch
+
+    def _coalesce(self, batch: List[Notification]) -> List[Notification]:
+        """Merge notifications that arrived within the coalescing window."""
+        merged: List[Notification] = []
+        coalesced = 0
+        for notification in batch:
+            submitted, sound_type = notification
+            previous = merged[-1] if merged else None
+            if previous and submitted - previous[0] <= self.coalesce_window:
+                # The later notification supersedes the earlier one
+                merged[-1] = notification
+                coalesced += 1
+            elif (not merged and self._last_played and self._last_played[1] == sound_type
+                    and submitted - self._last_played[0] <= self.coalesce_window):
+                # Repeat of the sound that has just been played
+                coalesced += 1
+            else:
+                merged.append(notification)
+        with self._stats_lock:
+            self.coalesced += coalesced
+        return merged
+
+    def _play_tone(self, sound_type: str) -> bool:
+        """Write the tone to the player pipe, falling back to file-based playback."""
+        return self._tones.play(sound_type) or _play_notification_sound_sync(sound_type)
+
+    def _run(self) -> None:
+        # Render the tones here rather than when the first notification is due
+        render_all()
+        while True:
+            batch = self._hold_warning(self._drain([self._queue.get()]))
+            if _STOP in batch:
+                with self._stats_lock:
+                    self.dropped += len(batch) - 1
+                return
+            for submitted, sound_type in self._coalesce(batch):
+                latency = time.monotonic() - submitted
+                with self._stats_lock:
+                    self._latency_total += latency
+                    self._latency_max = max(self._latency_max, latency)
+                    self.played += 1
+                self._last_played = (submitted, sound_type)
+                self._play(sound_type)
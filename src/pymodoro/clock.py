@@ -0,0 +1,53 @@
+# src/pymodoro/clock.py
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Optional
+
+
+class Clock(ABC):
+    """Source of monotonic and wall-clock time for the timer."""
+
+    @abstractmethod
+    def monotonic(self) -> float:
+        """Seconds on a clock that never goes backwards."""
+        pass
+
+    @abstractmethod
+    def now(self) -> datetime:
+        """The current wall-clock time."""
+        pass
+
+
+class SystemClock(Clock):
+    """The real clock."""
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    def now(self) -> datetime:
+        return datetime.now()
+
+
+class VirtualClock(Clock):
+    """
+    A clock that only moves when advanced.
+
+    Monotonic time starts at zero and wall-clock time starts at ``start``;
+    both move together, so a simulated day can be fast-forwarded through
+    in microseconds.
+    """
+
+    def __init__(self, start: Optional[datetime] = None):
+        self.start = start or datetime.now()
+        self.elapsed = 0.0
+
+    def monotonic(self) -> float:
+        return self.elapsed
+
+    def now(self) -> datetime:
+        return self.start + timedelta(seconds=self.elapsed)
+
+    def advance(self, seconds: float) -> None:
+        """Move both clocks forward by the given number of seconds."""
+        self.elapsed += max(0.0, seconds)
@@ -0,0 +1,190 @@
+# src/pymodoro/compact_log.py
+import struct
+from array import array
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from pymodoro.session_model import DayLog, Session
+from pymodoro.storage import get_log_dir, read_day_log
+
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+_UTC_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_NAIVE = -(2 ** 31)  # utc_offsets marker for a naive start
+_HEADER = struct.Struct("=4sIQQQ")
+_MAGIC = b"PMCS"
+_VERSION = 1
+# Array columns in serialization order
+_COLUMNS = (
+    ("starts", "q"), ("durations", "i"), ("utc_offsets", "i"), ("note_bounds", "q"),
+    ("day_ordinals", "i"), ("day_ends", "q"),
+)
+
+
+def _to_micros(start: datetime) -> Tuple[int, int]:
+    """Encode a start as (microseconds since epoch, UTC offset seconds or _NAIVE)."""
+    if start.tzinfo is None:
+        return (start - _NAIVE_EPOCH) // timedelta(microseconds=1), _NAIVE
+    offset = start.utcoffset()
+    return (start - _UTC_EPOCH) // timedelta(microseconds=1), offset // timedelta(seconds=1)
+
+
+def _from_micros(micros: int, utc_offset: int) -> datetime:
+    if utc_offset == _NAIVE:
+        return _NAIVE_EPOCH + timedelta(microseconds=micros)
+    tz = timezone(timedelta(seconds=utc_offset))
+    return (_UTC_EPOCH + timedelta(microseconds=micros)).astimezone(tz)
+
+
+class CompactSessions:
+    """
+    Column-oriented session history for bulk processing.
+
+    Sessions from many days are held in parallel arrays: start time in
+    microseconds, duration, UTC offset, and offsets into a single notes
+    string. Days are recorded as (ordinal, end index) pairs so the
+    conversion back to ``DayLog`` objects is lossless. Validation happens
+    once at the YAML boundary; nothing here creates pydantic models until
+    ``to_day_logs`` is called.
+    """
+
+    __slots__ = (
+        "starts", "durations", "utc_offsets", "note_bounds", "note_flags",
+        "day_ordinals", "day_ends", "_note_parts", "_notes_text",
+    )
+
+    def __init__(self):
+        for name, typecode in _COLUMNS:
+            setattr(self, name, array(typecode))
+        self.note_bounds.append(0)
+        self.note_flags = bytearray()
+        self._note_parts: List[str] = []
+        self._notes_text: Optional[str] = ""
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    @property
+    def notes_text(self) -> str:
+        """All notes concatenated; sliced with ``note_bounds``."""
+        if self._notes_text is None:
+            self._notes_text = "".join(self._note_parts)
+            self._note_parts = [self._notes_text]
+        return self._notes_text
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate payload size of the arrays and the notes text."""
+        columns = sum(getattr(self, name).itemsize * len(getattr(self, name)) for name, _ in _COLUMNS)
+        return columns + len(self.note_flags) + len(self.notes_text.encode("utf-8"))
+
+    def append(self, start: datetime, duration_minutes: int, notes: Optional[str] = None) -> None:
+        """Append one session to the current (last) day."""
+        micros, utc_offset = _to_micros(start)
+        self.starts.append(micros)
+        self.durations.append(duration_minutes)
+        self.utc_offsets.append(utc_offset)
+        self.note_flags.append(notes is not None)
+        if notes:
+            self._note_parts.append(notes)
+            self._notes_text = None
+        self.note_bounds.append(self.note_bounds[-1] + len(notes or ""))
+        if self.day_ends:
+            self.day_ends[-1] = len(self.starts)
+
+    def add_day(self, day_log: DayLog) -> None:
+        """Append a validated day log."""
+        self.day_ordinals.append(day_log.log_date.toordinal())
+        self.day_ends.append(len(self.starts))
+        for session in day_log.sessions:
+            self.append(session.start, session.duration_minutes, session.notes)
+
+    @classmethod
+    def from_day_logs(cls, day_logs: Iterable[DayLog]) -> "CompactSessions":
+        compact = cls()
+        for day_log in day_logs:
+            compact.add_day(day_log)
+        return compact
+
+    def iter_sessions(self, begin: int = 0, end: Optional[int] = None) -> Iterator[Tuple[datetime, int, Optional[str]]]:
+        """Yield (start, duration_minutes, notes) tuples without building models."""
+        text = self.notes_text
+        end = len(self) if end is None else end
+        for i in range(begin, end):
+            notes = text[self.note_bounds[i]:self.note_bounds[i + 1]] if self.note_flags[i] else None
+            yield _from_micros(self.starts[i], self.utc_offsets[i]), self.durations[i], notes
+
+    def iter_days(self) -> Iterator[Tuple[date, int, int]]:
+        """Yield (log_date, first index, end index) for each day."""
+        begin = 0
+        for ordinal, end in zip(self.day_ordinals, self.day_ends):
+            yield date.fromordinal(ordinal), begin, end
+            begin = end
+
+    def to_day_logs(self) -> List[DayLog]:
+        """Rebuild the ``DayLog`` objects this history was built from."""
+        return [
+            DayLog.model_construct(
+                log_date=log_date,
+                sessions=[
+                    Session.model_construct(start=start, duration_minutes=duration, notes=notes)
+                    for start, duration, notes in self.iter_sessions(begin, end)
+                ],
+            )
+            for log_date, begin, end in self.iter_days()
+        ]
+
+    def total_minutes(self) -> int:
+        return sum(self.durations)
+
+    def to_bytes(self) -> bytes:
+        """Serialize to a flat native-byte-order buffer for local caching."""
+        notes = self.notes_text.encode("utf-8")
+        parts = [_HEADER.pack(_MAGIC, _VERSION, len(self), len(self.day_ordinals), len(notes))]
+        parts.extend(getattr(self, name).tobytes() for name, _ in _COLUMNS)
+        parts.append(bytes(self.note_flags))
+        parts.append(notes)
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, payload: bytes) -> "CompactSessions":
+        """Load a buffer written by ``to_bytes`` with one copy per column."""
+        magic, version, count, days, notes_size = _HEADER.unpack_from(payload)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Not a compact session buffer")
+        lengths = {"note_bounds": count + 1, "day_ordinals": days, "day_ends": days}
+        compact = cls()
+        offset = _HEADER.size
+        view = memoryview(payload)
+        for name, typecode in _COLUMNS:
+            column = array(typecode)
+            size = lengths.get(name, count) * column.itemsize
+            column.frombytes(view[offset:offset + size])
+            setattr(compact, name, column)
+            offset += size
+        compact.note_flags = bytearray(view[offset:offset + count])
+        offset += count
+        compact._notes_text = bytes(view[offset:offset + notes_size]).decode("utf-8")
+        compact._note_parts = [compact._notes_text]
+        return compact
+
+
+def load_compact_history(since: date, until: date) -> CompactSessions:
+    """Load every logged day between two dates into one compact history.
+
+    Each day passes through ``read_day_log`` (and so its pydantic
+    validation or the pre-validated cache) exactly once; unreadable days
+    are skipped.
+    """
+    days = set()
+    for path in get_log_dir().iterdir():
+        day, _, kind = path.name.partition('.')
+        if kind in ('yaml', 'journal') and since.isoformat() <= day <= until.isoformat():
+            days.add(day)
+
+    compact = CompactSessions()
+    for day in sorted(days):
+        try:
+            compact.add_day(read_day_log(date.fromisoformat(day)))
+        except (ValueError, OSError):
+            continue
+    return compact
@@ -0,0 +1,186 @@
+# src/pymodoro/control.py
+#
+# Client side of the daemon protocol. Standard library only, so status bars
+# and scripts can talk to a running daemon without importing rich or pydantic.
+import json
+import socket
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional
+
+from pymodoro.status import get_runtime_dir
+from pymodoro.timer import SessionType
+
+COMMANDS = ("start", "pause", "toggle", "skip", "reset", "mute", "status", "subscribe", "shutdown")
+
+
+def get_socket_path() -> Path:
+    """Return the daemon's socket path, under $XDG_RUNTIME_DIR when it is set."""
+    return Path(get_runtime_dir()) / "daemon.sock"
+
+
+def connect(socket_path: Optional[Path] = None, timeout: Optional[float] = 2.0) -> socket.socket:
+    """Open a connection to the daemon. Raises OSError if it is not running."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(str(socket_path or get_socket_path()))
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def _messages(sock: socket.socket) -> Iterator[Dict]:
+    """Yield JSON messages read line by line from a connection until it closes."""
+    buffer = b""
+    while True:
+        data = sock.recv(65536)
+        if not data:
+            return
+        buffer += data
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line:
+                yield json.loads(line)
+
+
+def request(cmd: str, socket_path: Optional[Path] = None, **fields) -> Dict:
+    """Send one command over a short-lived connection and return the response."""
+    with connect(socket_path) as sock:
+        sock.sendall(json.dumps({"cmd": cmd, **fields}).encode() + b"\n")
+        for message in _messages(sock):
+            return message
+    raise ConnectionError("daemon closed the connection without replying")
+
+
+def subscribe(socket_path: Optional[Path] = None, ticks: bool = False) -> Iterator[Dict]:
+    """Yield the subscribe response and then every event pushed by the daemon."""
+    with connect(socket_path) as sock:
+        sock.sendall(json.dumps({"cmd": "subscribe", "ticks": ticks}).encode() + b"\n")
+        sock.settimeout(None)
+        yield from _messages(sock)
+
+
+class RemoteTimer:
+    """
+    Stand-in for PomodoroTimer that mirrors a timer running in the daemon.
+
+    A background thread holds a subscription and stores each state the
+    daemon pushes; ``time_left`` counts down locally from the last state,
+    so the daemon only sends events on transitions. Controls are sent as
+    one-shot requests. Sessions are saved and sounds played by the daemon,
+    so ``tick`` and ``should_play_warning`` never report anything.
+    """
+
+    def __init__(self, socket_path: Optional[Path] = None,
+                 on_change: Optional[Callable[[], None]] = None):
+        self.socket_path = socket_path or get_socket_path()
+        self.on_change = on_change
+        self.last_error: Optional[str] = None
+        self._state: Dict = {}
+        self._received_at = 0.0
+        self._sock: Optional[socket.socket] = None
+        self._thread = threading.Thread(target=self._listen, name="pymodoro-remote", daemon=True)
+
+    def connect(self) -> "RemoteTimer":
+        """Subscribe to the daemon and load its current state. Raises OSError if it is not running."""
+        self._sock = connect(self.socket_path)
+        self._sock.sendall(b'{"cmd": "subscribe"}\n')
+        self._sock.settimeout(None)
+        self._messages = _messages(self._sock)
+        self._apply(next(self._messages))
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self._sock.close()
+
+    def _listen(self) -> None:
+        try:
+            for message in self._messages:
+                self._apply(message)
+            self.last_error = "Lost connection to the daemon"
+        except (OSError, ValueError):
+            self.last_error = "Lost connection to the daemon"
+        self._state = {**self._state, "running": False, "time_left": self.time_left}
+        if self.on_change:
+            self.on_change()
+
+    def _apply(self, message: Dict) -> None:
+        if "state" in message:
+            self._received_at = time.monotonic()
+            self._state = message["state"]
+            if self.on_change:
+                self.on_change()
+
+    def _command(self, cmd: str, **fields) -> None:
+        try:
+            response = request(cmd, self.socket_path, **fields)
+        except (OSError, ValueError) as exc:
+            self.last_error = f"Daemon unavailable: {exc}"
+            return
+        if not response.get("ok"):
+            self.last_error = response.get("error")
+        self._apply(response)
+
+    @property
+    def current_session(self) -> SessionType:
+        return SessionType[self._state["session"].upper()]
+
+    @property
+    def settings(self) -> Dict[SessionType, int]:
+        return {SessionType[name.upper()]: seconds for name, seconds in self._state["durations"].items()}
+
+    @property
+    def time_left(self) -> float:
+        time_left = self._state["time_left"]
+        if self._state["running"]:
+            time_left -= time.monotonic() - self._received_at
+        return max(0.0, time_left)
+
+    @property
+    def is_running(self) -> bool:
+        return self._state["running"]
+
+    @property
+    def is_muted(self) -> bool:
+        return self._state["muted"]
+
+    @property
+    def pomodoros_completed(self) -> int:
+        return self._state["pomodoros"]
+
+    def next_event_in(self) -> Optional[float]:
+        # Alerts are the daemon's business; only redraw when the session ends
+        return self.time_left if self.is_running else None
+
+    def start(self) -> None:
+        self._command("start")
+
+    def pause(self) -> None:
+        self._command("pause")
+
+    def toggle_pause(self) -> None:
+        self._command("toggle")
+
+    def toggle_mute(self) -> None:
+        self._command("mute")
+
+    def reset(self) -> None:
+        self._command("reset")
+
+    def next_session(self, skip: bool = False) -> None:
+        self._command("skip")
+
+    def tick(self) -> bool:
+        return False
+
+    def should_play_warning(self) -> bool:
+        return False
@@ -0,0 +1,305 @@
+# src/pymodoro/daemon.py
+import json
+import os
+import selectors
+import socket
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from pymodoro.audio import AudioWorker
+from pymodoro.control import COMMANDS, connect, get_socket_path
+from pymodoro.persistence import PersistenceWorker
+from pymodoro.scheduler import LoopScheduler
+from pymodoro.timer import PomodoroTimer, SessionType
+
+# A subscriber that falls this far behind is disconnected rather than buffered
+MAX_OUTPUT_BUFFER = 256 * 1024
+MAX_REQUEST_LINE = 4096
+
+
+def timer_state(timer: PomodoroTimer) -> Dict:
+    """Snapshot of the timer as sent to clients."""
+    return {
+        "session": timer.current_session.name.lower(),
+        "time_left": round(timer.time_left, 3),
+        "running": timer.is_running,
+        "muted": timer.is_muted,
+        "pomodoros": timer.pomodoros_completed,
+        "durations": {session.name.lower(): seconds for session, seconds in timer.settings.items()},
+        "alerts": [str(alert) for alert in timer.alerts],
+        "warning_pending": timer.warning_pending,
+        "at": round(time.time(), 3),
+    }
+
+
+class _Client:
+    __slots__ = ("sock", "inbox", "outbox", "subscribed", "ticks")
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.inbox = b""
+        self.outbox = bytearray()
+        self.subscribed = False
+        self.ticks = False
+
+
+class PomodoroDaemon:
+    """
+    Headless timer served over a Unix socket.
+
+    One thread multiplexes the listening socket, every client connection
+    and a wake pipe with ``selectors``, and sleeps until the next
+    second, warning or session end (only until the warning or session end
+    when no client asked for ticks). Requests and responses are JSON
+    lines: ``{"cmd": "pause"}`` is answered with ``{"ok": true, "state":
+    {...}}``. A ``subscribe`` connection stays open and receives
+    ``{"event": ..., "state": {...}}`` on every transition, so idle
+    clients cost one socket and no wakeups. Sessions are saved and sounds
+    played exactly as in the interactive timer.
+    """
+
+    def __init__(self, timer: PomodoroTimer, persistence: PersistenceWorker, audio: AudioWorker,
+                 socket_path: Optional[Path] = None):
+        self.timer = timer
+        self.persistence = persistence
+        self.audio = audio
+        self.socket_path = Path(socket_path or get_socket_path())
+        self.scheduler = LoopScheduler(timer, per_second=False)
+        self._selector = selectors.DefaultSelector()
+        self._clients: Dict[int, _Client] = {}
+        self._server: Optional[socket.socket] = None
+        self._wake_r = self._wake_w = None
+        self._running = False
+        self._last_tick = None
+        timer.add_listener(self._broadcast)
+
+    def _bind(self) -> socket.socket:
+        self.socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if self.socket_path.exists():
+            try:
+                connect(self.socket_path, timeout=0.5).close()
+            except OSError:
+                self.socket_path.unlink()  # Left behind by a daemon that did not shut down
+            else:
+                raise RuntimeError(f"A pymodoro daemon is already listening on {self.socket_path}")
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(str(self.socket_path))
+        os.chmod(self.socket_path, 0o600)
+        server.listen(64)
+        server.setblocking(False)
+        return server
+
+    def wake(self) -> None:
+        """Interrupt the select; safe to call from a signal handler."""
+        try:
+            os.write(self._wake_w, b"\0")
+        except (BlockingIOError, OSError, TypeError):
+            pass
+
+    def shutdown(self) -> None:
+        """Stop serving after the current iteration; safe to call from a signal handler."""
+        self._running = False
+        self.wake()
+
+    def listen(self) -> None:
+        """Bind the socket. Raises RuntimeError if another daemon is already serving it."""
+        if self._server is None:
+            self._server = self._bind()
+
+    def serve_forever(self) -> None:
+        """Serve clients and run the timer until ``shutdown`` is called."""
+        self.listen()
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+        self._selector.register(self._server, selectors.EVENT_READ)
+        self._selector.register(self._wake_r, selectors.EVENT_READ)
+        self._running = True
+        try:
+            while self._running:
+                for key, mask in self._selector.select(self.scheduler.next_timeout()):
+                    if key.fileobj is self._server:
+                        self._accept()
+                    elif key.fileobj == self._wake_r:
+                        self._drain_wake()
+                    else:
+                        client = self._clients.get(key.fd)
+                        if client and mask & selectors.EVENT_WRITE:
+                            self._flush(client)
+                        if client and mask & selectors.EVENT_READ:
+                            self._read(client)
+                self._advance()
+        finally:
+            self._close()
+
+    def _drain_wake(self) -> None:
+        try:
+            while os.read(self._wake_r, 512):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _advance(self) -> None:
+        """Play the warning and finish sessions that are due, then push ticks."""
+        timer = self.timer
+        if timer.should_play_warning():
+            self.audio.play_warning(timer.is_muted)
+        started = timer.session_start_time  # tick() moves it on to the next session
+        if timer.tick():
+            if timer.current_session == SessionType.WORK:
+                self.audio.play_break_end(timer.is_muted)
+            else:
+                self.persistence.submit_session(timer.settings[SessionType.WORK] // 60, start_time=started)
+                self.audio.play_work_end(timer.is_muted)
+        tick_clients = [client for client in self._clients.values() if client.ticks]
+        self.scheduler.per_second = bool(tick_clients)
+        # One tick per displayed second, however often client traffic wakes the loop
+        tick = (timer.current_session, int(timer.time_left))
+        if tick_clients and timer.is_running and tick != self._last_tick:
+            self._last_tick = tick
+            self._send_all(tick_clients, {"event": "tick", "state": timer_state(timer)})
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                sock, _ = self._server.accept()
+            except BlockingIOError:
+                return
+            sock.setblocking(False)
+            self._clients[sock.fileno()] = _Client(sock)
+            self._selector.register(sock, selectors.EVENT_READ)
+
+    def _read(self, client: _Client) -> None:
+        try:
+            data = client.sock.recv(65536)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self._drop(client)
+            return
+        client.inbox += data
+        *lines, client.inbox = client.inbox.split(b"\n")
+        if len(client.inbox) > MAX_REQUEST_LINE:
+            self._drop(client)
+            return
+        for line in lines:
+            if line.strip():
+                self._send(client, self._handle(client, line))
+
+    def _handle(self, client: _Client, line: bytes) -> Dict:
+        """Apply one request and build its response."""
+        try:
+            request = json.loads(line)
+            cmd = request["cmd"]
+        except (ValueError, TypeError, KeyError):
+            return {"ok": False, "error": "expected a JSON object with a cmd field"}
+        if cmd not in COMMANDS:
+            return {"ok": False, "error": f"unknown command: {cmd}"}
+
+        timer = self.timer
+        if cmd == "start":
+            if timer.session_start_time is None:
+                timer.start()
+            else:
+                timer.resume()
+        elif cmd == "pause":
+            timer.pause()
+        elif cmd == "toggle":
+            timer.toggle_pause()
+        elif cmd == "skip":
+            self._skip()
+        elif cmd == "reset":
+            timer.reset()
+        elif cmd == "mute":
+            if request.get("muted") is None or bool(request["muted"]) != timer.is_muted:
+                timer.toggle_mute()
+        elif cmd == "subscribe":
+            client.subscribed = True
+            client.ticks = bool(request.get("ticks"))
+        elif cmd == "shutdown":
+            self._running = False
+
+        response = {"ok": True, "state": timer_state(timer)}
+        if "id" in request:
+            response["id"] = request["id"]
+        return response
+
+    def _skip(self) -> None:
+        """Skip the current session, saving a skipped work session as the TUI does."""
+        timer = self.timer
+        skipped = timer.current_session
+        if skipped == SessionType.WORK:
+            self.persistence.submit_session(timer.settings[SessionType.WORK] // 60,
+                                            start_time=timer.session_start_time)
+        timer.next_session(skip=True)
+        if skipped == SessionType.WORK:
+            self.audio.play_work_end(timer.is_muted)
+        else:
+            self.audio.play_break_end(timer.is_muted)
+
+    def _broadcast(self, event: str) -> None:
+        """Timer listener: push a transition to every subscriber."""
+        subscribers = [client for client in self._clients.values() if client.subscribed]
+        if subscribers:
+            self._send_all(subscribers, {"event": event, "state": timer_state(self.timer)})
+
+    def _send_all(self, clients: List[_Client], message: Dict) -> None:
+        # Serialize once however many clients receive the message
+        data = json.dumps(message).encode() + b"\n"
+        for client in clients:
+            self._write(client, data)
+
+    def _send(self, client: _Client, message: Dict) -> None:
+        self._write(client, json.dumps(message).encode() + b"\n")
+
+    def _write(self, client: _Client, data: bytes) -> None:
+        pending = bool(client.outbox)
+        client.outbox += data
+        if len(client.outbox) > MAX_OUTPUT_BUFFER:
+            self._drop(client)
+        elif not pending:
+            self._flush(client)
+
+    def _flush(self, client: _Client) -> None:
+        try:
+            sent = client.sock.send(client.outbox)
+        except BlockingIOError:
+            sent = 0
+        except OSError:
+            self._drop(client)
+            return
+        del client.outbox[:sent]
+        events = selectors.EVENT_READ | (selectors.EVENT_WRITE if client.outbox else 0)
+        self._selector.modify(client.sock, events)
+
+    def _drop(self, client: _Client) -> None:
+        if self._clients.pop(client.sock.fileno(), None) is not None:
+            self._selector.unregister(client.sock)
+            client.sock.close()
+
+    def _close(self) -> None:
+        for client in list(self._clients.values()):
+            # Best effort: deliver queued responses (e.g. to shutdown) before closing
+            try:
+                client.sock.setblocking(True)
+                client.sock.settimeout(0.5)
+                client.sock.sendall(client.outbox)
+            except OSError:
+                pass
+            self._drop(client)
+        if self._server is not None:
+            self._selector.unregister(self._server)
+            self._server.close()
+            try:
+                self.socket_path.unlink()
+            except FileNotFoundError:
+                pass
+        if self._wake_r is not None:
+            self._selector.unregister(self._wake_r)
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+            self._wake_r = self._wake_w = None
+        self._selector.close()
@@ -0,0 +1,235 @@
+# src/pymodoro/events.py
+import os
+import struct
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Iterator, List, NamedTuple, Optional, Tuple
+
+from pymodoro.session_model import DayLog, Session
+from pymodoro.storage import get_log_dir
+from pymodoro.timer import PomodoroTimer, SessionType
+
+MAGIC = b"PMEV"
+VERSION = 1
+_HEADER = struct.Struct("<4sI")
+
+# Record kinds, by code. Apart from "snapshot" these are the timer's listener events.
+EVENTS = ("snapshot", "start", "pause", "resume", "reset", "session", "skip")
+_KINDS = {name: code for code, name in enumerate(EVENTS) if code}
+SNAPSHOT = 0
+
+# Little-endian records, tagged by their first byte:
+#   event, 24 bytes:    kind, time left after the event (s), monotonic (s), wall clock (µs)
+#   snapshot, 48 bytes: kind, session, running, long break frequency, pomodoros,
+#                       work/short/long durations (s), time left, monotonic, wall clock,
+#                       session start (µs, or _NO_START)
+_EVENT = struct.Struct("<Bxxxfdq")
+_SNAPSHOT = struct.Struct("<BBBBHxxIIIfdqq")
+_NO_START = -(2 ** 63)
+
+_SESSIONS = list(SessionType)
+_EPOCH = datetime(1970, 1, 1)  # Wall stamps are naive local time, like session starts
+
+
+def _to_micros(when: datetime) -> int:
+    return (when.replace(tzinfo=None) - _EPOCH) // timedelta(microseconds=1)
+
+
+def _from_micros(micros: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=micros)
+
+
+def get_events_file_path(log_date: Optional[date] = None, timer_name: Optional[str] = None) -> Path:
+    """Get the path for a day's timer event stream."""
+    log_date = log_date or date.today()
+    return get_log_dir(timer_name) / f"{log_date.isoformat()}.events"
+
+
+def iter_records(data: bytes) -> Iterator[tuple]:
+    """Yield the unpacked records of an event file, stopping at a torn or unknown record."""
+    if data[:_HEADER.size] != _HEADER.pack(MAGIC, VERSION):
+        return
+    offset = _HEADER.size
+    while offset < len(data):
+        kind = data[offset]
+        layout = _SNAPSHOT if kind == SNAPSHOT else _EVENT
+        if kind >= len(EVENTS) or offset + layout.size > len(data):
+            return
+        yield layout.unpack_from(data, offset)
+        offset += layout.size
+
+
+def valid_length(data: bytes) -> int:
+    """Length of the readable prefix of an event file: its header and whole records."""
+    if data[:_HEADER.size] != _HEADER.pack(MAGIC, VERSION):
+        return 0
+    return _HEADER.size + sum(
+        (_SNAPSHOT if record[0] == SNAPSHOT else _EVENT).size for record in iter_records(data)
+    )
+
+
+def append_events(payload: bytes, log_date: Optional[date] = None, timer_name: Optional[str] = None,
+                  repair: bool = False) -> None:
+    """Append records to a day's event file, with fsync.
+
+    With ``repair`` a torn final record (e.g. after a crash mid-write) is
+    cut off first, and an unreadable file is moved aside to
+    ``.events.corrupt``; do this the first time a process writes a file.
+    """
+    events_file = get_events_file_path(log_date, timer_name)
+    with open(events_file, 'a+b') as f:
+        size = f.seek(0, os.SEEK_END)
+        if repair and size:
+            f.seek(0)
+            valid = valid_length(f.read())
+            if valid == 0:
+                f.close()
+                events_file.replace(events_file.with_suffix('.events.corrupt'))
+                return append_events(payload, log_date, timer_name)
+            if valid < size:
+                f.truncate(valid)
+            size = valid
+        if size == 0:
+            payload = _HEADER.pack(MAGIC, VERSION) + payload
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+class EventRecorder:
+    """
+    Record a timer's transitions as an append-only stream of event records.
+
+    Each start, pause, resume, reset, session change and skip becomes a
+    24-byte record stamped with the monotonic and wall clocks, handed to
+    ``sink(log_date, payload)`` (normally the persistence worker's queue).
+    The first record a process writes to a day is preceded by a snapshot
+    of the full timer state, so every day's stream replays on its own,
+    without the days before it.
+    """
+
+    def __init__(self, timer: PomodoroTimer, sink: Callable[[date, bytes], None]):
+        self.timer = timer
+        self.sink = sink
+        self._day: Optional[date] = None
+        self._before = self._snapshot()  # State before the next event
+        timer.add_listener(self._on_event)
+
+    def _snapshot(self) -> bytes:
+        timer = self.timer
+        start = timer.session_start_time
+        return _SNAPSHOT.pack(
+            SNAPSHOT, _SESSIONS.index(timer.current_session), timer.is_running,
+            min(timer.long_break_frequency, 255), timer.pomodoros_completed,
+            *(timer.settings[session] for session in _SESSIONS), timer.time_left,
+            timer.clock.monotonic(), _to_micros(timer.clock.now()),
+            _NO_START if start is None else _to_micros(start),
+        )
+
+    def _on_event(self, event: str) -> None:
+        kind = _KINDS.get(event)
+        if kind is None:
+            return  # Mute and warnings don't change the timeline
+        timer = self.timer
+        now = timer.clock.now()
+        payload = _EVENT.pack(kind, timer.time_left, timer.clock.monotonic(), _to_micros(now))
+        if now.date() != self._day:
+            self._day = now.date()
+            payload = self._before + payload
+        self.sink(self._day, payload)
+        self._before = self._snapshot()
+
+
+class TimelineEntry(NamedTuple):
+    """The timer's state right after one recorded event."""
+    at: datetime
+    event: str
+    session: SessionType
+    running: bool
+    time_left: float
+    pomodoros: int
+
+
+class DayReplay(NamedTuple):
+    day_log: DayLog
+    timeline: List[TimelineEntry]
+
+
+class TimerReplay:
+    """
+    Rebuild timer state by applying event records in order.
+
+    Completed work sessions (run out or skipped, as the live timer logs
+    them) are collected as ``Session`` objects started when the work
+    session began, matching the day's live log. Events before the first
+    snapshot are ignored.
+    """
+
+    def __init__(self):
+        self.sessions: List[Session] = []
+        self.timeline: List[TimelineEntry] = []
+        self.session: Optional[SessionType] = None
+        self.running = False
+        self.frequency = 4
+        self.pomodoros = 0
+        self.durations: Tuple[int, int, int] = (0, 0, 0)
+        self.time_left = 0.0
+        self.session_start: Optional[datetime] = None
+
+    def apply(self, record: tuple) -> None:
+        kind = record[0]
+        if kind == SNAPSHOT:
+            (_, session, self.running, self.frequency, self.pomodoros, *durations,
+             self.time_left, _, _, start) = record
+            self.session = _SESSIONS[session]
+            self.durations = tuple(durations)
+            self.session_start = None if start == _NO_START else _from_micros(start)
+            return
+        if self.session is None:
+            return
+        _, self.time_left, _, wall = record
+        at = _from_micros(wall)
+        if kind == 1:  # start
+            self.running = True
+            self.session_start = self.session_start or at
+        elif kind == 2:  # pause
+            self.running = False
+        elif kind == 3:  # resume
+            self.running = True
+        elif kind == 4:  # reset
+            self.session_start = at
+        else:  # session ran out, or skip
+            if self.session == SessionType.WORK:
+                self.sessions.append(Session.model_construct(
+                    start=(self.session_start or at).replace(microsecond=0),
+                    duration_minutes=self.durations[0] // 60, notes=None,
+                ))
+                self.pomodoros += 1
+                long_break = self.pomodoros % self.frequency == 0
+                self.session = SessionType.LONG_BREAK if long_break else SessionType.SHORT_BREAK
+            else:
+                self.session = SessionType.WORK
+            self.running = self.running or kind == 6
+            elapsed = self.durations[_SESSIONS.index(self.session)] - self.time_left
+            self.session_start = at - timedelta(seconds=elapsed) if self.running else None
+        self.timeline.append(TimelineEntry(at, EVENTS[kind], self.session, self.running,
+                                           self.time_left, self.pomodoros))
+
+
+def replay(data: bytes, log_date: date) -> DayReplay:
+    """Replay one day's event file contents into its DayLog and timeline."""
+    replayer = TimerReplay()
+    for record in iter_records(data):
+        replayer.apply(record)
+    return DayReplay(DayLog.model_construct(log_date=log_date, sessions=replayer.sessions),
+                     replayer.timeline)
+
+
+def replay_day(log_date: Optional[date] = None, timer_name: Optional[str] = None) -> DayReplay:
+    """Rebuild a day's (default today) DayLog and timeline from its event file."""
+    log_date = log_date or date.today()
+    try:
+        data = get_events_file_path(log_date, timer_name).read_bytes()
+    except FileNotFoundError:
+        data = b""
+    return replay(data, log_date)
@@ -0,0 +1,186 @@
+# src/pymodoro/history.py
+import os
+import sqlite3
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from pymodoro.storage import get_log_dir, get_state_dir, read_day_log
+
+SCHEMA_VERSION = 2
+
+# (yaml mtime_ns, yaml size, journal mtime_ns, journal size); -1 when missing
+Signature = Tuple[int, int, int, int]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    day TEXT PRIMARY KEY,
+    yaml_mtime_ns INTEGER NOT NULL,
+    yaml_size INTEGER NOT NULL,
+    journal_mtime_ns INTEGER NOT NULL,
+    journal_size INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS days (
+    day TEXT PRIMARY KEY,
+    sessions INTEGER NOT NULL,
+    minutes INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS hours (
+    day TEXT NOT NULL,
+    hour INTEGER NOT NULL,
+    sessions INTEGER NOT NULL,
+    minutes INTEGER NOT NULL,
+    PRIMARY KEY (day, hour)
+) WITHOUT ROWID;
+"""
+
+
+@dataclass
+class DaySummary:
+    """Totals for one day of the history."""
+    day: date
+    sessions: int
+    minutes: int
+
+
+def _scan_log_dir(log_dir: Path) -> Dict[str, Signature]:
+    """Stat every daily YAML log and journal, grouped by ISO day."""
+    found: Dict[str, List[int]] = {}
+    with os.scandir(log_dir) as entries:
+        for entry in entries:
+            day, _, kind = entry.name.partition('.')
+            if kind not in ('yaml', 'journal'):
+                continue
+            try:
+                date.fromisoformat(day)
+                stat = entry.stat()
+            except (ValueError, OSError):
+                continue
+            signature = found.setdefault(day, [-1, -1, -1, -1])
+            offset = 0 if kind == 'yaml' else 2
+            signature[offset:offset + 2] = [stat.st_mtime_ns, stat.st_size]
+    return {day: tuple(signature) for day, signature in found.items()}
+
+
+class HistoryIndex:
+    """
+    Persistent SQLite index of daily totals built from the log files.
+
+    Each day's YAML log and journal are tracked by mtime and size, and
+    ``refresh`` re-reads only the days whose files changed, so edits made
+    with ``--open_log`` are picked up on the next query. Days are keyed by
+    ISO date, so range queries are B-tree range scans. A named timer's
+    logs get an index of their own.
+    """
+
+    def __init__(self, path: Optional[Path] = None, timer_name: Optional[str] = None):
+        self.timer_name = timer_name
+        self.path = path or get_state_dir() / (f"history-{timer_name}.sqlite3" if timer_name else "history.sqlite3")
+        # Totals are read through read_day_log, which resolves this same directory
+        self.log_dir = get_log_dir(timer_name)
+        self._conn = sqlite3.connect(self.path)
+        self._ensure_schema()
+
+    def _ensure_schema(self) -> None:
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            # The index is derived data; rebuild it rather than migrate
+            with self._conn:
+                for (table,) in self._conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table'"
+                ).fetchall():
+                    self._conn.execute(f"DROP TABLE {table}")
+                self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def refresh(self) -> int:
+        """Reindex days whose log files changed since the last refresh.
+
+        Returns the number of days that were (re)indexed or dropped.
+        """
+        on_disk = _scan_log_dir(self.log_dir)
+        indexed = {
+            row[0]: tuple(row[1:])
+            for row in self._conn.execute("SELECT * FROM files")
+        }
+        stale = [day for day, signature in on_disk.items() if indexed.get(day) != signature]
+        removed = [day for day in indexed if day not in on_disk]
+
+        with self._conn:
+            for day in removed:
+                self._forget_day(day)
+            for day in stale:
+                self._forget_day(day)
+                self._index_day(day, on_disk[day])
+        return len(stale) + len(removed)
+
+    def _forget_day(self, day: str) -> None:
+        self._conn.execute("DELETE FROM files WHERE day = ?", (day,))
+        self._conn.execute("DELETE FROM days WHERE day = ?", (day,))
+        self._conn.execute("DELETE FROM hours WHERE day = ?", (day,))
+
+    def _index_day(self, day: str, signature: Signature) -> None:
+        try:
+            sessions = read_day_log(date.fromisoformat(day), self.timer_name).sessions
+        except (ValueError, OSError):
+            # Unreadable days count as empty until their files change again
+            sessions = []
+        self._conn.execute("INSERT INTO files VALUES (?, ?, ?, ?, ?)", (day, *signature))
+        self._conn.execute(
+            "INSERT INTO days VALUES (?, ?, ?)",
+            (day, len(sessions), sum(session.duration_minutes for session in sessions))
+        )
+        # Partial aggregates by hour of day, so any rollup is a scan of small rows
+        hours: Dict[int, List[int]] = {}
+        for session in sessions:
+            bucket = hours.setdefault(session.start.hour, [0, 0])
+            bucket[0] += 1
+            bucket[1] += session.duration_minutes
+        self._conn.executemany(
+            "INSERT INTO hours VALUES (?, ?, ?, ?)",
+            ((day, hour, count, minutes) for hour, (count, minutes) in hours.items())
+        )
+
+    def count(self, since: date, until: date) -> int:
+        """Number of sessions between two dates, inclusive."""
+        return self._totals(since, until)[0]
+
+    def total_minutes(self, since: date, until: date) -> int:
+        """Minutes of work between two dates, inclusive."""
+        return self._totals(since, until)[1]
+
+    def _totals(self, since: date, until: date) -> Tuple[int, int]:
+        row = self._conn.execute(
+            "SELECT COALESCE(SUM(sessions), 0), COALESCE(SUM(minutes), 0) "
+            "FROM days WHERE day BETWEEN ? AND ?",
+            (since.isoformat(), until.isoformat())
+        ).fetchone()
+        return row[0], row[1]
+
+    def days(self, since: date, until: date) -> List[DaySummary]:
+        """Per-day totals between two dates, inclusive, in date order."""
+        rows = self._conn.execute(
+            "SELECT day, sessions, minutes FROM days WHERE day BETWEEN ? AND ? ORDER BY day",
+            (since.isoformat(), until.isoformat())
+        )
+        return [DaySummary(date.fromisoformat(day), sessions, minutes) for day, sessions, minutes in rows]
+
+    def iter_hours(self, since: date, until: date) -> Iterator[Tuple[date, int, int, int]]:
+        """Stream (day, hour, sessions, minutes) rows between two dates in order."""
+        rows = self._conn.execute(
+            "SELECT day, hour, sessions, minutes FROM hours "
+            "WHERE day BETWEEN ? AND ? ORDER BY day, hour",
+            (since.isoformat(), until.isoformat())
+        )
+        for day, hour, sessions, minutes in rows:
+            yield date.fromisoformat(day), hour, sessions, minutes
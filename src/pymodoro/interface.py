@@ -1,17 +1,53 @@
 # src/pymodoro/interface.py
 from rich.console import Console
+from pymodoro.ui.components import ProgressBar, TabBar
+from pymodoro.ui.layout import Dock
 from pymodoro.ui.screens import ScreenManager
 
 console = Console()
 
 class PomodoroUI:
-    def __init__(self, timer):
+    def __init__(self, timer, timer_font=None):
         self.timer = timer
-        self.screen_manager = ScreenManager()
+        self.screen_manager = ScreenManager(timer_font)
         self._cache = {}
     
-    def get_renderable(self, confirmation_type=None):
-        """Get the current screen renderable."""
+    def resize(self, width, height):
+        """Adopt the layout for a terminal size (measured once per resize)."""
+        if self.screen_manager.resize(width, height):
+            self._cache = {}
+    
+    def set_timer(self, timer):
+        """Show another timer, keeping the layout and fragment cache."""
+        self.timer = timer
+        self._cache = {}
+        self.screen_manager.main_screen.invalidate()
+    
+    def visible_state(self, confirmation_type=None, notice=None):
+        """Everything the current frame shows; equal states render identically."""
+        session_type = self.timer.current_session
+        time_left = self.timer.time_left
+        total_time = self.timer.settings[session_type]
+        progress_cells = ProgressBar.filled_cells(
+            time_left, total_time, self.screen_manager.theme_manager.dimensions.progress_bar_width
+        )
+        return (
+            session_type,
+            self.timer.pomodoros_completed,
+            not self.timer.is_running,
+            self.timer.is_muted,
+            int(time_left),  # Round to seconds, as MM:SS shows
+            progress_cells,
+            confirmation_type,
+            notice
+        )
+    
+    def get_renderable(self, confirmation_type=None, notice=None):
+        """Get the current screen renderable.
+
+        ``notice`` is a short status message (e.g. a save failure) shown
+        on the main screen in place of the help hint.
+        """
         # Extract timer state
         session_type = self.timer.current_session
         time_left = self.timer.time_left
@@ -21,14 +57,7 @@ class PomodoroUI:
         is_muted = self.timer.is_muted
         
         # Create cache key based on meaningful state
-        cache_key = (
-            session_type,
-            pomodoros_completed,
-            is_paused,
-            is_muted,
-            int(time_left),  # Round to seconds
-            confirmation_type
-        )
+        cache_key = self.visible_state(confirmation_type, notice)
         
         # Check cache
         if cache_key in self._cache:
@@ -52,10 +81,115 @@ class PomodoroUI:
                 total_time=total_time,
                 pomodoros_completed=pomodoros_completed,
                 is_paused=is_paused,
-                is_muted=is_muted
+                is_muted=is_muted,
+                notice=notice
             )
         
         # Cache the result
         self._cache = {cache_key: screen}  # Clear old cache entries
         
-        return screen
\ No newline at end of file
+        return screen
+
+
+class TimerGroupUI:
+    """
+    Tabbed or stacked view of a TimerGroup.
+    
+    The tabbed view shows the current timer full size under a tab bar.
+    One PomodoroUI (and so one fragment cache and retained tree) is
+    pointed at whichever timer is current, so a frame costs the same as
+    with a single timer however many run in the background, and the tab
+    bar is only rebuilt on transitions. The stacked view shows every timer
+    as one status line.
+    """
+    
+    def __init__(self, group, timer_font=None, stacked=False):
+        self.group = group
+        self.stacked = stacked
+        self.ui = PomodoroUI(group.current, timer_font)
+        self.tab_bar = TabBar()
+        self._tabs = (None, None)  # (revision, Text)
+    
+    @property
+    def screen_manager(self):
+        return self.ui.screen_manager
+    
+    def resize(self, width, height):
+        # The tab bar takes the top row
+        self.ui.resize(width, height - 1)
+    
+    def toggle_view(self):
+        self.stacked = not self.stacked
+    
+    def visible_state(self, confirmation_type=None, notice=None):
+        """Everything the current frame shows; equal states render identically."""
+        if self.ui.timer is not self.group.current:
+            self.ui.set_timer(self.group.current)
+        if self.stacked:
+            return ('stacked', self.group.active, confirmation_type, notice, tuple(
+                (timer.current_session, timer.pomodoros_completed, timer.is_running,
+                 timer.is_muted, int(timer.time_left))
+                for timer in self.group
+            ))
+        return ('tabbed', self.group.revision, self.group.active,
+                self.ui.visible_state(confirmation_type, notice))
+    
+    def _tab_bar(self):
+        revision, bar = self._tabs
+        if revision != (self.group.revision, self.group.active):
+            theme_manager = self.ui.screen_manager.theme_manager
+            bar = self.tab_bar.render([
+                (timer.name,
+                 theme_manager.get_theme(timer.current_session, not timer.is_running),
+                 theme_manager.get_display_color(timer.current_session, not timer.is_running))
+                for timer in self.group
+            ], self.group.active)
+            self._tabs = ((self.group.revision, self.group.active), bar)
+        return bar
+    
+    def get_renderable(self, confirmation_type=None, notice=None):
+        self.visible_state()  # Follow the current timer
+        if self.stacked:
+            body = self.ui.screen_manager.stacked_screen.render(
+                self.group.timers, self.group.active, confirmation_type or 'main', notice
+            )
+        else:
+            body = self.ui.get_renderable(confirmation_type, notice)
+        return Dock(self._tab_bar(), body)
+
+
+class RenderScheduler:
+    """
+    Redraw the Live display only when what it shows has changed.
+    
+    Rich Live runs with auto refresh off; a frame is emitted when the
+    visible state (MM:SS, progress cells, session, flags, dialog, notice)
+    differs from the last frame, or after a terminal resize, which also
+    switches the UI to the layout for the new size.
+    """
+    
+    def __init__(self, live, ui: PomodoroUI, counter=None):
+        self.live = live
+        self.ui = ui
+        self.counter = counter
+        self._last_state = None
+        self._resized = False
+    
+    def request_redraw(self):
+        """Force the next render() to draw, e.g. after SIGWINCH."""
+        self._resized = True
+    
+    def render(self, confirmation_type=None, notice=None) -> bool:
+        """Draw a frame if needed; return whether one was drawn."""
+        if self._resized:
+            # Measure the terminal once per resize, before computing the state
+            self.ui.resize(*self.live.console.size)
+        state = self.ui.visible_state(confirmation_type, notice)
+        if state == self._last_state and not self._resized:
+            return False
+        self._last_state = state
+        self._resized = False
+        self.live.update(self.ui.get_renderable(confirmation_type, notice), refresh=True)
+        if self.counter:
+            self.counter.record_frame()
+        return True
@@ -1,25 +1,151 @@
 # src/pymodoro/keyboard.py
+import codecs
+import os
 import sys
 import termios
+import time
 import tty
 import select
+from collections import deque
+from typing import List, Optional
+
+ESC = "\x1b"
+# A lone ESC is only reported once this long has passed without the rest
+# of an escape sequence arriving
+ESC_TIMEOUT = 0.05
+
+# Escape sequences (after ESC) mapped to key names
+SEQUENCES = {
+    "[A": "up", "[B": "down", "[C": "right", "[D": "left",
+    "[H": "home", "[F": "end", "OA": "up", "OB": "down",
+    "OC": "right", "OD": "left", "OH": "home", "OF": "end",
+    "[1~": "home", "[2~": "insert", "[3~": "delete", "[4~": "end",
+    "[5~": "page_up", "[6~": "page_down", "[Z": "shift_tab",
+    "OP": "f1", "OQ": "f2", "OR": "f3", "OS": "f4",
+}
+
+class KeyDecoder:
+    """
+    Decode raw terminal input into key events.
+    
+    Printable and control characters are reported as themselves, escape
+    sequences (arrows, function keys, ...) as a single name such as "up",
+    and ESC followed by a character as "alt+<char>". A lone ESC is held
+    back until ESC_TIMEOUT passes so it is not confused with the start of
+    a sequence split across reads.
+    """
+    
+    def __init__(self, esc_timeout: float = ESC_TIMEOUT):
+        self.esc_timeout = esc_timeout
+        self._utf8 = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._sequence = None   # Characters after ESC while inside a sequence
+        self._esc_at = None     # When the pending sequence started
+    
+    def feed(self, data: bytes, now: float) -> List[str]:
+        """Decode a chunk of input and return the keys it completes."""
+        keys = []
+        for char in self._utf8.decode(data):
+            if self._sequence is None:
+                if char == ESC:
+                    self._sequence, self._esc_at = "", now
+                else:
+                    keys.append(char)
+            elif not self._sequence:
+                if char == ESC:
+                    # ESC ESC: the first one was a lone ESC
+                    keys.append(ESC)
+                    self._esc_at = now
+                elif char in "[O":
+                    self._sequence = char
+                else:
+                    keys.append(f"alt+{char}")
+                    self._sequence = None
+            else:
+                self._sequence += char
+                # CSI sequences end with a byte in @..~; SS3 sequences after one character
+                if self._sequence[0] == "O" or (len(self._sequence) > 1 and "@" <= char <= "~"):
+                    keys.append(SEQUENCES.get(self._sequence, ESC + self._sequence))
+                    self._sequence = None
+        return keys
+    
+    def flush(self, now: float) -> List[str]:
+        """Report a lone ESC (or an unfinished sequence) once it has timed out."""
+        if self._sequence is None or now - self._esc_at < self.esc_timeout:
+            return []
+        sequence, self._sequence = self._sequence, None
+        return [ESC + sequence if sequence else ESC]
+    
+    def pending_timeout(self, now: float) -> Optional[float]:
+        """Seconds until flush() would report a pending ESC, or None."""
+        if self._sequence is None:
+            return None
+        return max(0.0, self._esc_at + self.esc_timeout - now)
 
 class TerminalKeyboard:
     def __init__(self):
         self._original_settings = None
+        self._wake_r, self._wake_w = None, None
+        self._decoder = KeyDecoder()
+        self._keys = deque()
 
     def start(self):
         self._original_settings = termios.tcgetattr(sys.stdin)
         tty.setcbreak(sys.stdin.fileno())
+        # Self-pipe so signal handlers (e.g. SIGWINCH) can interrupt wait()
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
 
     def stop(self):
         if self._original_settings:
             termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self._original_settings)
+        for fd in (self._wake_r, self._wake_w):
+            if fd is not None:
+                os.close(fd)
+        self._wake_r, self._wake_w = None, None
+
+    def wake(self):
+        """Make a pending or the next wait() return immediately. Signal-safe."""
+        try:
+            os.write(self._wake_w, b"\0")
+        except (OSError, TypeError):
+            pass
+
+    def wait(self, timeout=None):
+        """Block until a key is available, wake() is called, or timeout seconds pass (None waits forever)."""
+        esc_timeout = self._decoder.pending_timeout(time.monotonic())
+        if esc_timeout is not None:
+            timeout = esc_timeout if timeout is None else min(timeout, esc_timeout)
+        watched = [sys.stdin] if self._wake_r is None else [sys.stdin, self._wake_r]
+        readable, _, _ = select.select(watched, [], [], timeout)
+        if self._wake_r in readable:
+            try:
+                os.read(self._wake_r, 512)
+            except BlockingIOError:
+                pass
+        return sys.stdin in readable
+
+    def read_keys(self) -> List[str]:
+        """Drain all pending input without blocking and return the decoded keys."""
+        fd = sys.stdin.fileno()
+        chunks = []
+        while select.select([fd], [], [], 0)[0]:
+            chunk = os.read(fd, 4096)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        now = time.monotonic()
+        keys = list(self._keys)
+        self._keys.clear()
+        keys.extend(self._decoder.feed(b"".join(chunks), now))
+        keys.extend(self._decoder.flush(now))
+        return keys
 
     def getch(self):
-        if select.select([sys.stdin], [], [], 0) == ([sys.stdin], [], []):
-            return sys.stdin.read(1)
-        return None
+        """Return the next key, or None if none is pending."""
+        if not self._keys:
+            self._keys.extend(self.read_keys())
+        return self._keys.popleft() if self._keys else None
 
     def __enter__(self):
         self.start()
@@ -0,0 +1,187 @@
+# src/pymodoro/persistence.py
+import queue
+import threading
+from datetime import date, datetime
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from pymodoro.events import EventRecorder, append_events
+from pymodoro.session_model import DayLog, Session
+from pymodoro.storage import append_sessions, load_or_initialize_day_log
+
+_STOP = object()
+
+
+class _Events(NamedTuple):
+    """Event records for one timer's day, queued like sessions."""
+    timer_name: Optional[str]
+    log_date: date
+    payload: bytes
+
+
+class PersistenceWorker:
+    """
+    Write-behind persistence for completed sessions.
+
+    The worker owns today's ``DayLog`` in memory and saves sessions from a
+    background thread, so a slow or full disk never stalls the UI loop.
+    Sessions queued while a write is in flight are coalesced into the next
+    journal append, and failed sessions are retried with the next batch.
+    One worker serves any number of named timers, each with its own log,
+    and also writes their event streams (see ``record_events``).
+    """
+
+    def __init__(self, day_log: Optional[DayLog] = None):
+        self.day_log = day_log or load_or_initialize_day_log()
+        self.last_error: Optional[str] = None
+        self._day_logs: Dict[Optional[str], DayLog] = {None: self.day_log}
+        self._queue: queue.Queue = queue.Queue()
+        self._pending: List[Tuple[Optional[str], Session]] = []
+        self._pending_events: List[_Events] = []
+        self._events_opened: Set[Tuple[Optional[str], date]] = set()
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name="pymodoro-persistence", daemon=True
+        )
+
+    @property
+    def session_count(self) -> int:
+        """Number of sessions recorded today, including unsaved ones."""
+        with self._lock:
+            return self.day_log.session_count
+
+    def _day_log_for(self, timer_name: Optional[str]) -> DayLog:
+        """Today's log for a named timer, loaded on first use. Call with the lock held."""
+        try:
+            return self._day_logs[timer_name]
+        except KeyError:
+            day_log = self._day_logs[timer_name] = load_or_initialize_day_log(timer_name=timer_name)
+            return day_log
+
+    def session_count_for(self, timer_name: Optional[str]) -> int:
+        """Number of sessions a named timer has recorded today, including unsaved ones."""
+        with self._lock:
+            return self._day_log_for(timer_name).session_count
+
+    @property
+    def unsaved_count(self) -> int:
+        """Number of sessions that have not reached the disk yet."""
+        with self._lock:
+            return self._queue.qsize() + len(self._pending)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def submit_session(self, duration_minutes: int = 25, start_time: Optional[datetime] = None, notes: Optional[str] = None,
+                       timer_name: Optional[str] = None) -> Session:
+        """Record a session in memory and queue it for saving. Never blocks."""
+        session = Session(
+            start=start_time or datetime.now(),
+            duration_minutes=duration_minutes,
+            notes=notes
+        )
+        with self._lock:
+            self._day_log_for(timer_name).sessions.append(session)
+        self._queue.put((timer_name, session))
+        return session
+
+    def record_events(self, timer) -> EventRecorder:
+        """Journal every transition of a timer to its day's event file, in the background."""
+        return EventRecorder(timer, lambda log_date, payload: self._queue.put(
+            _Events(timer.name, log_date, payload)
+        ))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued session has been written (or failed)."""
+        if not self._thread.is_alive():
+            self._write_safely(self._drain([]))
+        else:
+            done = threading.Event()
+            self._queue.put(done)
+            if not done.wait(timeout):
+                return False
+        with self._lock:
+            return not self._pending
+
+    def stop(self, timeout: Optional[float] = 5.0) -> bool:
+        """Flush outstanding sessions and stop the worker thread."""
+        flushed = self.flush(timeout)
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+        return flushed
+
+    def _drain(self, batch: list) -> list:
+        """Collect everything already queued behind the first item."""
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                return batch
+
+    def _write_batch(self, batch: list) -> None:
+        """Append all sessions and events in the batch with a single write per file."""
+        try:
+            with self._lock:
+                for item in batch:
+                    if isinstance(item, _Events):
+                        self._pending_events.append(item)
+                    elif isinstance(item, tuple):
+                        self._pending.append(item)
+                pending = list(self._pending)
+                pending_events = list(self._pending_events)
+            if not (pending or pending_events):
+                return
+            # Write without the lock, so submit_session never waits for the disk
+            error = self._write_events(pending_events)
+            by_log: Dict[Optional[str], List[Session]] = {}
+            for timer_name, session in pending:
+                by_log.setdefault(timer_name, []).append(session)
+            for timer_name, sessions in by_log.items():
+                try:
+                    append_sessions(sessions, timer_name=timer_name)
+                except OSError as exc:
+                    error = f"Could not save session log: {exc.strerror or exc}"
+                else:
+                    with self._lock:
+                        self._pending = [item for item in self._pending if item[0] != timer_name]
+            with self._lock:
+                self.last_error = error
+        finally:
+            # Release flush() callers even if the write failed unexpectedly
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    item.set()
+
+    def _write_safely(self, batch: list) -> None:
+        """Write a batch; an unexpected error is reported and its sessions retried with the next batch."""
+        try:
+            self._write_batch(batch)
+        except Exception as exc:  # Keep the worker alive whatever the storage layer raises
+            with self._lock:
+                self.last_error = f"Could not save session log: {exc}"
+
+    def _write_events(self, pending_events: List[_Events]) -> Optional[str]:
+        """Append pending event records, one write per event file; return an error message if any failed."""
+        by_file: Dict[Tuple[Optional[str], date], List[bytes]] = {}
+        for timer_name, log_date, payload in pending_events:
+            by_file.setdefault((timer_name, log_date), []).append(payload)
+        error = None
+        for key, payloads in by_file.items():
+            timer_name, log_date = key
+            try:
+                # A crash may have torn the last record of a file this process hasn't written yet
+                append_events(b"".join(payloads), log_date, timer_name, repair=key not in self._events_opened)
+            except OSError as exc:
+                error = f"Could not save timer events: {exc.strerror or exc}"
+            else:
+                self._events_opened.add(key)
+                with self._lock:
+                    self._pending_events = [item for item in self._pending_events if item[:2] != key]
+        return error
+
+    def _run(self) -> None:
+        while True:
+            batch = self._drain([self._queue.get()])
+            self._write_safely(batch)
+            if _STOP in batch:
+                return
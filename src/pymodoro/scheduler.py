@@ -0,0 +1,154 @@
+# src/pymodoro/scheduler.py
+import heapq
+import itertools
+import math
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from pymodoro.timer import PomodoroTimer
+
+# Land just past a boundary so the woken loop sees the new second/threshold
+_BOUNDARY_SLACK = 0.005
+
+
+class LoopScheduler:
+    """
+    Work out how long the main loop may sleep.
+
+    The display only changes when the shown second changes, so while the
+    timer runs the loop sleeps until the next second boundary or the
+    timer's next scheduled event (an alert or the session end), whichever
+    comes first. While paused it sleeps until a key arrives.
+    """
+
+    def __init__(self, timer: PomodoroTimer, per_second: bool = True,
+                 group: Optional["TimerGroup"] = None):
+        self.timer = timer
+        # Without a display to update, only alerts and the session end matter
+        self.per_second = per_second
+        # With several timers, wake for any timer's events and redraw the current one
+        self.group = group
+
+    def next_timeout(self) -> Optional[float]:
+        """Seconds until the next timer event, or None to wait for input."""
+        timer = self.group.current if self.group else self.timer
+        until_event = (self.group or timer).next_event_in()
+        if until_event is None:
+            return None
+
+        candidates = [until_event]
+        if self.per_second and timer.is_running:
+            # The display shows int(time_left), which changes at whole seconds
+            time_left = max(0.0, timer.time_left)
+            candidates.append(time_left - math.floor(time_left) or 1.0)
+
+        return max(0.0, min(candidates)) + _BOUNDARY_SLACK
+
+
+class TimerGroup:
+    """
+    Named timers in one process, driven by one deadline heap.
+
+    Each running timer has one live heap entry: the monotonic time of its
+    next alert or session end. A timer's listener pushes a fresh entry on
+    every transition (pause, skip, alert...) and older entries are dropped
+    when they surface, so a wakeup costs O(log n) per due timer and
+    nothing for the timers that are not due. All timers must share one
+    clock.
+    """
+
+    def __init__(self, timers: List[PomodoroTimer]):
+        self.timers = list(timers)
+        self.active = 0
+        # Bumped on every transition of any timer; cheap change detection for views
+        self.revision = 0
+        self._heap: List[Tuple[float, int, int]] = []  # (deadline, generation, timer index)
+        self._generations: Dict[int, int] = {}
+        self._counter = itertools.count()
+        for index, timer in enumerate(self.timers):
+            timer.add_listener(lambda event, index=index: self._changed(index))
+            self.schedule(index)
+
+    def __len__(self) -> int:
+        return len(self.timers)
+
+    def __iter__(self) -> Iterator[PomodoroTimer]:
+        return iter(self.timers)
+
+    @property
+    def current(self) -> PomodoroTimer:
+        """The timer shown and controlled by the keyboard."""
+        return self.timers[self.active]
+
+    def select(self, index: int) -> bool:
+        """Make another timer current (wrapping around); return whether it changed."""
+        index %= len(self.timers)
+        if index == self.active:
+            return False
+        self.active = index
+        self.revision += 1
+        return True
+
+    def _changed(self, index: int) -> None:
+        self.revision += 1
+        self.schedule(index)
+
+    def schedule(self, index: int) -> None:
+        """(Re)queue a timer at its next event; a paused timer is left out of the heap."""
+        timer = self.timers[index]
+        generation = self._generations[index] = next(self._counter)
+        until_event = timer.next_event_in()
+        if until_event is not None:
+            heapq.heappush(self._heap, (timer.clock.monotonic() + until_event, generation, index))
+
+    def _peek(self) -> Optional[float]:
+        heap = self._heap
+        while heap and heap[0][1] != self._generations[heap[0][2]]:
+            heapq.heappop(heap)  # Superseded by a later transition
+        return heap[0][0] if heap else None
+
+    def next_event_in(self) -> Optional[float]:
+        """Seconds until any timer's next alert or session end, or None if all are paused."""
+        deadline = self._peek()
+        if deadline is None:
+            return None
+        return max(0.0, deadline - self.current.clock.monotonic())
+
+    def pop_due(self) -> List[int]:
+        """
+        Remove and return the indexes of timers whose next event has come.
+
+        Call ``schedule`` for each once it has been handled; transitions
+        reschedule a timer anyway, but a timer woken a hair early has none.
+        """
+        now = self.current.clock.monotonic()
+        due = []
+        while (deadline := self._peek()) is not None and deadline <= now:
+            _, _, index = heapq.heappop(self._heap)
+            self._generations[index] = -1
+            due.append(index)
+        return due
+
+
+class LoopCounter:
+    """Count main loop wakeups and frames drawn to measure idle CPU use."""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.wakeups = 0
+        self.frames = 0
+
+    def record_wakeup(self) -> None:
+        self.wakeups += 1
+
+    def record_frame(self) -> None:
+        self.frames += 1
+
+    def per_minute(self, count: int) -> float:
+        elapsed = time.monotonic() - self.started
+        return count * 60 / elapsed if elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        elapsed = time.monotonic() - self.started
+        return (f"{self.wakeups} wakeups ({self.per_minute(self.wakeups):.1f}/min), "
+                f"{self.frames} frames ({self.per_minute(self.frames):.1f}/min) in {elapsed:.1f}s")
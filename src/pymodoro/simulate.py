@@ -0,0 +1,160 @@
+# src/pymodoro/simulate.py
+"""
+Headless fast-forward simulator for PomodoroTimer.
+
+Runs many simulated working days on a virtual clock and writes the
+resulting sessions through the storage layer, producing realistic logs
+for load-testing persistence and analytics. With --events each day's
+timer event stream is written too, for load-testing replay.
+
+    pymodoro-simulate --state-dir /tmp/pymodoro-sim --days 2000
+"""
+import argparse
+import os
+import random
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Callable, List, Optional, Union
+
+from pymodoro.alerts import parse_alerts
+from pymodoro.clock import VirtualClock
+from pymodoro.events import EventRecorder, append_events
+from pymodoro.session_model import Session
+from pymodoro.storage import append_sessions, materialize_day_log
+from pymodoro.timer import PomodoroTimer, SessionType
+
+
+@dataclass
+class SimulationResult:
+    """Totals for a simulation run."""
+    days: int = 0
+    sessions: int = 0
+    skipped: int = 0
+    paused: int = 0
+    warnings: int = 0
+    long_breaks: int = 0
+
+
+def simulate_day(day: date, pomodoros: int, result: SimulationResult, rng: random.Random,
+                 work_mins: int = 25, short_break_mins: int = 5, long_break_mins: int = 15,
+                 warning_mins: Union[int, str] = 1, long_break_frequency: int = 4, skip_rate: float = 0.0,
+                 pause_rate: float = 0.0, day_start: int = 9,
+                 record: Optional[Callable[[date, bytes], None]] = None) -> List[Session]:
+    """Fast-forward one working day and return its completed work sessions.
+
+    ``record`` receives the timer's event records, as ``EventRecorder`` sinks do.
+    """
+    clock = VirtualClock(start=datetime.combine(day, datetime.min.time()) + timedelta(hours=day_start))
+    timer = PomodoroTimer(work_mins, short_break_mins, long_break_mins, warning_mins,
+                          long_break_frequency, mute=True, clock=clock)
+    if record:
+        EventRecorder(timer, record)
+    timer.start()
+    sessions = []
+
+    while timer.pomodoros_completed < pomodoros:
+        finished_type = timer.current_session
+        started = timer.session_start_time
+
+        if rng.random() < skip_rate:
+            # Skip part-way through, exactly as the 'n' key does
+            clock.advance(rng.uniform(0, timer.time_left))
+            timer.next_session(skip=True)
+            result.skipped += 1
+        else:
+            if rng.random() < pause_rate:
+                # Step away for a few minutes part-way through
+                clock.advance(rng.uniform(0, timer.next_event_in()))
+                timer.pause()
+                clock.advance(rng.uniform(60, 600))
+                timer.resume()
+                result.paused += 1
+            # Jump from alert to alert, as the main loop sleeps
+            while timer.warning_pending and timer.time_left > 0:
+                clock.advance(timer.next_event_in() + 0.001)
+                if timer.should_play_warning():
+                    result.warnings += 1
+            clock.advance(timer.time_left)
+            timer.tick()
+
+        if finished_type == SessionType.WORK:
+            # Skipped work sessions are saved too, matching the TUI
+            sessions.append(Session(start=started, duration_minutes=work_mins))
+        if timer.current_session == SessionType.LONG_BREAK and finished_type == SessionType.WORK:
+            result.long_breaks += 1
+
+    result.days += 1
+    result.sessions += len(sessions)
+    return sessions
+
+
+def simulate(days: int, start: date, pomodoros: int = 8, seed: int = 0, write: bool = True,
+             materialize: bool = False, events: bool = False, **timer_options) -> SimulationResult:
+    """Simulate consecutive days from ``start`` and optionally persist them."""
+    rng = random.Random(seed)
+    result = SimulationResult()
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        records: List[bytes] = []
+        sessions = simulate_day(day, pomodoros, result, rng,
+                                record=(lambda log_date, payload: records.append(payload)) if events else None,
+                                **timer_options)
+        if write:
+            append_sessions(sessions, log_date=day)
+            if records:
+                append_events(b"".join(records), log_date=day)
+            if materialize:
+                materialize_day_log(day)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Fast-forward simulated Pomodoro days and write them to session logs"
+    )
+    parser.add_argument("--state-dir", required=True,
+                        help="XDG state directory to write logs into (never use your real one)")
+    parser.add_argument("--days", type=int, default=365, help="Number of days to simulate (default: 365)")
+    parser.add_argument("--start", type=date.fromisoformat, default=None,
+                        help="First simulated day, YYYY-MM-DD (default: DAYS days ago)")
+    parser.add_argument("--pomodoros", type=int, default=8, help="Work sessions per day (default: 8)")
+    parser.add_argument("-w", "--work", type=int, default=25, metavar="MINUTES")
+    parser.add_argument("-s", "--short", type=int, default=5, metavar="MINUTES")
+    parser.add_argument("-l", "--long", type=int, default=15, metavar="MINUTES")
+    parser.add_argument("-n", "--notify", type=parse_alerts, default="1", metavar="ALERTS")
+    parser.add_argument("-f", "--frequency", type=int, default=4, metavar="COUNT")
+    parser.add_argument("--skip-rate", type=float, default=0.05,
+                        help="Probability that a session is skipped part-way (default: 0.05)")
+    parser.add_argument("--pause-rate", type=float, default=0.1,
+                        help="Probability that a session is paused for a few minutes (default: 0.1)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--materialize", action="store_true",
+                        help="Also fold each day's journal into its YAML log")
+    parser.add_argument("--events", action="store_true",
+                        help="Also write each day's timer event stream")
+    parser.add_argument("--dry-run", action="store_true", help="Simulate without writing logs")
+    args = parser.parse_args()
+
+    if args.frequency < 1:
+        parser.error("Long break frequency must be at least 1")
+
+    os.environ["XDG_STATE_HOME"] = os.path.abspath(args.state_dir)
+    start = args.start or date.today() - timedelta(days=args.days)
+
+    started = time.perf_counter()
+    result = simulate(
+        args.days, start, pomodoros=args.pomodoros, seed=args.seed,
+        write=not args.dry_run, materialize=args.materialize, events=args.events,
+        work_mins=args.work, short_break_mins=args.short, long_break_mins=args.long,
+        warning_mins=args.notify, long_break_frequency=args.frequency, skip_rate=args.skip_rate,
+        pause_rate=args.pause_rate,
+    )
+    elapsed = time.perf_counter() - started
+
+    print(f"Simulated {result.days} days in {elapsed:.2f}s: {result.sessions} sessions, "
+          f"{result.skipped} skips, {result.paused} pauses, {result.warnings} warnings, {result.long_breaks} long breaks")
+
+
+if __name__ == "__main__":
+    main()
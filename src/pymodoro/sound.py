@@ -1,10 +1,31 @@
 # src/pymodoro/sound.py
+import json
+import os
 import platform
+import shutil
 import subprocess
 import sys
 import threading
+import time
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Iterator, Optional, Dict, List
+
+from pymodoro.storage import get_state_dir
+from pymodoro.tones import write_wav
+
+# Players tried for sound files, in order of preference
+_PLAYERS = {
+    "Darwin": ["afplay"],
+    "Linux": ["paplay", "aplay", "mpg123", "mpv", "ffplay"],
+}
+_BACKEND_CACHE_VERSION = 2
+# A cached fall back to the terminal bell is re-probed after this long,
+# in case a player or sound theme has been installed since
+_BELL_RECHECK_SECONDS = 24 * 60 * 60
+
+# Resolved backend per sound type, loaded from disk on first use
+_backends: Optional[Dict[str, dict]] = None
+_backends_lock = threading.Lock()
 
 
 def _run_command_silently(command: list[str]) -> bool:
@@ -94,34 +115,6 @@ def _play_windows_sound(sound_name: str) -> bool:
         return False
 
 
-def _play_system_sound(sound_name: str) -> bool:
-    """
-    Attempt to play a system sound using platform-specific tools.
-    
-    Returns True if successful, False otherwise.
-    """
-    system = platform.system()
-    
-    if system == "Darwin":  # macOS
-        sound_path = _get_system_sound_path(sound_name)
-        if sound_path:
-            return _run_command_silently(["afplay", sound_path])
-    
-    elif system == "Linux":
-        sound_path = _get_system_sound_path(sound_name)
-        if sound_path:
-            # Try different audio players in order of preference
-            players = ["paplay", "aplay", "mpg123", "mpv", "ffplay"]
-            for player in players:
-                if _run_command_silently([player, sound_path]):
-                    return True
-    
-    elif system == "Windows":
-        return _play_windows_sound(sound_name)
-    
-    return False
-
-
 def _play_terminal_bell() -> bool:
     """
     Fall back to terminal bell as last resort.
@@ -133,15 +126,61 @@ def _play_terminal_bell() -> bool:
     return True
 
 
-def _play_notification_sound_sync(sound_type: str = "default") -> bool:
+def _get_backend_cache_path() -> Path:
+    """Get the file caching the resolved sound backends."""
+    return get_state_dir() / "sound_backends.json"
+
+
+def _environment_key() -> str:
+    """Identify the platform and PATH the cached backends were resolved on."""
+    return f"{platform.system()}:{os.environ.get('PATH', '')}"
+
+
+def _load_backends() -> Dict[str, dict]:
+    """Load cached backends, or none if the cache is missing or was made elsewhere."""
+    try:
+        data = json.loads(_get_backend_cache_path().read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _BACKEND_CACHE_VERSION:
+        return {}
+    if data.get("environment") != _environment_key():
+        return {}
+    return data.get("backends", {})
+
+
+def _save_backends(backends: Dict[str, dict]) -> None:
+    """Write the resolved backends; failing to cache them is not an error."""
+    cache_file = _get_backend_cache_path()
+    temp_file = cache_file.with_suffix(".tmp")
+    try:
+        temp_file.write_text(json.dumps({
+            "version": _BACKEND_CACHE_VERSION,
+            "environment": _environment_key(),
+            "backends": backends,
+        }))
+        os.replace(temp_file, cache_file)
+    except OSError:
+        pass
+
+
+def _backend_is_valid(backend: dict) -> bool:
+    """Check that a cached backend's player and sound file still exist."""
+    kind = backend.get("kind")
+    if kind == "command":
+        return Path(backend["command"][0]).exists() and Path(backend["file"]).exists()
+    if kind == "bell":
+        return time.time() - backend.get("probed_at", 0) < _BELL_RECHECK_SECONDS
+    return kind == "windows"
+
+
+def _candidate_backends(sound_type: str) -> Iterator[dict]:
     """
-    Play a notification sound synchronously with multiple fallback options.
-    
-    Args:
-        sound_type: Type of sound to play ('work_end', 'break_end', or 'default')
+    Yield possible backends for a sound type in priority order.
     
-    Returns:
-        True if any sound method was attempted, False if all failed.
+    pymodoro's own synthesized tone (as a WAV file) comes first, then the
+    system sounds. Players that are not on PATH are skipped without
+    spawning them.
     """
     system = platform.system()
     sound_options = _get_platform_sound_options()
@@ -150,57 +189,68 @@ def _play_notification_sound_sync(sound_type: str = "default") -> bool:
     platform_sounds = sound_options.get(system, sound_options.get("Darwin", {}))
     sound_names = platform_sounds.get(sound_type, platform_sounds.get("default", ["bell"]))
     
-    # Try each sound option in priority order
-    for sound_name in sound_names:
-        if _play_system_sound(sound_name):
-            return True
+    if system == "Windows":
+        for sound_name in sound_names:
+            yield {"kind": "windows", "sound": sound_name}
+        return
     
-    # If we're on an unknown platform or all sounds failed, try any available sound
-    if system not in sound_options:
-        for platform_name, platform_data in sound_options.items():
-            for sound_name in platform_data.get("default", []):
-                if _play_system_sound(sound_name):
-                    return True
+    sound_paths = [_get_system_sound_path(sound_name) for sound_name in sound_names]
+    try:
+        sound_paths.insert(0, str(write_wav(sound_type)))
+    except OSError:
+        pass
     
-    # Fall back to terminal bell as absolute last resort
+    for sound_path in filter(None, sound_paths):
+        for player in _PLAYERS.get(system, []):
+            player_path = shutil.which(player)
+            if player_path:
+                yield {"kind": "command", "command": [player_path], "file": sound_path}
+
+
+def _play_backend(backend: dict) -> bool:
+    """Play a sound through one backend with a single spawn at most."""
+    kind = backend.get("kind")
+    if kind == "command":
+        return _run_command_silently([*backend["command"], backend["file"]])
+    if kind == "windows":
+        return _play_windows_sound(backend["sound"])
     return _play_terminal_bell()
 
 
-def play_notification_sound(sound_type: str = "default") -> bool:
+def _play_notification_sound_sync(sound_type: str = "default") -> bool:
     """
-    Play a notification sound asynchronously to avoid blocking the UI.
+    Play a notification sound synchronously through its resolved backend.
+    
+    The working (player, file) pair for each sound type is found once,
+    cached on disk, and then played with a single spawn. The cache entry
+    is dropped and the candidates probed again if the player or file has
+    disappeared or the cached backend fails. Probing plays the sound with
+    the first backend that works, falling back to the terminal bell.
     
     Args:
         sound_type: Type of sound to play ('work_end', 'break_end', or 'default')
     
     Returns:
-        True (since we're playing asynchronously, we assume success)
+        True if any sound method was attempted, False if all failed.
     """
-    def _play_async():
-        _play_notification_sound_sync(sound_type)
-    
-    # Play sound in background thread to avoid blocking UI
-    sound_thread = threading.Thread(target=_play_async, daemon=True)
-    sound_thread.start()
-    return True
-
-
-def play_work_end(muted: bool = False) -> bool:
-    """Play a sound to signify the end of a work session."""
-    if muted:
-        return True
-    return play_notification_sound("work_end")
-
-
-def play_break_end(muted: bool = False) -> bool:
-    """Play a sound to signify the end of a break session."""
-    if muted:
-        return True
-    return play_notification_sound("break_end")
-
-
-def play_warning(muted: bool = False) -> bool:
-    """Play a warning sound to notify user of approaching session end."""
-    if muted:
+    global _backends
+    with _backends_lock:
+        if _backends is None:
+            _backends = _load_backends()
+        
+        backend = _backends.get(sound_type)
+        if backend is not None and _backend_is_valid(backend) and _play_backend(backend):
+            return True
+        
+        for candidate in _candidate_backends(sound_type):
+            if _play_backend(candidate):
+                backend = candidate
+                break
+        else:
+            # Fall back to terminal bell as absolute last resort
+            _play_terminal_bell()
+            backend = {"kind": "bell", "probed_at": time.time()}
+        
+        _backends[sound_type] = backend
+        _save_backends(_backends)
         return True
-    return play_notification_sound("default")
@@ -0,0 +1,70 @@
+# src/pymodoro/stats.py
+from dataclasses import dataclass
+from datetime import date
+from itertools import groupby
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from pymodoro.history import HistoryIndex
+
+HourRow = Tuple[date, int, int, int]
+
+PERIODS: Dict[str, Callable[[date, int], str]] = {
+    "day": lambda day, hour: day.isoformat(),
+    "week": lambda day, hour: "{0}-W{1:02d}".format(*day.isocalendar()),
+    "month": lambda day, hour: f"{day.year}-{day.month:02d}",
+    "hour": lambda day, hour: f"{hour:02d}:00",
+}
+
+
+@dataclass
+class PeriodStats:
+    """Totals for one reporting period."""
+    label: str
+    sessions: int
+    minutes: int
+
+
+def rollup(rows: Iterable[HourRow], by: str = "day") -> Iterator[PeriodStats]:
+    """
+    Roll hourly rows up into periods.
+
+    Rows arrive in date order, so day/week/month periods are contiguous and
+    are grouped as they stream past. Hour-of-day buckets recur every day and
+    are accumulated into at most 24 totals instead.
+    """
+    key = PERIODS[by]
+    if by == "hour":
+        totals: Dict[int, list] = {}
+        for day, hour, sessions, minutes in rows:
+            bucket = totals.setdefault(hour, [0, 0])
+            bucket[0] += sessions
+            bucket[1] += minutes
+        for hour in sorted(totals):
+            yield PeriodStats(key(None, hour), *totals[hour])
+        return
+
+    for label, group in groupby(rows, key=lambda row: key(row[0], row[1])):
+        sessions = minutes = 0
+        for _, _, row_sessions, row_minutes in group:
+            sessions += row_sessions
+            minutes += row_minutes
+        yield PeriodStats(label, sessions, minutes)
+
+
+def iter_stats(since: date, until: date, by: str = "day", index: Optional[HistoryIndex] = None,
+               timer_name: Optional[str] = None) -> Iterator[PeriodStats]:
+    """Refresh the history index (of a named timer's logs) for changed days, then stream period totals."""
+    own_index = index is None
+    index = index or HistoryIndex(timer_name=timer_name)
+    try:
+        index.refresh()
+        yield from rollup(index.iter_hours(since, until), by)
+    finally:
+        if own_index:
+            index.close()
+
+
+def format_minutes(minutes: int) -> str:
+    """Format a minute count as e.g. 12h 05m."""
+    hours, mins = divmod(minutes, 60)
+    return f"{hours}h {mins:02d}m"
@@ -0,0 +1,217 @@
+# src/pymodoro/status.py
+#
+# Shared by the running timer (writer) and `pymodoro status` (reader), which
+# runs on every shell prompt: keep imports to os, struct and time (not even
+# pathlib or typing, which cost more than reading the file).
+import os
+import struct
+import sys
+import time
+
+MAGIC = b"PMST"
+VERSION = 1
+
+# Fixed little-endian layout, 40 bytes:
+#   magic, version, session, paused, muted, sequence, pid, pomodoros,
+#   session length (s), deadline (epoch s, while running), remaining (s, while paused)
+LAYOUT = struct.Struct("<4sBBBBIIIIdd")
+SEQUENCE_OFFSET = 8
+
+SESSIONS = ("work", "short_break", "long_break")
+LABELS = ("Work", "Short Break", "Long Break")
+ICONS = ("🍅", "☕", "☕")
+
+DEFAULT_FORMAT = "{icon} {remaining}"
+FORMAT_FIELDS = ("session, label, icon, remaining (MM:SS), minutes (rounded up), seconds, "
+                 "state (running/paused), muted (muted or empty), pomodoros")
+
+
+def get_runtime_dir() -> str:
+    """Directory for pymodoro's per-login files: the daemon socket and the status file."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "pymodoro")
+    # Same directory as storage.get_state_dir(), without importing pydantic
+    state_home = os.path.expanduser(os.environ.get("XDG_STATE_HOME", "~/.local/state"))
+    return os.path.join(state_home, "pymodoro")
+
+
+def get_status_path() -> str:
+    return os.path.join(get_runtime_dir(), "status")
+
+
+class StatusFile:
+    """
+    Publishes the running timer's state to a memory-mapped file.
+
+    The writer rewrites the record in place on each state transition (not
+    on ticks: readers derive the time left from the stored deadline). A
+    sequence counter is odd while a write is in progress, seqlock style,
+    so a reader that races a write retries instead of seeing a torn record.
+
+    Only one instance (TUI or daemon) owns the file at a time, by holding
+    an exclusive ``flock`` on it. Another instance publishes nothing until
+    the owner exits and removes the file; it then takes over on its next
+    transition.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or get_status_path()
+        self._sequence = 0
+        self._fd = None
+        self._map = None
+
+    def open(self) -> "StatusFile":
+        os.makedirs(os.path.dirname(self.path), mode=0o700, exist_ok=True)
+        self._claim()
+        return self
+
+    def _claim(self) -> bool:
+        """Lock and map the file unless another live instance owns it."""
+        import mmap
+        try:
+            import fcntl
+        except ImportError:
+            fcntl = None  # No flock (Windows): last writer wins
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if fcntl:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    os.close(fd)
+                    return False
+                # The previous owner may have removed the file between our open and lock
+                if os.fstat(fd).st_ino != os.stat(self.path).st_ino:
+                    os.close(fd)
+                    return False
+            os.ftruncate(fd, LAYOUT.size)
+            self._map = mmap.mmap(fd, LAYOUT.size)
+        except OSError:
+            os.close(fd)
+            return False
+        self._fd = fd  # Kept open: closing it would release the lock
+        return True
+
+    def publish(self, timer) -> None:
+        """Write the timer's current state. Suitable as a timer listener."""
+        if self._map is None and not self._claim():
+            return
+        session = SESSIONS.index(timer.current_session.name.lower())
+        time_left = max(0.0, timer.time_left)
+        deadline = time.time() + time_left if timer.is_running else 0.0
+        self._sequence += 1
+        struct.pack_into("<I", self._map, SEQUENCE_OFFSET, self._sequence)
+        self._sequence += 1
+        LAYOUT.pack_into(
+            self._map, 0, MAGIC, VERSION, session, not timer.is_running, timer.is_muted,
+            self._sequence, os.getpid(), timer.pomodoros_completed,
+            timer.settings[timer.current_session], deadline, time_left,
+        )
+
+    def close(self) -> None:
+        """Remove the file if this instance owns it: no instance is running any more."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+            os.close(self._fd)  # Unlinked first, so a waiting instance never claims a removed file
+            self._fd = None
+
+
+def _process_alive(pid: int) -> bool:
+    if os.name != "posix":
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def read_status(path=None, now=None):
+    """Read the published state, or None if no timer is running."""
+    try:
+        # Unbuffered, so the second read really re-reads the file
+        with open(path or get_status_path(), "rb", buffering=0) as status_file:
+            for _ in range(5):
+                data = status_file.read(LAYOUT.size)
+                status_file.seek(0)
+                if len(data) != LAYOUT.size:
+                    return None
+                # Even and unchanged across two reads: no write was in progress
+                if struct.unpack_from("<I", data, SEQUENCE_OFFSET)[0] % 2 == 0 \
+                        and status_file.read(LAYOUT.size) == data:
+                    break
+                status_file.seek(0)
+            else:
+                return None
+    except OSError:
+        return None
+    (magic, version, session, paused, muted, _, pid, pomodoros,
+     total, deadline, remaining) = LAYOUT.unpack(data)
+    if magic != MAGIC or version != VERSION or session >= len(SESSIONS) or not _process_alive(pid):
+        return None
+    if not paused:
+        remaining = max(0.0, deadline - (time.time() if now is None else now))
+    return {
+        "session": SESSIONS[session],
+        "label": LABELS[session],
+        "icon": ICONS[session],
+        "paused": bool(paused),
+        "muted": bool(muted),
+        "pomodoros": pomodoros,
+        "total": total,
+        "time_left": remaining,
+    }
+
+
+def format_status(status: dict, fmt: str = DEFAULT_FORMAT) -> str:
+    """Fill a ``str.format`` string with the FORMAT_FIELDS of a status record."""
+    seconds = int(status["time_left"])
+    minutes, secs = divmod(seconds, 60)
+    return fmt.format(
+        session=status["session"],
+        label=status["label"],
+        icon=status["icon"],
+        remaining=f"{minutes:02d}:{secs:02d}",
+        minutes=-(-seconds // 60),
+        seconds=seconds,
+        state="paused" if status["paused"] else "running",
+        muted="muted" if status["muted"] else "",
+        pomodoros=status["pomodoros"],
+    )
+
+
+def main(argv) -> int:
+    """`pymodoro status [--format FORMAT]`, parsed by hand to stay off argparse."""
+    fmt = DEFAULT_FORMAT
+    args = list(argv)
+    while args:
+        arg = args.pop(0)
+        if arg in ("-h", "--help"):
+            print("usage: pymodoro status [--format FORMAT]\n\n"
+                  "Print the running timer's state and exit 1 if no timer is running.\n"
+                  f"FORMAT fields: {FORMAT_FIELDS}\n(default: {DEFAULT_FORMAT!r})")
+            return 0
+        if arg.startswith("--format="):
+            fmt = arg.split("=", 1)[1]
+        elif arg in ("-f", "--format") and args:
+            fmt = args.pop(0)
+        else:
+            print(f"pymodoro status: unrecognized argument: {arg}", file=sys.stderr)
+            return 2
+    status = read_status()
+    if status is None:
+        return 1
+    try:
+        print(format_status(status, fmt))
+    except (KeyError, IndexError, ValueError) as exc:
+        print(f"pymodoro status: bad format: {exc}", file=sys.stderr)
+        return 2
+    return 0
@@ -1,5 +1,8 @@
 # src/pymodoro/storage.py
 
+import hashlib
+import json
+import marshal
 import os
 import platform
 import tempfile
@@ -7,16 +10,15 @@ import subprocess
 import sys
 from datetime import date, datetime  
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, List, Optional
 
-import yaml
 from pydantic import ValidationError
 
 from pymodoro.session_model import DayLog, Session
 
 
-def get_log_file_path() -> Path:
-    """Get the path for today's log file according to XDG spec."""
+def get_state_dir() -> Path:
+    """Get pymodoro's state directory according to XDG spec."""
     system = platform.system()
     
     if system == "Windows":
@@ -25,29 +27,194 @@ def get_log_file_path() -> Path:
         # Unix/Linux/macOS
         base_dir = Path(os.environ.get("XDG_STATE_HOME", "~/.local/state")).expanduser()
     
-    log_dir = base_dir / "pymodoro" / "logs"
+    state_dir = base_dir / "pymodoro"
+    state_dir.mkdir(parents=True, exist_ok=True)
+    return state_dir
+
+
+def get_log_dir(timer_name: Optional[str] = None) -> Path:
+    """Get the directory holding the daily log files, or a named timer's own log directory."""
+    log_dir = get_state_dir() / "logs"
+    if timer_name:
+        log_dir = log_dir / timer_name
     log_dir.mkdir(parents=True, exist_ok=True)
+    return log_dir
+
+
+def get_log_file_path(log_date: Optional[date] = None, timer_name: Optional[str] = None) -> Path:
+    """Get the path for a day's log file (default today)."""
+    log_date = log_date or date.today()
+    return get_log_dir(timer_name) / f"{log_date.isoformat()}.yaml"
+
+
+def get_journal_file_path(log_date: Optional[date] = None, timer_name: Optional[str] = None) -> Path:
+    """Get the path for a day's append-only session journal."""
+    return get_log_file_path(log_date, timer_name).with_suffix('.journal')
+
+
+def _format_start(start: datetime) -> str:
+    """Format a session start as YYYY-MM-DD HH:MM:SS for human readability."""
+    return start.strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _session_key(session: Session) -> tuple:
+    """Identity of a session as it is persisted, used to drop duplicates."""
+    return (_format_start(session.start), session.duration_minutes, session.notes)
+
+
+def _get_compacting_file_path(journal_file: Path) -> Path:
+    """Where a journal is moved while it is folded into the YAML log."""
+    return journal_file.with_suffix('.journal.compacting')
+
+
+def _read_journal(journal_file: Path) -> List[Session]:
+    """Read one journal file, skipping a torn final record (e.g. after a crash mid-write)."""
+    sessions = []
+    try:
+        with open(journal_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    sessions.append(Session(**json.loads(line)))
+                except (ValueError, TypeError, ValidationError):
+                    continue
+    except FileNotFoundError:
+        pass
+    return sessions
+
+
+def read_journal_sessions(log_date: Optional[date] = None, timer_name: Optional[str] = None) -> List[Session]:
+    """Read the sessions appended to a day's journal (default today).
+
+    Includes a journal left mid-compaction, so its sessions are never lost.
+    """
+    journal_file = get_journal_file_path(log_date, timer_name)
+    return _read_journal(_get_compacting_file_path(journal_file)) + _read_journal(journal_file)
+
+
+def append_sessions(sessions: Iterable[Session], log_date: Optional[date] = None,
+                    timer_name: Optional[str] = None) -> None:
+    """Append sessions to a day's journal (default today), one record per line, with fsync.
+
+    The cost is independent of how many sessions the day already holds.
+    """
+    records = "".join(
+        json.dumps({
+            'start': _format_start(session.start),
+            'duration_minutes': session.duration_minutes,
+            'notes': session.notes,
+        }) + "\n"
+        for session in sessions
+    ).encode('utf-8')
+    if not records:
+        return
+
+    with open(get_journal_file_path(log_date, timer_name), 'a+b') as f:
+        # Terminate a torn record left by a crash so it can't swallow ours
+        if f.seek(0, os.SEEK_END) > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                records = b"\n" + records
+        f.write(records)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+# Bump when the sidecar cache layout changes
+_CACHE_VERSION = 1
+
+
+def _get_cache_file_path(log_file: Path, timer_name: Optional[str] = None) -> Path:
+    """Get the path of the pre-validated sidecar cache for a log file (of a named timer)."""
+    cache_dir = get_state_dir() / "cache"
+    if timer_name:
+        cache_dir = cache_dir / timer_name
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir / f"{log_file.stem}.bin"
+
+
+def _cache_key(raw: bytes, stat: os.stat_result) -> tuple:
+    """Identify a log file's exact contents by mtime, size and hash."""
+    return (stat.st_mtime_ns, stat.st_size, hashlib.blake2b(raw, digest_size=16).digest())
+
+
+def _read_day_log_cache(log_file: Path, key: tuple, timer_name: Optional[str] = None) -> Optional[DayLog]:
+    """Return the cached DayLog if it was built from exactly this file."""
+    try:
+        version, cached_key, log_date, sessions = marshal.loads(
+            _get_cache_file_path(log_file, timer_name).read_bytes()
+        )
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if version != _CACHE_VERSION or cached_key != key:
+        return None
     
-    today = date.today()
-    return log_dir / f"{today.isoformat()}.yaml"
+    # Already validated when cached, so skip pydantic validation
+    return DayLog.model_construct(
+        log_date=date.fromisoformat(log_date),
+        sessions=[
+            Session.model_construct(
+                start=datetime.fromisoformat(start),
+                duration_minutes=duration_minutes,
+                notes=notes
+            )
+            for start, duration_minutes, notes in sessions
+        ]
+    )
+
+
+def _write_day_log_cache(log_file: Path, key: tuple, log_date: date, sessions: List[tuple],
+                         timer_name: Optional[str] = None) -> None:
+    """Store validated (start, duration_minutes, notes) rows; failures only cost speed."""
+    payload = marshal.dumps((_CACHE_VERSION, key, log_date.isoformat(), sessions))
+    cache_file = _get_cache_file_path(log_file, timer_name)
+    tmp_path = cache_file.with_suffix('.tmp')
+    try:
+        tmp_path.write_bytes(payload)
+        tmp_path.replace(cache_file)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
 
 
-def load_or_initialize_day_log() -> DayLog:
-    """Load today's log file or initialize a new one."""
-    log_file = get_log_file_path()
-    today = date.today()
+def _read_yaml_day_log(log_date: Optional[date] = None, timer_name: Optional[str] = None) -> DayLog:
+    """Read a day's YAML log file, raising OSError or ValueError if it is unreadable or invalid.
+
+    Unchanged files are served from the pre-validated sidecar cache.
+    """
+    log_file = get_log_file_path(log_date, timer_name)
     
-    if not log_file.exists():
-        return DayLog(log_date=today)
+    try:
+        with open(log_file, 'rb') as f:
+            raw = f.read()
+            key = _cache_key(raw, os.fstat(f.fileno()))
+    except FileNotFoundError:
+        return DayLog(log_date=log_date or date.today())
+    
+    day_log = _read_day_log_cache(log_file, key, timer_name)
+    if day_log is None:
+        import yaml  # Deferred: only needed when the sidecar cache misses
+        try:
+            data = yaml.safe_load(raw.decode('utf-8')) or {}
+        except yaml.YAMLError as exc:
+            raise ValueError(f"Invalid YAML in {log_file}: {exc}") from exc
+        day_log = DayLog(**data)
+        _write_day_log_cache(log_file, key, day_log.log_date, [
+            (session.start.isoformat(), session.duration_minutes, session.notes)
+            for session in day_log.sessions
+        ], timer_name)
+    
+    return day_log
+
+
+def _load_yaml_day_log(log_date: Optional[date] = None, timer_name: Optional[str] = None) -> DayLog:
+    """Load a day's YAML log file or initialize a new one."""
+    log_file = get_log_file_path(log_date, timer_name)
+    today = log_date or date.today()
     
     try:
-        with open(log_file, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f) or {}
-        
-        return DayLog(**data)
+        return _read_yaml_day_log(log_date, timer_name)
     
-    except (yaml.YAMLError, ValidationError, OSError):
-        # Back up corrupt file and start fresh
+    except (ValueError, OSError):
+        # Invalid YAML or failed validation: back up corrupt file and start fresh
         backup_path = log_file.with_suffix('.yaml.corrupt')
         try:
             log_file.rename(backup_path)
@@ -57,9 +224,65 @@ def load_or_initialize_day_log() -> DayLog:
         return DayLog(log_date=today)
 
 
-def save_day_log(day_log: DayLog) -> None:
-    """Save the day log using atomic write."""
-    log_file = get_log_file_path()
+def _merge_journal(day_log: DayLog, log_date: Optional[date] = None,
+                   timer_name: Optional[str] = None, journal_sessions: Optional[List[Session]] = None) -> DayLog:
+    """Append a day's journaled sessions (or the given ones) to its YAML log."""
+    if journal_sessions is None:
+        journal_sessions = read_journal_sessions(log_date, timer_name)
+    if journal_sessions:
+        # Skip records already folded into the YAML by an interrupted compaction
+        seen = {_session_key(session) for session in day_log.sessions}
+        day_log.sessions.extend(
+            session for session in journal_sessions
+            if _session_key(session) not in seen
+        )
+    return day_log
+
+
+def load_or_initialize_day_log(log_date: Optional[date] = None, timer_name: Optional[str] = None) -> DayLog:
+    """Load a day's log (YAML plus any journaled sessions) or initialize a new one.
+
+    Named timers keep their logs apart, in ``logs/<timer_name>/``.
+    """
+    return _merge_journal(_load_yaml_day_log(log_date, timer_name), log_date, timer_name)
+
+
+def read_day_log(log_date: date, timer_name: Optional[str] = None) -> DayLog:
+    """Read a day's log without touching the files, for reporting.
+
+    Unlike ``load_or_initialize_day_log`` a corrupt YAML file is not backed
+    up; a ``ValueError`` (invalid YAML or failed validation) propagates instead.
+    """
+    return _merge_journal(_read_yaml_day_log(log_date, timer_name), log_date, timer_name)
+
+
+def materialize_day_log(log_date: Optional[date] = None, timer_name: Optional[str] = None) -> DayLog:
+    """Fold a day's journal into its YAML log file and return the result.
+
+    Called when someone needs the human-readable log, e.g. ``--open_log``,
+    possibly while a timer is appending to the journal. The journal is
+    first renamed aside, so a session appended meanwhile starts a new
+    journal instead of being deleted with the folded one; a leftover from
+    an interrupted compaction is folded in first.
+    """
+    journal_file = get_journal_file_path(log_date, timer_name)
+    compacting_file = _get_compacting_file_path(journal_file)
+    for _ in range(2):
+        if not compacting_file.exists():
+            try:
+                journal_file.replace(compacting_file)
+            except FileNotFoundError:
+                break
+        day_log = _merge_journal(_load_yaml_day_log(log_date, timer_name),
+                                 journal_sessions=_read_journal(compacting_file))
+        save_day_log(day_log, timer_name)
+        compacting_file.unlink(missing_ok=True)
+    return load_or_initialize_day_log(log_date, timer_name)
+
+
+def save_day_log(day_log: DayLog, timer_name: Optional[str] = None) -> None:
+    """Save the day log to its date's file (in a named timer's directory) using atomic write."""
+    log_file = get_log_file_path(day_log.log_date, timer_name)
     
     # Prepare data for YAML serialization
     data = day_log.model_dump(mode='python')
@@ -68,17 +291,19 @@ def save_day_log(day_log: DayLog) -> None:
     for session in data['sessions']:
         if 'start' in session:
             # Format as YYYY-MM-DD HH:MM:SS for human readability while maintaining ISO compliance
-            session['start'] = session['start'].strftime('%Y-%m-%d %H:%M:%S')
+            session['start'] = _format_start(session['start'])
+    
+    import yaml
+    raw = yaml.safe_dump(data, default_flow_style=False).encode('utf-8')
     
     # Atomic write using temporary file
     with tempfile.NamedTemporaryFile(
-        mode='w',
-        encoding='utf-8',
+        mode='wb',
         dir=log_file.parent,
         delete=False,
         suffix='.tmp'
     ) as tmp_file:
-        yaml.safe_dump(data, tmp_file, default_flow_style=False)
+        tmp_file.write(raw)
         tmp_path = Path(tmp_file.name)
     
     try:
@@ -86,37 +311,43 @@ def save_day_log(day_log: DayLog) -> None:
     except OSError:
         tmp_path.unlink(missing_ok=True)
         raise
+    
+    # Warm the sidecar cache with exactly what was written, so the next load skips YAML
+    _write_day_log_cache(log_file, _cache_key(raw, log_file.stat()), day_log.log_date, [
+        (session['start'], session['duration_minutes'], session['notes'])
+        for session in data['sessions']
+    ], timer_name)
 
 
 def add_session(duration_minutes: int = 25, notes: Optional[str] = None, start_time: Optional[datetime] = None) -> None:
-    """Add a new session to today's log."""
-    
-    day_log = load_or_initialize_day_log()
+    """Add a new session to today's log by appending it to the journal."""
     session = Session(
         start=start_time or datetime.now(),
         duration_minutes=duration_minutes,
         notes=notes
     )
-    day_log.sessions.append(session)
-    save_day_log(day_log)
+    append_sessions([session])
 
 
-def reset_today_log() -> None:
-    """Reset today's log to empty."""
+def reset_today_log(timer_name: Optional[str] = None) -> None:
+    """Reset today's log (or a named timer's) to empty."""
     from datetime import date
     
     day_log = DayLog(log_date=date.today())
-    save_day_log(day_log)
+    save_day_log(day_log, timer_name)
+    journal_file = get_journal_file_path(timer_name=timer_name)
+    journal_file.unlink(missing_ok=True)
+    _get_compacting_file_path(journal_file).unlink(missing_ok=True)
 
 
-def open_log_in_editor() -> None:
-    """Open today's log file in the system's default editor."""
-    log_file = get_log_file_path()
+def open_log_in_editor(timer_name: Optional[str] = None) -> None:
+    """Open today's log file (or a named timer's) in the system's default editor."""
+    log_file = get_log_file_path(timer_name=timer_name)
     
-    # Ensure log file exists
+    # Fold journaled sessions into the YAML and ensure the log file exists
+    materialize_day_log(timer_name=timer_name)
     if not log_file.exists():
-        day_log = load_or_initialize_day_log()
-        save_day_log(day_log)
+        save_day_log(DayLog(log_date=date.today()), timer_name)
     
     # Use Unix editor precedence: $VISUAL -> $EDITOR -> vim
     system = platform.system()
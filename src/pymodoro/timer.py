@@ -1,6 +1,11 @@
 # src/pymodoro/timer.py
-import time
+import heapq
+from datetime import timedelta
 from enum import Enum, auto
+from typing import Callable, List, Optional
+
+from pymodoro.alerts import Alert, as_alerts
+from pymodoro.clock import Clock, SystemClock
 
 class SessionType(Enum):
     WORK = auto()
@@ -8,45 +13,78 @@ class SessionType(Enum):
     LONG_BREAK = auto()
 
 class PomodoroTimer:
-    def __init__(self, work_mins=25, short_break_mins=5, long_break_mins=15, warning_mins=1, long_break_frequency=4, mute=False):
+    def __init__(self, work_mins=25, short_break_mins=5, long_break_mins=15, warning_mins=1, long_break_frequency=4, mute=False, clock: Optional[Clock] = None,
+                 name: Optional[str] = None):
+        self.clock = clock or SystemClock()
+        self.name = name  # Named timers run side by side in one process, each with its own log
         self.settings = {
             SessionType.WORK: work_mins * 60,
             SessionType.SHORT_BREAK: short_break_mins * 60,
             SessionType.LONG_BREAK: long_break_mins * 60,
         }
         self.current_session = SessionType.WORK
-        self.time_left = self.settings[self.current_session]
         self.is_running = False
+        # Remaining seconds while paused; while running the monotonic deadline is authoritative
+        self._remaining = self.settings[self.current_session]
+        self._deadline = None
         self.pomodoros_completed = 0
         self.start_time = None
-        self._last_tick_time = None
         self.session_start_time = None  # Track when current session actually started
-        self.warning_minutes = warning_mins
+        # warning_mins is minutes before the end, or several alerts such as "10,5,1,50%"
+        self.alerts = as_alerts(warning_mins)
         self.long_break_frequency = long_break_frequency  # How many work sessions before long break
-        self._warning_played = False  # Track if warning has been played for current session
         self.is_muted = mute  # Mute state for sound notifications
+        self._listeners = []
+        self._schedule_alerts()
+
+    def add_listener(self, callback: Callable[[str], None]):
+        """Call ``callback(event)`` on every state change.
+
+        Events are "start", "pause", "resume", "mute", "reset", "session"
+        (a new session began), "skip" (one began because the last was
+        skipped) and "warning" (the warning became due).
+        """
+        self._listeners.append(callback)
+
+    def _notify(self, event: str):
+        for callback in self._listeners:
+            callback(event)
+
+    @property
+    def time_left(self) -> float:
+        """Seconds left in the current session, derived from the deadline."""
+        if self.is_running:
+            return max(0.0, self._deadline - self.clock.monotonic())
+        return self._remaining
+
+    @time_left.setter
+    def time_left(self, seconds: float):
+        self._remaining = max(0.0, seconds)
+        if self.is_running:
+            self._deadline = self.clock.monotonic() + self._remaining
 
     def start(self):
         if not self.is_running:
             self.is_running = True
-            self.start_time = time.monotonic()
-            self._last_tick_time = self.start_time
+            self.start_time = self.clock.monotonic()
+            self._deadline = self.start_time + self._remaining
             # Only set session start time if we're starting a new session
             if self.session_start_time is None:
-                from datetime import datetime
-                self.session_start_time = datetime.now()
+                self.session_start_time = self.clock.now()
+            self._notify("start")
 
     def pause(self):
         if self.is_running:
+            # Freeze the remaining time; the deadline is re-derived on resume
+            self._remaining = max(0.0, self._deadline - self.clock.monotonic())
             self.is_running = False
-            # Save the elapsed time when pausing
-            self.time_left -= (time.monotonic() - self._last_tick_time)
-            self.time_left = max(0, self.time_left)
+            self._notify("pause")
 
     def resume(self):
         if not self.is_running:
             self.is_running = True
-            self._last_tick_time = time.monotonic()
+            self._deadline = self.clock.monotonic() + self._remaining
+            self._notify("resume")
 
     def toggle_pause(self):
         if self.is_running:
@@ -57,25 +95,62 @@ class PomodoroTimer:
     def toggle_mute(self):
         """Toggle mute state for sound notifications."""
         self.is_muted = not self.is_muted
+        self._notify("mute")
     
     def reset(self):
         """Reset the current session timer to its full duration."""
         self.time_left = self.settings[self.current_session]
-        self._last_tick_time = time.monotonic()
-        self._warning_played = False  # Reset warning state on reset
+        self._schedule_alerts()  # Every alert fires again after a reset
         # Reset session start time to now
-        from datetime import datetime
-        self.session_start_time = datetime.now()
+        self.session_start_time = self.clock.now()
         # Keep the timer running state as it was
+        self._notify("reset")
     
+    def _schedule_alerts(self):
+        """
+        Queue the current session's alerts in a min-heap.
+
+        Alerts are keyed by running time into the session rather than by
+        clock time, so pausing shifts every pending deadline at once
+        without touching the heap.
+        """
+        duration = self.settings[self.current_session]
+        self._alert_heap = [(at, alert) for alert in self.alerts
+                            if (at := alert.offset(duration)) is not None]
+        heapq.heapify(self._alert_heap)
+
+    @property
+    def warning_pending(self) -> bool:
+        """True while an alert of the current session has not fired."""
+        return bool(self._alert_heap)
+
+    def next_event_in(self) -> Optional[float]:
+        """Running seconds until the next alert or the session end; None while paused."""
+        if not self.is_running:
+            return None
+        time_left = self.time_left
+        if self._alert_heap:
+            elapsed = self.settings[self.current_session] - time_left
+            return max(0.0, min(time_left, self._alert_heap[0][0] - elapsed))
+        return time_left
+
+    def due_alerts(self) -> List[Alert]:
+        """Pop the alerts that have come due; each fires once per session."""
+        if not (self.is_running and self._alert_heap):
+            return []
+        time_left = self.time_left
+        if time_left <= 0:
+            return []  # The session end supersedes its alerts
+        elapsed = self.settings[self.current_session] - time_left
+        due = []
+        while self._alert_heap and self._alert_heap[0][0] <= elapsed:
+            due.append(heapq.heappop(self._alert_heap)[1])
+        return due
+
     def should_play_warning(self) -> bool:
-        """Check if warning should be played (only once per session)."""
-        warning_threshold = self.warning_minutes * 60
-        if (not self._warning_played and 
-            self.is_running and 
-            self.time_left <= warning_threshold and 
-            self.time_left > 0):
-            self._warning_played = True
+        """Check if an alert has come due. Alerts due together play one warning."""
+        if self.due_alerts():
+            self._notify("warning")
             return True
         return False
     
@@ -83,16 +158,19 @@ class PomodoroTimer:
         if not self.is_running:
             return False  # No change
         
-        elapsed = time.monotonic() - self._last_tick_time
-        self._last_tick_time = time.monotonic()
-        self.time_left -= elapsed
-        
-        if self.time_left <= 0:
+        if self.clock.monotonic() >= self._deadline:
             self.next_session()
             return True # Session changed
         return False
 
     def next_session(self, skip=False):
+        now = self.clock.monotonic()
+        # A session that ran out hands its deadline to the next one, so a late
+        # tick doesn't shift the schedule; skips and resets start from now
+        anchor = now
+        if self.is_running and not skip and self._deadline <= now:
+            anchor = self._deadline
+        
         if self.current_session == SessionType.WORK:
             self.pomodoros_completed += 1
             if self.pomodoros_completed % self.long_break_frequency == 0:
@@ -102,14 +180,19 @@ class PomodoroTimer:
         else:
             self.current_session = SessionType.WORK
         
-        self.time_left = self.settings[self.current_session]
-        self._last_tick_time = time.monotonic()
-        self._warning_played = False  # Reset warning state for new session
+        duration = self.settings[self.current_session]
+        if anchor + duration <= now:
+            # Overslept a whole session (e.g. suspend); start afresh
+            anchor = now
+        self._remaining = duration
+        self._deadline = anchor + duration
+        self._schedule_alerts()  # Queue the new session's alerts
         # Reset session start time for new session
-        from datetime import datetime
-        self.session_start_time = datetime.now() if self.is_running else None
+        started = self.clock.now() - timedelta(seconds=now - anchor)
+        self.session_start_time = started if self.is_running else None
         # Ensure it's running when skipping to the next session
         if skip:
             self.is_running = True
-            self.session_start_time = datetime.now()
+            self.session_start_time = started
+        self._notify("skip" if skip else "session")
 
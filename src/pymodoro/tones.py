@@ -0,0 +1,167 @@
+# src/pymodoro/tones.py
+import math
+import shutil
+import subprocess
+import sys
+import time
+import wave
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from pymodoro.storage import get_state_dir
+
+SAMPLE_RATE = 22050
+# Bytes written to the player per write; about 90 ms of audio
+CHUNK_BYTES = 4096
+
+# (frequency Hz or 0 for silence, seconds) for each notification
+TONES: Dict[str, List[Tuple[float, float]]] = {
+    "work_end": [(880.0, 0.14), (1174.7, 0.14), (1568.0, 0.32)],    # Rising chime
+    "break_end": [(1568.0, 0.14), (1174.7, 0.14), (880.0, 0.32)],   # Falling chime
+    "default": [(1000.0, 0.09), (0.0, 0.07), (1000.0, 0.09)],       # Warning double beep
+}
+
+# Players that read raw signed 16-bit little-endian mono PCM from stdin
+PIPE_PLAYERS = [
+    ["pacat", "--playback", "--raw", "--format=s16le", f"--rate={SAMPLE_RATE}", "--channels=1"],
+    ["aplay", "-q", "-t", "raw", "-f", "S16_LE", "-r", str(SAMPLE_RATE), "-c", "1"],
+]
+
+_buffers: Dict[str, bytes] = {}
+
+
+def _render(notes: List[Tuple[float, float]], volume: float = 0.35) -> bytes:
+    """Synthesize notes as 16-bit PCM with a short attack and exponential decay."""
+    samples = array("h")
+    attack = int(SAMPLE_RATE * 0.005)
+    for frequency, seconds in notes:
+        count = int(SAMPLE_RATE * seconds)
+        if not frequency:
+            samples.extend([0] * count)
+            continue
+        step = 2 * math.pi * frequency / SAMPLE_RATE
+        decay = 5.0 / count
+        peak = 32767 * volume
+        samples.extend(
+            int(peak * min(1.0, i / attack) * math.exp(-i * decay) * math.sin(i * step))
+            for i in range(count)
+        )
+    if sys.byteorder == "big":
+        samples.byteswap()
+    return samples.tobytes()
+
+
+def get_tone(sound_type: str) -> bytes:
+    """Return the PCM buffer for a notification, rendering it on first use."""
+    try:
+        return _buffers[sound_type]
+    except KeyError:
+        buffer = _buffers[sound_type] = _render(TONES.get(sound_type, TONES["default"]))
+        return buffer
+
+
+def render_all() -> None:
+    """Pre-render every notification tone."""
+    for sound_type in TONES:
+        get_tone(sound_type)
+
+
+def write_wav(sound_type: str) -> Path:
+    """Write a notification tone as a WAV file for file-based players and return its path."""
+    sound_dir = get_state_dir() / "sounds"
+    sound_dir.mkdir(parents=True, exist_ok=True)
+    wav_file = sound_dir / f"{sound_type}.wav"
+    buffer = get_tone(sound_type)
+    if not wav_file.exists() or wav_file.stat().st_size != 44 + len(buffer):
+        temp_file = wav_file.with_suffix(".tmp")
+        with wave.open(str(temp_file), "wb") as output:
+            output.setnchannels(1)
+            output.setsampwidth(2)
+            output.setframerate(SAMPLE_RATE)
+            output.writeframes(buffer)
+        temp_file.replace(wav_file)
+    return wav_file
+
+
+class TonePipe:
+    """
+    A long-lived raw PCM player fed through its stdin.
+
+    The player (``pacat`` or ``aplay``) is started on first use and kept
+    running, so a notification costs one pipe write rather than a process
+    spawn. If the player cannot be started or dies, ``play`` returns
+    False and the caller falls back to file-based playback.
+    """
+
+    def __init__(self, command: Optional[List[str]] = None):
+        self.command = command
+        self.first_byte_at: Optional[float] = None
+        self._process: Optional[subprocess.Popen] = None
+        self._failed = False
+
+    @staticmethod
+    def _find_player() -> Optional[List[str]]:
+        for command in PIPE_PLAYERS:
+            player = shutil.which(command[0])
+            if player:
+                return [player, *command[1:]]
+        return None
+
+    def _ensure_process(self) -> bool:
+        if self._process is not None and self._process.poll() is None:
+            return True
+        if self._failed:
+            return False
+        command = self.command or self._find_player()
+        if command is None:
+            self._failed = True
+            return False
+        try:
+            self._process = subprocess.Popen(
+                command, stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
+        except OSError:
+            self._failed = True
+            return False
+        # A player without a usable audio device exits straight away
+        time.sleep(0.05)
+        if self._process.poll() is not None:
+            self._failed = True
+            return False
+        return True
+
+    def play(self, sound_type: str) -> bool:
+        """Write a notification tone to the player; return whether it was written."""
+        buffer = get_tone(sound_type)
+        for _ in range(2):
+            if not self._ensure_process():
+                return False
+            try:
+                stdin = self._process.stdin
+                view = memoryview(buffer)
+                stdin.write(view[:CHUNK_BYTES])
+                stdin.flush()
+                self.first_byte_at = time.monotonic()
+                stdin.write(view[CHUNK_BYTES:])
+                stdin.flush()
+                return True
+            except OSError:
+                # The player went away; start a new one once
+                self.close()
+        return False
+
+    def close(self) -> None:
+        """Close the pipe and stop the player."""
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+        except OSError:
+            pass
+        try:
+            process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            process.kill()
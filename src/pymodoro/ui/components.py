@@ -3,56 +3,84 @@ from rich.text import Text
 from rich.panel import Panel
 from rich.table import Table
 from rich.console import Group
+from typing import Optional
+from pymodoro.ui.fragments import FragmentCache, Slot
+from pymodoro.ui.glyphs import GlyphBlock, load_font
 from pymodoro.ui.theme import SessionTheme, Dimensions
 
+TIMER_STYLE = "bold white on black"
+
 class TimerDisplay:
     """Renders timer in MM:SS format with Rich Panel."""
     
-    def __init__(self, dimensions: Dimensions):
+    def __init__(self, dimensions: Dimensions, fragments: Optional[FragmentCache] = None,
+                 font: Optional[str] = None):
         self.dimensions = dimensions
+        self.fragments = fragments if fragments is not None else FragmentCache()
+        self.font = font
+        self._panel = None
     
-    def render(self, time_left: float, display_color: str) -> Panel:
-        """Render timer display panel."""
-        try:
-            mins, secs = divmod(int(time_left), 60)
-            time_str = f"{mins:02d}:{secs:02d}"
-            timer_text = Text(time_str, justify="center", style="bold white on black")
-            return Panel(timer_text, width=self.dimensions.timer_panel_width, style=display_color)
-        except Exception:
-            # Fallback for any rendering errors
-            fallback_text = Text("00:00", justify="center", style="bold white on black")
-            return Panel(fallback_text, width=self.dimensions.timer_panel_width, style="white")
+    def build(self, display_color: str) -> Panel:
+        """Build a retained timer panel whose text is swapped by update()."""
+        if self.font:
+            # Big digits size the panel to the glyphs
+            self._panel = Panel(Text(""), expand=False, padding=(0, 1), style=display_color)
+        else:
+            self._panel = Panel(Text(""), width=self.dimensions.timer_panel_width, style=display_color)
+        return self._panel
+    
+    def update(self, time_left: float) -> None:
+        """Swap the cached text for the current MM:SS into the retained panel."""
+        mins, secs = divmod(int(max(0, time_left)), 60)
+        time_str = f"{mins:02d}:{secs:02d}"
+        if self.font:
+            font = load_font(self.font, self.dimensions.glyph_scale)
+            self._panel.renderable = self.fragments.get(
+                ("big_timer", time_str, TIMER_STYLE, (font.name, font.scale)),
+                lambda: GlyphBlock(font.compose(time_str), TIMER_STYLE)
+            )
+            return
+        self._panel.renderable = self.fragments.get(
+            ("timer", time_str, TIMER_STYLE, self.dimensions.timer_panel_width),
+            lambda: Text(time_str, justify="center", style=TIMER_STYLE)
+        )
 
 class ProgressBar:
     """Renders horizontal progress visualization."""
     
-    def __init__(self, dimensions: Dimensions):
+    def __init__(self, dimensions: Dimensions, fragments: Optional[FragmentCache] = None):
         self.dimensions = dimensions
+        self.fragments = fragments if fragments is not None else FragmentCache()
+        self._row = None
+        self._color = None
+        self._filled_width = None
     
-    def render(self, time_left: float, total_time: float, display_color: str) -> Group:
-        """Render progress bar component."""
-        try:
-            remaining = max(0, time_left)
-            completed = total_time - remaining
-            progress_ratio = completed / total_time if total_time > 0 else 0
-            
-            filled_width = int(progress_ratio * self.dimensions.progress_bar_width)
-            empty_width = self.dimensions.progress_bar_width - filled_width
-            
-            filled_blocks = "█" * filled_width
-            empty_blocks = "░" * empty_width
-            bar_text = filled_blocks + empty_blocks
-            
-            # Create two rows for thickness
-            progress_bar1 = Text(bar_text, style=f"bold {display_color}")
-            progress_bar2 = Text(bar_text, style=f"bold {display_color}")
-            
-            return Group(progress_bar1, progress_bar2)
-        except Exception:
-            # Fallback progress bar
-            fallback_text = "░" * self.dimensions.progress_bar_width
-            fallback_bar = Text(fallback_text, style="white")
-            return Group(fallback_bar, fallback_bar)
+    def build(self, display_color: str) -> Group:
+        """Build a retained two-row bar whose text is swapped by update()."""
+        # Both rows show the same bar, so one slot is rendered twice
+        self._row = Slot()
+        self._color = display_color
+        self._filled_width = None
+        return Group(self._row, self._row)
+    
+    @staticmethod
+    def filled_cells(time_left: float, total_time: float, width: int) -> int:
+        """Number of filled cells in a bar of the given width."""
+        remaining = max(0, time_left)
+        progress_ratio = (total_time - remaining) / total_time if total_time > 0 else 0
+        return int(progress_ratio * width)
+    
+    def update(self, time_left: float, total_time: float) -> None:
+        """Update the retained bar in place when its filled width changes."""
+        filled_width = self.filled_cells(time_left, total_time, self.dimensions.progress_bar_width)
+        if filled_width == self._filled_width:
+            return
+        self._filled_width = filled_width
+        width = self.dimensions.progress_bar_width
+        self._row.renderable = self.fragments.get(
+            ("bar", filled_width, self._color, width),
+            lambda: Text("█" * filled_width + "░" * (width - filled_width), style=f"bold {self._color}")
+        )
 
 class Header:
     """Renders session title, pomodoro number, and pause status."""
@@ -93,6 +121,21 @@ class Header:
             # Fallback header
             return Text(f"{theme.icon} {theme.short_name}", justify="center", style="bold white")
 
+class TabBar:
+    """One line naming every timer, with the current one highlighted."""
+    
+    HINT = "tab/1-9 switch  v view"
+    
+    def render(self, tabs, active: int) -> Text:
+        """``tabs`` holds (name, theme, display_color) for each timer."""
+        bar = Text(no_wrap=True, overflow="ellipsis")
+        for index, (name, theme, display_color) in enumerate(tabs):
+            label = f" {index + 1} {name} {theme.icon} "
+            bar.append(label, style=f"bold reverse {display_color}" if index == active else display_color)
+            bar.append(" ")
+        bar.append(f" {self.HINT}", style="dim")
+        return bar
+
 class ArtDisplay:
     """Renders ASCII art based on session state."""
     
@@ -157,7 +200,7 @@ class Dialog:
             return Panel(
                 help_content,
                 border_style=f"bold {display_color}",
-                padding=(2, 4),
+                padding=self.dimensions.dialog_padding,
                 width=self.dimensions.help_width,
                 title="[bold]🍅 Pymodoro Help[/bold]",
                 title_align="center"
@@ -214,7 +257,7 @@ class Dialog:
             return Panel(
                 confirmation_content,
                 border_style=f"bold {display_color}",
-                padding=(2, 4),
+                padding=self.dimensions.dialog_padding,
                 width=self.dimensions.dialog_width,
                 title="[bold]Confirmation Required[/bold]",
                 title_align="center"
@@ -0,0 +1,129 @@
+# src/pymodoro/ui/delta.py
+from typing import List, Optional, Tuple
+
+from rich.cells import cell_len
+from rich.console import COLOR_SYSTEMS, Console, RenderableType
+from rich.style import Style
+
+Cell = Tuple[str, Style]
+
+_NULL_STYLE = Style.null()
+_BLANK: Cell = (" ", _NULL_STYLE)
+# Unchanged cells between two changed runs are rewritten rather than paying
+# for another cursor move (ESC [ row ; col H is up to 8 bytes)
+_MAX_GAP = 6
+
+
+class DeltaRenderer:
+    """
+    Full-screen display that writes only the cells that changed.
+
+    A drop-in for ``rich.live.Live(screen=True, auto_refresh=False)`` for
+    slow links (SSH, tmux): the last frame is kept as a cell buffer and
+    each update emits cursor-addressed runs of changed cells, typically
+    the timer digits and one progress block. A change of terminal size
+    clears the screen and redraws everything.
+    """
+
+    def __init__(self, renderable: RenderableType, console: Optional[Console] = None):
+        self.console = console or Console()
+        self._renderable = renderable
+        self._size = None
+        self._cells: List[List[Cell]] = []
+        self._color_system = COLOR_SYSTEMS.get(self.console.color_system)
+
+    def __enter__(self) -> "DeltaRenderer":
+        self.console.set_alt_screen(True)
+        self.console.show_cursor(False)
+        self.update(self._renderable, refresh=True)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.console.show_cursor(True)
+        self.console.set_alt_screen(False)
+
+    def update(self, renderable: RenderableType, refresh: bool = False) -> None:
+        """Set the renderable and, if ``refresh``, write the changed cells."""
+        self._renderable = renderable
+        if refresh:
+            self.refresh()
+
+    def refresh(self) -> None:
+        size = self.console.size
+        prefix = ""
+        if size != self._size:
+            self._size = size
+            self._cells = [[_BLANK] * size.width for _ in range(size.height)]
+            prefix = "\x1b[H\x1b[2J"
+        frame = self._render_cells(size.width, size.height)
+        output = prefix + self._diff(self._cells, frame)
+        self._cells = frame
+        if output:
+            self.console.file.write(output)
+            self.console.file.flush()
+
+    def _render_cells(self, width: int, height: int) -> List[List[Cell]]:
+        """Render to a height x width grid of (character, style) cells."""
+        options = self.console.options.update_dimensions(width, height)
+        lines = self.console.render_lines(self._renderable, options, pad=True)
+        rows = []
+        for line in lines[:height]:
+            row: List[Cell] = []
+            for text, style, control in line:
+                if control:
+                    continue
+                style = style or _NULL_STYLE
+                for char in text:
+                    row.append((char, style))
+                    # Wide characters cover a second cell, held as an empty placeholder
+                    row.extend(("", style) for _ in range(cell_len(char) - 1))
+            rows.append((row + [_BLANK] * width)[:width])
+        rows.extend([_BLANK] * width for _ in range(height - len(rows)))
+        return rows
+
+    def _diff(self, old: List[List[Cell]], new: List[List[Cell]]) -> str:
+        """ANSI output turning the ``old`` grid into ``new``."""
+        output = []
+        for y, (old_row, new_row) in enumerate(zip(old, new)):
+            if old_row == new_row:
+                continue
+            for start, end in self._changed_runs(old_row, new_row):
+                # Widen to whole characters so a wide glyph is never split
+                while start > 0 and not new_row[start][0]:
+                    start -= 1
+                while end < len(new_row) and not new_row[end][0]:
+                    end += 1
+                output.append(f"\x1b[{y + 1};{start + 1}H")
+                output.append(self._styled(new_row[start:end]))
+        return "".join(output)
+
+    @staticmethod
+    def _changed_runs(old_row: List[Cell], new_row: List[Cell]):
+        """Yield [start, end) column ranges that differ, merging small gaps."""
+        width = len(new_row)
+        run_start = run_end = None
+        for x in range(width):
+            if old_row[x] == new_row[x]:
+                continue
+            if run_start is not None and x - run_end > _MAX_GAP:
+                yield run_start, run_end
+                run_start = None
+            if run_start is None:
+                run_start = x
+            run_end = x + 1
+        if run_start is not None:
+            yield run_start, run_end
+
+    def _styled(self, cells: List[Cell]) -> str:
+        """Render a run of cells, one SGR sequence per change of style."""
+        parts = []
+        text, current = "", None
+        for char, style in cells:
+            if style != current:
+                if text:
+                    parts.append(current.render(text, color_system=self._color_system))
+                text, current = "", style
+            text += char
+        if text:
+            parts.append(current.render(text, color_system=self._color_system))
+        return "".join(parts)
@@ -0,0 +1,60 @@
+# src/pymodoro/ui/fragments.py
+from collections import OrderedDict, namedtuple
+from typing import Any, Callable, Hashable
+
+from rich.measure import Measurement
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class FragmentCache:
+    """
+    Bounded LRU cache of styled frame fragments.
+
+    Keys are (kind, value, color, width) tuples, e.g. a timer string or a
+    progress bar fill. There are only ``progress_bar_width + 1`` bars per
+    color and 60 x N timer strings; the default size holds an hour-long
+    session so that each later session (and every redraw after a pause or
+    dialog) is served from the cache. Fragments are shared between
+    screens and must not be mutated once cached.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def get(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Return the cached fragment for ``key``, creating it with ``factory`` on a miss."""
+        try:
+            fragment = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            fragment = self._entries[key] = factory()
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return fragment
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return fragment
+
+    def clear(self) -> None:
+        """Drop all fragments, e.g. after the dimensions change."""
+        self._entries.clear()
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+
+class Slot:
+    """A retained render tree node whose content is swapped in place."""
+
+    def __init__(self, renderable: Any = ""):
+        self.renderable = renderable
+
+    def __rich_console__(self, console, options):
+        yield self.renderable
+
+    def __rich_measure__(self, console, options) -> Measurement:
+        return Measurement.get(console, options, self.renderable)
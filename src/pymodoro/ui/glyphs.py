@@ -0,0 +1,89 @@
+# src/pymodoro/ui/glyphs.py
+from typing import Dict, List, Tuple
+
+from rich.measure import Measurement
+from rich.segment import Segment
+from rich.style import Style
+
+# Multi-line block glyphs for the big timer, one string per row
+FONTS: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    "block": {
+        "0": ("█████", "█   █", "█   █", "█   █", "█████"),
+        "1": ("  █  ", " ██  ", "  █  ", "  █  ", " ███ "),
+        "2": ("█████", "    █", "█████", "█    ", "█████"),
+        "3": ("█████", "    █", " ████", "    █", "█████"),
+        "4": ("█   █", "█   █", "█████", "    █", "    █"),
+        "5": ("█████", "█    ", "█████", "    █", "█████"),
+        "6": ("█████", "█    ", "█████", "█   █", "█████"),
+        "7": ("█████", "    █", "   █ ", "  █  ", "  █  "),
+        "8": ("█████", "█   █", "█████", "█   █", "█████"),
+        "9": ("█████", "█   █", "█████", "    █", "█████"),
+        ":": ("   ", " █ ", "   ", " █ ", "   "),
+    },
+}
+
+_LOADED: Dict[Tuple[str, int], "GlyphFont"] = {}
+
+
+class GlyphFont:
+    """
+    One font at one scale, with every glyph row precomputed.
+
+    Composing a string only concatenates cached rows, so a big MM:SS
+    costs a handful of joins per frame.
+    """
+
+    __slots__ = ("name", "scale", "height", "_gap", "_rows")
+
+    def __init__(self, name: str, scale: int = 1):
+        self.name = name
+        self.scale = scale
+        self._gap = " " * scale
+        # Scale horizontally by repeating cells and vertically by repeating rows
+        self._rows = {
+            char: tuple(
+                "".join(cell * scale for cell in row)
+                for row in rows for _ in range(scale)
+            )
+            for char, rows in FONTS[name].items()
+        }
+        self.height = len(next(iter(self._rows.values())))
+
+    def compose(self, text: str) -> List[str]:
+        """Rows of ``text`` set in this font, one glyph column apart."""
+        glyphs = [self._rows[char] for char in text]
+        return [self._gap.join(glyph[row] for glyph in glyphs) for row in range(self.height)]
+
+
+class GlyphBlock:
+    """
+    Pre-composed rows of big digits, rendered as plain segments.
+
+    Unlike ``Text`` there is nothing to wrap or justify, so painting a
+    cached block costs about as much as the small MM:SS panel.
+    """
+
+    __slots__ = ("rows", "style", "width")
+
+    def __init__(self, rows: List[str], style: str):
+        self.rows = rows
+        self.style = Style.parse(style)
+        self.width = max(map(len, rows), default=0)
+
+    def __rich_console__(self, console, options):
+        new_line = Segment.line()
+        for row in self.rows:
+            yield Segment(row, self.style)
+            yield new_line
+
+    def __rich_measure__(self, console, options) -> Measurement:
+        return Measurement(self.width, self.width)
+
+
+def load_font(name: str, scale: int = 1) -> GlyphFont:
+    """Return the font for a name and scale, building its rows on first use."""
+    try:
+        return _LOADED[name, scale]
+    except KeyError:
+        font = _LOADED[name, scale] = GlyphFont(name, scale)
+        return font
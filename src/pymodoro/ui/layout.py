@@ -37,10 +37,27 @@ class Alignment:
         """Center content horizontally."""
         return Align.center(content)
 
+class Dock:
+    """A one-line bar above content that fills the rest of the screen height."""
+    
+    def __init__(self, bar: Any, body: Any):
+        self.bar = bar
+        self.body = body
+    
+    def __rich_console__(self, console, options):
+        height = options.height or console.height
+        yield from console.render(self.bar, options.update(height=1))
+        yield from console.render(self.body, options.update(height=max(1, height - 1)))
+
 class Spacing:
     """Utilities for consistent spacing and padding."""
     
     @staticmethod
     def create_help_text() -> Text:
         """Create the standard help text."""
-        return Text("Press (h) for help", justify="center", style="dim")
\ No newline at end of file
+        return Text("Press (h) for help", justify="center", style="dim")
+    
+    @staticmethod
+    def create_notice_text(message: str) -> Text:
+        """Create a status notice shown in place of the help text."""
+        return Text(f"✗ {message}", justify="center", style="bold red")
\ No newline at end of file
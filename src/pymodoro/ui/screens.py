@@ -1,10 +1,12 @@
 # src/pymodoro/ui/screens.py
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Optional
+from rich.text import Text
 from pymodoro.timer import SessionType
 from pymodoro.ui.theme import ThemeManager
-from pymodoro.ui.components import TimerDisplay, ProgressBar, Header, ArtDisplay, Dialog
+from pymodoro.ui.components import TIMER_STYLE, TimerDisplay, ProgressBar, Header, ArtDisplay, Dialog
 from pymodoro.ui.layout import LayoutGrid, Alignment, Spacing
+from rich.console import Group
 
 class Screen(ABC):
     """Abstract base class for all screens."""
@@ -15,31 +17,57 @@ class Screen(ABC):
         pass
 
 class MainScreen(Screen):
-    """Primary timer interface using components."""
+    """
+    Primary timer interface using components.
+    
+    The render tree is retained: it is built once per static state
+    (session, pause/mute flags, pomodoro count, notice) and each tick only
+    updates the timer text and progress bar in place.
+    """
     
     def __init__(self, theme_manager: ThemeManager):
         self.theme_manager = theme_manager
-        self.timer_display = TimerDisplay(theme_manager.dimensions)
-        self.progress_bar = ProgressBar(theme_manager.dimensions)
+        self.timer_display = TimerDisplay(
+            theme_manager.dimensions, theme_manager.fragments, font=theme_manager.timer_font
+        )
+        self.progress_bar = ProgressBar(theme_manager.dimensions, theme_manager.fragments)
         self.header = Header()
         self.art_display = ArtDisplay()
+        self._static_key = None
+        self._root = None
+    
+    def invalidate(self) -> None:
+        """Force the next render to rebuild the whole tree."""
+        self._static_key = None
     
     def render(self, session_type: SessionType, time_left: float, total_time: float, 
-              pomodoros_completed: int, is_paused: bool, is_muted: bool = False) -> Any:
+              pomodoros_completed: int, is_paused: bool, is_muted: bool = False,
+              notice: Optional[str] = None) -> Any:
         """Render the main timer screen."""
+        static_key = (session_type, total_time, pomodoros_completed, is_paused, is_muted, notice)
+        if static_key != self._static_key:
+            self._root = self._build(session_type, pomodoros_completed, is_paused, is_muted, notice)
+            self._static_key = static_key
+        
+        self.timer_display.update(time_left)
+        self.progress_bar.update(time_left, total_time)
+        return self._root
+    
+    def _build(self, session_type: SessionType, pomodoros_completed: int, is_paused: bool,
+               is_muted: bool, notice: Optional[str]) -> Any:
+        """Build the retained render tree for one static state."""
         # Get theme and display color
         theme = self.theme_manager.get_theme(session_type, is_paused)
         display_color = self.theme_manager.get_display_color(session_type, is_paused)
         
         # Create all components
         header = self.header.render(theme, pomodoros_completed, is_paused, display_color, is_muted)
-        art = self.art_display.render(theme.art)
-        timer = self.timer_display.render(time_left, display_color)
+        timer = self.timer_display.build(display_color)
         
         # Use cyan progress bar for Long Break, otherwise use display_color
         progress_color = "cyan" if session_type == SessionType.LONG_BREAK else display_color
-        progress = self.progress_bar.render(time_left, total_time, progress_color)
-        help_text = Spacing.create_help_text()
+        progress = self.progress_bar.build(progress_color)
+        help_text = Spacing.create_notice_text(notice) if notice else Spacing.create_help_text()
         
         # Create layout
         table = LayoutGrid.create_main_layout(self.theme_manager.dimensions.table_min_width)
@@ -47,7 +75,9 @@ class MainScreen(Screen):
         # Add components with consistent spacing
         LayoutGrid.add_component(table, header)
         LayoutGrid.add_spacer(table)
-        LayoutGrid.add_component(table, Alignment.center_horizontal(art))
+        if self.theme_manager.dimensions.show_art:
+            art = self.art_display.render(theme.art)
+            LayoutGrid.add_component(table, Alignment.center_horizontal(art))
         LayoutGrid.add_component(table, Alignment.center_horizontal(timer))
         LayoutGrid.add_spacer(table)
         LayoutGrid.add_component(table, Alignment.center_horizontal(progress))
@@ -90,17 +120,109 @@ class ConfirmationScreen(Screen):
         )
         return Alignment.center_vertical_and_horizontal(confirmation_panel)
 
+class MiniScreen(Screen):
+    """Single status line for panes too short for the full layout."""
+    
+    PROMPTS = {'skip': "Skip {name}? (y/n)", 'reset': "Reset {name}? (y/n)", 'quit': "Quit Pymodoro? (y/n)"}
+    HELP = "SPACE pause  m mute  n skip  r reset  q quit  h close"
+    
+    def __init__(self, theme_manager: ThemeManager):
+        self.theme_manager = theme_manager
+    
+    def render(self, screen_type: str, session_type: SessionType, time_left: float,
+               pomodoros_completed: int, is_paused: bool, is_muted: bool = False,
+               total_time: Optional[float] = None, notice: Optional[str] = None) -> Any:
+        """Render the main screen, help or a confirmation as one line."""
+        line = self.line(screen_type, session_type, time_left, pomodoros_completed,
+                         is_paused, is_muted, total_time, notice)
+        return Alignment.center_vertical_and_horizontal(line)
+    
+    def line(self, screen_type: str, session_type: SessionType, time_left: float,
+             pomodoros_completed: int, is_paused: bool, is_muted: bool = False,
+             total_time: Optional[float] = None, notice: Optional[str] = None,
+             name: Optional[str] = None) -> Text:
+        """The status line itself, optionally prefixed with a timer name."""
+        theme = self.theme_manager.get_theme(session_type, is_paused)
+        display_color = self.theme_manager.get_display_color(session_type, is_paused)
+        label = f"#{pomodoros_completed + 1}" if theme.short_name == "Work" else theme.short_name
+        mins, secs = divmod(int(max(0, time_left)), 60)
+        
+        line = Text(no_wrap=True, overflow="ellipsis")
+        if name:
+            line.append(f"{name} ", style="bold")
+        line.append(f"{theme.icon} {label} ", style=f"bold {display_color}")
+        line.append(f" {mins:02d}:{secs:02d} ", style=TIMER_STYLE)
+        
+        if screen_type == 'help':
+            line.append(f"  {self.HELP}", style="dim")
+        elif screen_type in self.PROMPTS:
+            prompt = self.PROMPTS[screen_type].format(name=theme.short_name.lower())
+            line.append(f"  {prompt}", style="bold white")
+        else:
+            width = self.theme_manager.dimensions.progress_bar_width
+            if width and total_time:
+                filled = ProgressBar.filled_cells(time_left, total_time, width)
+                progress_color = "cyan" if session_type == SessionType.LONG_BREAK else display_color
+                line.append(" " + "█" * filled + "░" * (width - filled), style=f"bold {progress_color}")
+            if is_paused:
+                line.append(" PAUSED", style="bold yellow")
+            if is_muted:
+                line.append(" 🔇", style="bold dim")
+            if notice:
+                line.append(f" ✗ {notice}", style="bold red")
+        
+        return line
+
+class StackedScreen(Screen):
+    """Every named timer as one status line; the current one is marked and takes dialogs."""
+    
+    def __init__(self, mini_screen: MiniScreen):
+        self.mini_screen = mini_screen
+    
+    def render(self, timers, active: int, screen_type: str = 'main', notice: Optional[str] = None) -> Any:
+        width = max(len(timer.name or "") for timer in timers)
+        lines = []
+        for index, timer in enumerate(timers):
+            current = index == active
+            line = Text("▶ " if current else "  ", style="bold")
+            line.append_text(self.mini_screen.line(
+                screen_type if current else 'main', timer.current_session, timer.time_left,
+                timer.pomodoros_completed, not timer.is_running, timer.is_muted,
+                timer.settings[timer.current_session], notice if current else None,
+                name=(timer.name or "").ljust(width),
+            ))
+            lines.append(line)
+        return Alignment.center_vertical_and_horizontal(Group(*lines))
+
 class ScreenManager:
     """Coordinate screen transitions and overlay management."""
     
-    def __init__(self):
-        self.theme_manager = ThemeManager()
+    def __init__(self, timer_font: Optional[str] = None):
+        self.theme_manager = ThemeManager(timer_font)
         self.main_screen = MainScreen(self.theme_manager)
         self.help_screen = HelpScreen(self.theme_manager)
         self.confirmation_screen = ConfirmationScreen(self.theme_manager)
+        self.mini_screen = MiniScreen(self.theme_manager)
+        self.stacked_screen = StackedScreen(self.mini_screen)
+    
+    def resize(self, width: int, height: int) -> bool:
+        """Switch to the layout for a new terminal size; return whether it changed."""
+        if not self.theme_manager.resize(width, height):
+            return False
+        self.main_screen.invalidate()
+        return True
+    
+    def update_dimensions(self, **changes) -> bool:
+        """Change UI dimensions, dropping cached fragments and the retained tree."""
+        if not self.theme_manager.update_dimensions(**changes):
+            return False
+        self.main_screen.invalidate()
+        return True
     
     def get_screen(self, screen_type: str, **kwargs) -> Any:
         """Get the appropriate screen based on type."""
+        if self.theme_manager.layout == "mini":
+            return self.mini_screen.render(screen_type, **kwargs)
         if screen_type == 'help':
             return self.help_screen.render(**kwargs)
         elif screen_type in ['skip', 'reset', 'quit']:
@@ -1,6 +1,8 @@
 # src/pymodoro/ui/theme.py
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, replace
+from typing import Optional, Tuple
 from pymodoro.timer import SessionType
+from pymodoro.ui.fragments import FragmentCache
 
 # ASCII Art Constants
 TOMATO_ART = """
@@ -72,6 +74,37 @@ class Dimensions:
     dialog_width: int = 60
     help_width: int = 65
     table_min_width: int = 50
+    dialog_padding: Tuple[int, int] = (2, 4)
+    show_art: bool = True
+    glyph_scale: int = 1
+
+# Terminal sizes for the responsive layouts
+MINI_MAX_ROWS = 10          # Fewer rows than this: a single status line
+COMPACT_MAX_ROWS = 28       # Fewer rows (or columns) than this: no art, tight dialogs
+COMPACT_MAX_COLUMNS = 70
+BIG_TIMER_ROWS = 4          # Extra rows the big-digit timer needs over the MM:SS panel
+LARGE_MIN_ROWS = 40         # At least this many rows and columns: wider bar and dialogs
+LARGE_MIN_COLUMNS = 140
+
+def layout_for_size(width: int, height: int, big_timer: bool = False) -> Tuple[str, Dimensions]:
+    """Choose the layout variant ("mini", "compact", "normal" or "large") and its dimensions."""
+    if height < MINI_MAX_ROWS:
+        return "mini", Dimensions(progress_bar_width=max(0, min(20, width - 30)), show_art=False)
+    compact_rows = COMPACT_MAX_ROWS + (BIG_TIMER_ROWS if big_timer else 0)
+    if width < COMPACT_MAX_COLUMNS or height < compact_rows:
+        return "compact", Dimensions(
+            progress_bar_width=max(10, min(40, width - 4)),
+            dialog_width=min(60, width),
+            help_width=min(65, width),
+            table_min_width=min(50, width),
+            dialog_padding=(0, 1),
+            show_art=False
+        )
+    if width >= LARGE_MIN_COLUMNS and height >= LARGE_MIN_ROWS:
+        return "large", Dimensions(
+            progress_bar_width=64, dialog_width=72, help_width=76, table_min_width=70, glyph_scale=2
+        )
+    return "normal", Dimensions()
 
 # Session themes
 THEMES = {
@@ -101,8 +134,38 @@ THEMES = {
 class ThemeManager:
     """Manages theme selection based on timer state."""
     
-    def __init__(self):
+    def __init__(self, timer_font: Optional[str] = None):
         self.dimensions = Dimensions()
+        # Glyph font for a big-digit timer, or None for the MM:SS panel
+        self.timer_font = timer_font
+        self.layout = "normal"
+        self._terminal_size = None
+        # Styled timer and progress bar fragments shared by all screens
+        self.fragments = FragmentCache()
+    
+    def resize(self, width: int, height: int) -> bool:
+        """Adopt the layout for a terminal size; return whether the dimensions changed.
+        
+        The layout is chosen once per size and kept until the next resize.
+        """
+        if (width, height) == self._terminal_size:
+            return False
+        self._terminal_size = (width, height)
+        self.layout, dimensions = layout_for_size(width, height, big_timer=self.timer_font is not None)
+        return self.update_dimensions(**asdict(dimensions))
+    
+    def update_dimensions(self, **changes) -> bool:
+        """Change dimensions in place; return whether anything changed.
+        
+        Components hold a reference to ``dimensions``, so it is updated
+        rather than replaced. Cached fragments are dropped on a change.
+        """
+        if replace(self.dimensions, **changes) == self.dimensions:
+            return False
+        for name, value in changes.items():
+            setattr(self.dimensions, name, value)
+        self.fragments.clear()
+        return True
     
     def get_theme(self, session_type: SessionType, is_paused: bool = False) -> SessionTheme:
         """Get the appropriate theme for current session state."""
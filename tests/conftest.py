@@ -0,0 +1,9 @@
+# tests/conftest.py
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def state_dir(tmp_path, monkeypatch):
+    """Keep every test's logs, caches and journals in its own state directory."""
+    monkeypatch.setenv("XDG_STATE_HOME", str(tmp_path))
+    return tmp_path / "pymodoro"
@@ -0,0 +1,39 @@
+# tests/test_events.py
+from datetime import date, datetime, time
+
+from pymodoro.__main__ import advance_timer
+from pymodoro.clock import VirtualClock
+from pymodoro.events import replay_day
+from pymodoro.persistence import PersistenceWorker
+from pymodoro.storage import load_or_initialize_day_log
+from pymodoro.timer import PomodoroTimer
+
+
+class _Silent:
+    def play_warning(self, muted):
+        pass
+
+    play_work_end = play_break_end = play_warning
+
+
+def test_replayed_day_log_matches_the_live_one():
+    # Sessions are saved to today's log, so simulate today
+    clock = VirtualClock(start=datetime.combine(date.today(), time(1, 0, 0, 250_000)))
+    timer = PomodoroTimer(work_mins=25, warning_mins="5,1", clock=clock)
+    persistence = PersistenceWorker()
+    persistence.record_events(timer)
+    timer.start()
+    stepped_away = False
+    while timer.pomodoros_completed < 5:
+        clock.advance(timer.next_event_in() + 0.3)  # Wake a little late, as the main loop does
+        advance_timer(timer, persistence, _Silent())
+        if timer.pomodoros_completed == 2 and not stepped_away:
+            stepped_away = True
+            timer.pause()
+            clock.advance(420)
+            timer.resume()
+    assert persistence.flush()
+
+    live = load_or_initialize_day_log()
+    assert live.session_count == 5
+    assert replay_day().day_log == live
@@ -0,0 +1,24 @@
+# tests/test_storage.py
+import sys
+from datetime import date, datetime
+
+from pymodoro import storage
+from pymodoro.session_model import DayLog, Session
+
+DAY = date(2025, 6, 2)
+
+
+def _day_log(minutes):
+    return DayLog(log_date=DAY, sessions=[
+        Session(start=datetime(2025, 6, 2, 9, 0), duration_minutes=minutes, notes="task"),
+    ])
+
+
+def test_named_timers_keep_separate_sidecar_caches(monkeypatch):
+    storage.save_day_log(_day_log(25), "writing")
+    storage.save_day_log(_day_log(50), "reading")
+
+    # A cache miss would import yaml to parse the log
+    monkeypatch.setitem(sys.modules, "yaml", None)
+    assert storage.load_or_initialize_day_log(DAY, "writing") == _day_log(25)
+    assert storage.load_or_initialize_day_log(DAY, "reading") == _day_log(50)
@@ -0,0 +1,31 @@
+# tests/test_timer.py
+from pymodoro.clock import VirtualClock
+from pymodoro.timer import PomodoroTimer, SessionType
+
+TICKS = 10 ** 6
+# Seconds between loop wakeups: exact in binary, so any drift shows as inequality,
+# and not a divisor of the session lengths, so boundaries are seen late
+TICK_STEP = 7 / 32
+
+
+def test_deadline_and_time_left_do_not_drift_over_a_million_ticks():
+    clock = VirtualClock()
+    timer = PomodoroTimer(work_mins=25, short_break_mins=5, long_break_mins=15, clock=clock)
+    timer.start()
+    # Ideal end of the current session, by adding up whole session lengths
+    deadline = timer.settings[SessionType.WORK]
+
+    for _ in range(TICKS):
+        clock.advance(TICK_STEP)
+        if timer.tick():
+            deadline += timer.settings[timer.current_session]
+            # The next session ends exactly one session length after the previous deadline
+            assert clock.monotonic() + timer.time_left == deadline
+
+    assert clock.monotonic() == TICKS * TICK_STEP
+    assert timer.time_left == deadline - TICKS * TICK_STEP
+    # 218,750 s is 28 cycles of 4 work sessions, 3 short breaks and a long
+    # break (7,800 s each), then 350 s into the next work session
+    assert timer.pomodoros_completed == 28 * 4
+    assert timer.current_session == SessionType.WORK
+    assert timer.time_left == 1150